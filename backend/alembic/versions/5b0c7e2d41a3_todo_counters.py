@@ -0,0 +1,38 @@
+"""todo counters
+
+Revision ID: 5b0c7e2d41a3
+Revises: 232251ba7db9
+Create Date: 2025-09-08 10:12:31.418022
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b0c7e2d41a3'
+down_revision: Union[str, None] = '232251ba7db9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('todo_counters',
+    sa.Column('owner_id', sa.String(length=36), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('owner_id', 'priority', 'completed')
+    )
+
+    # backfill from the existing todos
+    op.execute(
+        "INSERT INTO todo_counters (owner_id, priority, completed, total) "
+        "SELECT owner_id, priority, completed, COUNT(*) FROM todos GROUP BY owner_id, priority, completed"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('todo_counters')
@@ -0,0 +1,93 @@
+"""todos archive
+
+Revision ID: a7d3e9c15b42
+Revises: f2b7c4d18e60
+Create Date: 2025-09-29 11:20:08.418303
+
+Adds todos.completed_at (the todos already completed count as completed now) and the
+todos_archive table the archiver moves the todos completed long ago to, with the same
+full-text index as todos for the listings reading across both tables.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9c15b42'
+down_revision: Union[str, None] = 'f2b7c4d18e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FTS_DELETE_OLD = (
+    "INSERT INTO todos_archive_fts(todos_archive_fts, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description);"
+)
+FTS_INSERT_NEW = (
+    "INSERT INTO todos_archive_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);"
+)
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE todos_archive_fts USING fts5(title, description, content='todos_archive')",
+    f"CREATE TRIGGER todos_archive_fts_after_insert AFTER INSERT ON todos_archive BEGIN {FTS_INSERT_NEW} END",
+    f"CREATE TRIGGER todos_archive_fts_after_delete AFTER DELETE ON todos_archive BEGIN {FTS_DELETE_OLD} END",
+    "CREATE TRIGGER todos_archive_fts_after_update AFTER UPDATE OF title, description ON todos_archive "
+    f"BEGIN {FTS_DELETE_OLD} {FTS_INSERT_NEW} END",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS todos_archive_fts_after_update",
+    "DROP TRIGGER IF EXISTS todos_archive_fts_after_delete",
+    "DROP TRIGGER IF EXISTS todos_archive_fts_after_insert",
+    "DROP TABLE IF EXISTS todos_archive_fts",
+]
+
+
+def upgrade() -> None:
+    op.add_column('todos', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    # naive UTC, as the app writes it (MySQL CURRENT_TIMESTAMP is in the session time zone)
+    op.execute(
+        sa.text("UPDATE todos SET completed_at = :now WHERE completed = 1").bindparams(
+            now=datetime.now(timezone.utc).replace(tzinfo=None)
+        )
+    )
+    op.create_index('ix_todos_completed_at', 'todos', ['completed_at'], unique=False)
+
+    op.create_table('todos_archive',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.String(length=1024), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('owner_id', sa.String(length=36), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_todos_archive_owner_id_id', 'todos_archive', ['owner_id', 'id'], unique=False)
+
+    dialect_name = op.get_bind().dialect.name
+    if dialect_name == 'mysql':
+        op.create_index(
+            'ix_todos_archive_title_description_fulltext',
+            'todos_archive',
+            ['title', 'description'],
+            mysql_prefix='FULLTEXT',
+        )
+    elif dialect_name == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+
+    op.drop_table('todos_archive')
+    op.drop_index('ix_todos_completed_at', table_name='todos')
+    op.drop_column('todos', 'completed_at')
@@ -0,0 +1,72 @@
+"""todos access pattern indexes
+
+Revision ID: c41f9a7e2b6d
+Revises: 5b0c7e2d41a3
+Create Date: 2025-09-10 09:41:03.127554
+
+Adds composite indexes for the todo listings (owner_id plus the GetTodosQueryFilters
+fields and the sortable columns, with id as the keyset tie breaker) and for the title
+lookups, and drops the indexes duplicating the primary keys.
+
+Optionally (MySQL only) clusters todos by (owner_id, id), so the todos of an owner are
+stored on adjacent pages. Enable it with `alembic -x cluster_todos_by_owner=true upgrade head`
+or DB_CLUSTER_TODOS_BY_OWNER=true.
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f9a7e2b6d'
+down_revision: Union[str, None] = '5b0c7e2d41a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TODOS_INDEXES = {
+    'ix_todos_owner_id_id': ['owner_id', 'id'],
+    'ix_todos_owner_id_priority_id': ['owner_id', 'priority', 'id'],
+    'ix_todos_owner_id_title_id': ['owner_id', 'title', 'id'],
+    'ix_todos_priority_id': ['priority', 'id'],
+    'ix_todos_title_id': ['title', 'id'],
+}
+
+
+def _cluster_todos_by_owner() -> bool:
+    value = context.get_x_argument(as_dictionary=True).get(
+        'cluster_todos_by_owner', os.getenv('DB_CLUSTER_TODOS_BY_OWNER', 'false')
+    )
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def _todos_clustered_by_owner() -> bool:
+    primary_key = sa.inspect(op.get_bind()).get_pk_constraint('todos')
+    return primary_key['constrained_columns'] == ['owner_id', 'id']
+
+
+def upgrade() -> None:
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_index('ix_todos_id', table_name='todos')
+
+    for index_name, columns in TODOS_INDEXES.items():
+        op.create_index(index_name, 'todos', columns, unique=False)
+
+    # InnoDB stores rows in primary key order; other engines have no clustered primary key to change
+    if _cluster_todos_by_owner() and op.get_bind().dialect.name == 'mysql':
+        op.execute(
+            'ALTER TABLE todos DROP PRIMARY KEY, ADD PRIMARY KEY (owner_id, id), ADD UNIQUE INDEX uq_todos_id (id)'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'mysql' and _todos_clustered_by_owner():
+        op.execute('ALTER TABLE todos DROP PRIMARY KEY, ADD PRIMARY KEY (id), DROP INDEX uq_todos_id')
+
+    for index_name in reversed(TODOS_INDEXES):
+        op.drop_index(index_name, table_name='todos')
+
+    op.create_index('ix_todos_id', 'todos', ['id'], unique=False)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
@@ -0,0 +1,64 @@
+"""todos fulltext search
+
+Revision ID: e83d5f1c9a27
+Revises: c41f9a7e2b6d
+Create Date: 2025-09-18 10:12:45.301862
+
+Indexes todos(title, description) for the q search of the todo listings: a FULLTEXT index on MySQL,
+an external content FTS5 table kept in sync by triggers on SQLite (filled from the existing todos).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e83d5f1c9a27'
+down_revision: Union[str, None] = 'c41f9a7e2b6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FTS_DELETE_OLD = (
+    "INSERT INTO todos_fts(todos_fts, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description);"
+)
+FTS_INSERT_NEW = "INSERT INTO todos_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);"
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE todos_fts USING fts5(title, description, content='todos')",
+    f"CREATE TRIGGER todos_fts_after_insert AFTER INSERT ON todos BEGIN {FTS_INSERT_NEW} END",
+    f"CREATE TRIGGER todos_fts_after_delete AFTER DELETE ON todos BEGIN {FTS_DELETE_OLD} END",
+    "CREATE TRIGGER todos_fts_after_update AFTER UPDATE OF title, description ON todos "
+    f"BEGIN {FTS_DELETE_OLD} {FTS_INSERT_NEW} END",
+    "INSERT INTO todos_fts(todos_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS todos_fts_after_update",
+    "DROP TRIGGER IF EXISTS todos_fts_after_delete",
+    "DROP TRIGGER IF EXISTS todos_fts_after_insert",
+    "DROP TABLE IF EXISTS todos_fts",
+]
+
+
+def upgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+
+    if dialect_name == 'mysql':
+        op.create_index(
+            'ix_todos_title_description_fulltext', 'todos', ['title', 'description'], mysql_prefix='FULLTEXT'
+        )
+    elif dialect_name == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+
+    if dialect_name == 'mysql':
+        op.drop_index('ix_todos_title_description_fulltext', table_name='todos')
+    elif dialect_name == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
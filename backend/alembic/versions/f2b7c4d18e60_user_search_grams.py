@@ -0,0 +1,59 @@
+"""user search grams
+
+Revision ID: f2b7c4d18e60
+Revises: e83d5f1c9a27
+Create Date: 2025-09-22 09:03:17.650214
+
+Trigram side index of users.username and users.email for the substring searches of the users
+listing, filled from the existing users.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7c4d18e60'
+down_revision: Union[str, None] = 'e83d5f1c9a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_FIELDS = ('username', 'email')
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _trigrams(text: str) -> set[str]:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def upgrade() -> None:
+    user_search_grams = op.create_table('user_search_grams',
+    sa.Column('field', sa.String(length=16), nullable=False),
+    sa.Column('gram', sa.String(length=3).with_variant(mysql.VARCHAR(3, collation='utf8mb4_bin'), 'mysql'), nullable=False),
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.PrimaryKeyConstraint('field', 'gram', 'user_id')
+    )
+    op.create_index('ix_user_search_grams_user_id', 'user_search_grams', ['user_id'], unique=False)
+
+    # backfill from the existing users
+    users = op.get_bind().execute(sa.text('SELECT id, username, email FROM users'))
+    rows = []
+    for user_id, *values in users:
+        for field, value in zip(SEARCH_FIELDS, values):
+            rows.extend({'field': field, 'gram': gram, 'user_id': user_id} for gram in sorted(_trigrams(value)))
+
+        if len(rows) >= BACKFILL_BATCH_SIZE:
+            op.bulk_insert(user_search_grams, rows)
+            rows = []
+
+    if rows:
+        op.bulk_insert(user_search_grams, rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_search_grams_user_id', table_name='user_search_grams')
+    op.drop_table('user_search_grams')
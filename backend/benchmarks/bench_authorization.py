@@ -0,0 +1,100 @@
+"""Per-request overhead of the Authorization dependency, before and after decoding each token once.
+
+Run from the backend folder:
+
+    python -m benchmarks.bench_authorization [--number 20000]
+
+"before" is the former dependency: HTTPBearer parses the header twice, then the token is decoded
+by is_valid_token and again by get_token_data. "after" is the current one: a single decode on the
+first request, then the verified claims come from the cache until the token expires ("after, cold"
+clears the cache before every request, as for a client sending a new token each time).
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import timedelta
+
+from fastapi import HTTPException, Request, status
+from fastapi.security import HTTPBearer
+
+from todoapp.adapters.app.controllers.common.authorization import Authorization
+from todoapp.domain.commons.date_utils import get_utc_now
+from todoapp.domain.models.user import UserInfo, UserRole
+from todoapp.domain.services.auth.token import JWTToken
+from todoapp.domain.services.auth.verified_tokens_cache import verified_tokens_cache
+
+SECRET = "supersecretpasswordtobechangedwhendeploying"
+
+
+class FormerAuthorization(HTTPBearer):
+    """The Authorization dependency before the single decode."""
+
+    async def __call__(self, request: Request, token_handler: JWTToken) -> UserInfo:
+        credentials = await super().__call__(request)
+        credentials = await super().__call__(request)
+
+        if not token_handler.is_valid_token(credentials.credentials):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+
+        token_data = token_handler.get_token_data(credentials.credentials)
+        if token_data.get("is_refresh_token"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+
+        return UserInfo.from_dict(token_data)
+
+
+def make_request(token: str) -> Request:
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    return Request({"type": "http", "method": "GET", "path": "/todos", "headers": headers})
+
+
+async def measure(authorize, number: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(number):
+        await authorize()
+    return (time.perf_counter() - started_at) / number * 1e6
+
+
+async def run(number: int):
+    token_handler = JWTToken(SECRET)
+    user_info = UserInfo(user_id=str(uuid.uuid4()), email="user1@foo.com", roles=[UserRole.NORMAL])
+    token = token_handler.create_token(get_utc_now() + timedelta(hours=1), user_info.to_dict())
+    request = make_request(token)
+
+    former_authorization = FormerAuthorization()
+    authorization = Authorization([UserRole.ADMIN, UserRole.NORMAL])
+
+    async def before():
+        return await former_authorization(request, token_handler)
+
+    async def after():
+        return await authorization(request, token_handler, None)
+
+    async def after_cold():
+        verified_tokens_cache.clear()
+        return await authorization(request, token_handler, None)
+
+    if await before() != await after():
+        raise SystemExit("the former and the current dependency disagree")
+
+    timings = {}
+    for name, authorize in (("before", before), ("after, cold", after_cold), ("after", after)):
+        timings[name] = min([await measure(authorize, number) for _ in range(3)])
+
+    print(f"{'per request':<16} {'us':>10} {'speedup':>8}")  # noqa: T201
+    for name, microseconds in timings.items():
+        print(f"{name:<16} {microseconds:>10.2f} {timings['before'] / microseconds:>7.1f}x")  # noqa: T201
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="requests per measurement")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.number))
+
+
+if __name__ == "__main__":
+    main()
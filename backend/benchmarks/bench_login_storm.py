@@ -0,0 +1,143 @@
+"""Latency of non-auth endpoints during a login storm, with the password hashing inline or on its process pool.
+
+Run from the backend folder:
+
+    python -m benchmarks.bench_login_storm [--logins 64] [--seconds 10]
+
+Builds the app on a temporary SQLite database, then keeps --logins concurrent clients logging in
+while a single client times GET /bar (no database) and POST /todos/ (one page of todos) back to back.
+"before" hashes on the request threads, as it used to (no limit on concurrent hashes); "after" uses
+the configured process pool (PASSWORD_HASHING_WORKERS, PASSWORD_HASHING_MAX_PENDING), shedding the
+logins it can not queue with 503.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+from todoapp.adapters.database.database import dispose_shared_async_engines, dispose_shared_engines
+from todoapp.domain.services.auth.password_hasher import password_hasher
+
+EMAIL = "bar@foo.com"
+PASSWORD = "barfoo"
+SECRET = "supersecretpasswordtobechangedwhendeploying"
+
+
+def configure_environment(db_path: Path):
+    os.environ.update(
+        {
+            "ENVIRONMENT": "development",  # migrates and seeds the admin user
+            "DB_ENGINE": "sqlite",
+            "DB_NAME": str(db_path),
+            "DB_HOST": "localhost",
+            "DB_PORT": "0",
+            "DB_USER": "user",
+            "DB_PASSWORD": "password",
+            "DB_SLOW_QUERY_THRESHOLD_MS": "3600000",
+            "TODOS_ARCHIVE_ENABLED": "false",
+            # every client logs in from the same address: measure the hashing, not the limits
+            "RATE_LIMIT_ENABLED": "false",
+            "ADMIN_USER_EMAIL": EMAIL,
+            "ADMIN_USER_PASSWORD": PASSWORD,
+            "JWT_SECRET": SECRET,
+            "JWT_TOKEN_EXPIRATION_SECONDS": "3600",
+            "JWT_REFRESH_TOKEN_EXPIRATION_SECONDS": "3600",
+        }
+    )
+
+
+def percentile(latencies: list[float], fraction: float) -> float:
+    return sorted(latencies)[min(int(len(latencies) * fraction), len(latencies) - 1)]
+
+
+async def storm(client: httpx.AsyncClient, stop: asyncio.Event, statuses: Counter):
+    while not stop.is_set():
+        response = await client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+        statuses[response.status_code] += 1
+        if "Retry-After" in response.headers:
+            await asyncio.sleep(float(response.headers["Retry-After"]))
+
+
+async def probe(client: httpx.AsyncClient, token: str, seconds: float) -> dict[str, list[float]]:
+    latencies = {"GET /bar": [], "POST /todos/": []}
+    headers = {"Authorization": f"Bearer {token}"}
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        for name, request in (
+            ("GET /bar", lambda: client.get("/bar")),
+            ("POST /todos/", lambda: client.post("/todos/", headers=headers, json={"items": 20})),
+        ):
+            started_at = time.perf_counter()
+            response = await request()
+            response.raise_for_status()
+            latencies[name].append((time.perf_counter() - started_at) * 1e3)
+    return latencies
+
+
+async def run_scenario(name: str, logins: int, seconds: float):
+    from todoapp.adapters.app.app import create_app  # noqa: PLC0415
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        token = (await client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})).json()["token"]
+
+        stop, statuses = asyncio.Event(), Counter()
+        storm_tasks = [asyncio.create_task(storm(client, stop, statuses)) for _ in range(logins)]
+        latencies = await probe(client, token, seconds)
+        stop.set()
+        await asyncio.gather(*storm_tasks)
+
+    # the async engine connections belong to this event loop
+    await dispose_shared_async_engines()
+
+    logins_summary = ", ".join(f"{count} x {status}" for status, count in sorted(statuses.items()))
+    print(f"{name} ({logins} clients logging in: {logins_summary})")  # noqa: T201
+    for endpoint, values in latencies.items():
+        print(  # noqa: T201
+            f"  {endpoint:<14} p50 {statistics.median(values):>8.1f} ms   p99 {percentile(values, 0.99):>8.1f} ms"
+            f"   ({len(values)} requests)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64, help="concurrent clients logging in")
+    parser.add_argument("--seconds", type=float, default=10.0, help="duration of each scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        configure_environment(Path(tmp_dir) / "todos.db")
+        workers = os.environ.get("PASSWORD_HASHING_WORKERS", "2")
+        max_pending = os.environ.get("PASSWORD_HASHING_MAX_PENDING", "16")
+
+        scenarios = [
+            ("idle", 0, {"PASSWORD_HASHING_WORKERS": workers, "PASSWORD_HASHING_MAX_PENDING": max_pending}),
+            (
+                "before, inline",
+                args.logins,
+                {"PASSWORD_HASHING_WORKERS": "0", "PASSWORD_HASHING_MAX_PENDING": "1000000"},
+            ),
+            (
+                f"after, {workers} workers, {max_pending} pending",
+                args.logins,
+                {"PASSWORD_HASHING_WORKERS": workers, "PASSWORD_HASHING_MAX_PENDING": max_pending},
+            ),
+        ]
+        for name, logins, environment in scenarios:
+            os.environ.update(environment)
+            asyncio.run(run_scenario(name, logins, args.seconds))
+            dispose_shared_engines()
+
+        password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Requests per second on GET /bar and POST /todos/, with the middlewares on BaseHTTPMiddleware or pure ASGI.
+
+Run from the backend folder:
+
+    python -m benchmarks.bench_middlewares [--clients 8] [--seconds 5]
+
+Builds the app on a temporary SQLite database, then keeps --clients concurrent clients calling each endpoint
+for --seconds. "before" registers the former middlewares, wrapped in BaseHTTPMiddleware, with the domain
+exceptions mapped by a middleware catching them; "after" the current pure ASGI ones, with the exception handlers.
+The rate limits are kept on, but too high to reject anything.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from benchmarks.bench_login_storm import EMAIL, PASSWORD, configure_environment
+from todoapp.adapters.app.exception_handlers import ExceptionHandlers
+from todoapp.adapters.app.middlewares.rate_limit_middleware import RateLimitMiddleware
+from todoapp.adapters.database.database import dispose_shared_async_engines, dispose_shared_engines
+from todoapp.domain.exceptions import MessageError
+from todoapp.domain.services.auth.password_hasher import password_hasher
+
+
+def register_former_exceptions_middleware(exception_handlers: ExceptionHandlers, app: FastAPI):
+    async def middleware_process(request: Request, call_next):
+        try:
+            return await call_next(request)
+        except MessageError as e:
+            return await exception_handlers.handle_message_error(request, e)
+
+    app.add_middleware(BaseHTTPMiddleware, middleware_process)
+
+
+def register_former_rate_limit_middleware(rate_limit_middleware: RateLimitMiddleware, app: FastAPI):
+    async def middleware_process(request: Request, call_next):
+        path = request.scope["path"].removeprefix(request.scope.get("root_path", ""))
+        if request.client is not None and rate_limit_middleware.rate_limiter.limits_ip(path):
+            await rate_limit_middleware.rate_limiter.hit_ip(request.client.host)
+
+        return await call_next(request)
+
+    app.add_middleware(BaseHTTPMiddleware, middleware_process)
+
+
+def create_former_app() -> FastAPI:
+    from todoapp.adapters.app.app import create_app  # noqa: PLC0415
+
+    # the rate limits were registered before the exceptions middleware, so they ran inside it
+    with (
+        patch.object(ExceptionHandlers, "register_on_app", lambda _self, _app: None),
+        patch.object(RateLimitMiddleware, "register_on_app", register_former_rate_limit_middleware),
+    ):
+        app = create_app()
+    register_former_exceptions_middleware(ExceptionHandlers(), app)
+    return app
+
+
+async def client_loop(request, deadline: float) -> int:
+    requests = 0
+    while time.monotonic() < deadline:
+        response = await request()
+        response.raise_for_status()
+        requests += 1
+    return requests
+
+
+async def run_scenario(app: FastAPI, clients: int, seconds: float) -> dict[str, float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        token = (await client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        results = {}
+        for endpoint, request in (
+            ("GET /bar", lambda: client.get("/bar")),
+            ("POST /todos/", lambda: client.post("/todos/", headers=headers, json={"items": 20})),
+        ):
+            deadline = time.monotonic() + seconds
+            requests = await asyncio.gather(*(client_loop(request, deadline) for _ in range(clients)))
+            results[endpoint] = sum(requests) / seconds
+
+    # the async engine connections belong to this event loop
+    await dispose_shared_async_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8, help="concurrent clients per endpoint")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration of each measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        configure_environment(Path(tmp_dir) / "todos.db")
+        os.environ.update(
+            {
+                "RATE_LIMIT_ENABLED": "true",
+                "RATE_LIMIT_AUTH_REQUESTS": "1000000000",
+                "RATE_LIMIT_USER_REQUESTS": "1000000000",
+            }
+        )
+        from todoapp.adapters.app.app import create_app  # noqa: PLC0415
+
+        timings = {}
+        for name, app_factory in (("before", create_former_app), ("after", create_app)):
+            timings[name] = asyncio.run(run_scenario(app_factory(), args.clients, args.seconds))
+            dispose_shared_engines()
+
+        password_hasher.shutdown()
+
+    print(f"{'requests/s':<14} {'before':>10} {'after':>10} {'speedup':>8}")  # noqa: T201
+    for endpoint in timings["before"]:
+        before, after = timings["before"][endpoint], timings["after"][endpoint]
+        print(f"{endpoint:<14} {before:>10.1f} {after:>10.1f} {after / before:>7.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Login latency for each password hashing scheme and cost.
+
+Run from the backend folder:
+
+    python -m benchmarks.bench_password_hashing [--logins 50]
+
+Builds the app on a temporary SQLite database once per policy (PASSWORD_HASH_SCHEME, PASSWORD_BCRYPT_ROUNDS,
+PASSWORD_ARGON2_*), then times --logins sequential POST /auth/login of the seeded admin. The admin keeps the
+database between policies, so the first login of each one (but the first) finds a hash made with the previous
+policy and rehashes it; it is reported on its own, as it also waits for the hashing workers of the new policy.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.bench_login_storm import EMAIL, PASSWORD, configure_environment, percentile
+from todoapp.adapters.database.database import dispose_shared_async_engines, dispose_shared_engines
+from todoapp.domain.services.auth.password_hasher import password_hasher
+
+POLICIES = [
+    ("bcrypt, 10 rounds", {"PASSWORD_HASH_SCHEME": "bcrypt", "PASSWORD_BCRYPT_ROUNDS": "10"}),
+    ("bcrypt, 12 rounds", {"PASSWORD_HASH_SCHEME": "bcrypt", "PASSWORD_BCRYPT_ROUNDS": "12"}),
+    ("bcrypt, 13 rounds", {"PASSWORD_HASH_SCHEME": "bcrypt", "PASSWORD_BCRYPT_ROUNDS": "13"}),
+    (
+        "argon2id, t=2 m=19 MiB",
+        {"PASSWORD_HASH_SCHEME": "argon2", "PASSWORD_ARGON2_TIME_COST": "2", "PASSWORD_ARGON2_MEMORY_COST": "19456"},
+    ),
+    (
+        "argon2id, t=1 m=46 MiB",
+        {"PASSWORD_HASH_SCHEME": "argon2", "PASSWORD_ARGON2_TIME_COST": "1", "PASSWORD_ARGON2_MEMORY_COST": "47104"},
+    ),
+    (
+        "argon2id, t=3 m=64 MiB",
+        {"PASSWORD_HASH_SCHEME": "argon2", "PASSWORD_ARGON2_TIME_COST": "3", "PASSWORD_ARGON2_MEMORY_COST": "65536"},
+    ),
+]
+
+
+async def login(client: httpx.AsyncClient) -> float:
+    started_at = time.perf_counter()
+    response = await client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    response.raise_for_status()
+    return (time.perf_counter() - started_at) * 1e3
+
+
+async def run_policy(name: str, logins: int):
+    from todoapp.adapters.app.app import create_app  # noqa: PLC0415
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first_login = await login(client)
+        latencies = [await login(client) for _ in range(logins)]
+
+    # the async engine connections belong to this event loop
+    await dispose_shared_async_engines()
+
+    print(  # noqa: T201
+        f"{name:<24} p50 {statistics.median(latencies):>8.1f} ms   p99 {percentile(latencies, 0.99):>8.1f} ms"
+        f"   (first login, rehashing: {first_login:>8.1f} ms)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=50, help="logins timed per policy")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        configure_environment(Path(tmp_dir) / "todos.db")
+
+        for name, environment in POLICIES:
+            os.environ.update(environment)
+            asyncio.run(run_policy(name, args.logins))
+            dispose_shared_engines()
+
+        password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Per-call Python overhead of the repository hot paths, before and after caching their statements.
+
+Run from the backend folder:
+
+    python -m benchmarks.bench_repository_statements [--number 20000]
+
+"before" rebuilds the statement (and walks __orig_bases__ for the ORM class) on every call, as the
+repositories used to; "after" is what they do now. Statement rows only build the statement and its
+cache key, the part SQLAlchemy runs in Python before reaching its compiled cache; repository rows
+run the whole lookup against a temporary SQLite database.
+"""
+
+import argparse
+import tempfile
+import timeit
+import uuid
+from pathlib import Path
+from typing import get_args, get_origin
+
+from sqlalchemy import select
+
+from todoapp.adapters.database.database import DatabaseConnector, dispose_shared_engines
+from todoapp.adapters.database.models import BaseORM, TodosORM, UsersORM
+from todoapp.adapters.database.repositories.repository_base import RepositoryQueriesBase
+from todoapp.adapters.database.repositories.todos_repository import _todo_by_title_statement
+from todoapp.adapters.database.repositories.users_repository import _user_by_email_statement
+from todoapp.domain.models.todo import Todo
+from todoapp.domain.models.user import User, UserRole
+from todoapp.domain.repositories.data_context import DataContext
+
+OWNER_ID = str(uuid.uuid4())
+EMAIL = "user1@foo.com"
+TITLE = "title 42"
+
+
+def resolve_orm_cls_per_call(repository: RepositoryQueriesBase) -> type[BaseORM]:
+    """The former orm_cls property, run on every access."""
+    for base in repository.__class__.__orig_bases__:
+        origin = get_origin(base)
+        if isinstance(origin, type) and issubclass(origin, RepositoryQueriesBase):
+            return get_args(base)[0]
+    raise TypeError
+
+
+def make_data_context(db_path: Path) -> DataContext:
+    data_context = DataContext(database_connector=DatabaseConnector(db_url=f"sqlite:///{db_path}"))
+    BaseORM.metadata.create_all(bind=data_context.database_connector.engine)
+
+    data_context.users_repo.add(
+        User(id=OWNER_ID, username="User 1", email=EMAIL, password="password", role=UserRole.NORMAL, is_active=True)
+    )
+    data_context.todos_repo.add_many(
+        [Todo(title=f"title {i}", description="description", priority=5, owner_id=OWNER_ID) for i in range(100)]
+    )
+    return data_context
+
+
+def get_by_title_rebuilding_statement(data_context: DataContext) -> Todo | None:
+    repository = data_context.todos_repo
+    with repository.database_connector.session_scope(read_only=True) as session:
+        orm_cls = resolve_orm_cls_per_call(repository)
+        todo_orm = session.execute(select(orm_cls).where(orm_cls.title == TITLE)).scalar_one_or_none()
+        return repository._orm_to_domain_model(todo_orm) if todo_orm else None
+
+
+def report(name: str, before, after, number: int):
+    before_us = min(timeit.repeat(before, number=number, repeat=5)) / number * 1e6
+    after_us = min(timeit.repeat(after, number=number, repeat=5)) / number * 1e6
+    print(f"{name:<32} {before_us:>10.2f} us {after_us:>10.2f} us {before_us / after_us:>7.1f}x")  # noqa: T201
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_context = make_data_context(Path(tmp_dir) / "todos.db")
+        repository = data_context.todos_repo
+        lookups = max(args.number // 10, 1)
+
+        print(f"{'per call':<32} {'before':>13} {'after':>13} {'speedup':>8}")  # noqa: T201
+        report("orm_cls", lambda: resolve_orm_cls_per_call(repository), lambda: repository.orm_cls, args.number)
+        report(
+            "get_by_title statement",
+            lambda: select(TodosORM).where(TodosORM.title == TITLE)._generate_cache_key(),
+            lambda: _todo_by_title_statement(TITLE)._generate_cache_key(),
+            args.number,
+        )
+        report(
+            "get_by_email statement",
+            lambda: select(UsersORM).where(UsersORM.email == EMAIL)._generate_cache_key(),
+            lambda: _user_by_email_statement(EMAIL)._generate_cache_key(),
+            args.number,
+        )
+        report(
+            "get_by_title (SQLite)",
+            lambda: get_by_title_rebuilding_statement(data_context),
+            lambda: repository.get_by_title(TITLE),
+            lookups,
+        )
+
+        dispose_shared_engines()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Users substring search: the former full scan predicate against the trigram side index.
+
+Run from the backend folder:
+
+    python -m benchmarks.bench_user_search [--users 1000000] [--number 20]
+
+Fills a temporary SQLite database with random users (and their user_search_grams rows), then times
+the first page (20 users) and the total of username and email searches, "before" filtering with
+lower(column) LIKE '%value%' only, "after" with the current users filters predicate.
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import timeit
+import uuid
+from pathlib import Path
+
+from sqlalchemy import and_, func, insert, select
+
+from todoapp.adapters.database.database import DatabaseConnector, dispose_shared_engines
+from todoapp.adapters.database.models import BaseORM, UserSearchGramsORM, UsersORM
+from todoapp.adapters.database.repositories.users_repository import UserSearchGramsMixin
+from todoapp.adapters.database.slow_queries import SlowQuerySettings
+from todoapp.adapters.database.trigrams import trigrams
+from todoapp.domain.services.users.queries.get_users import GetUsersQueryFilters
+
+DOMAINS = ["gmail.com", "outlook.com", "yahoo.es", "proton.me", "foo.com"]
+INSERT_BATCH_SIZE = 10000
+PAGE_ITEMS = 20
+
+
+def random_username(rng: random.Random) -> str:
+    syllables = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 3))) for _ in range(rng.randint(2, 4))]
+    return f"{''.join(syllables)}{rng.randint(0, 9999)}"
+
+
+def fill_users(database_connector: DatabaseConnector, users: int, rng: random.Random) -> list[str]:
+    usernames = []
+    with database_connector.engine.begin() as connection:
+        users_rows, grams_rows = [], []
+        for _ in range(users):
+            user_id, username = str(uuid.uuid4()), random_username(rng)
+            values = {"username": username, "email": f"{username}@{rng.choice(DOMAINS)}"}
+            users_rows.append({"id": user_id, "password": "password", "role": 0, "is_active": True, **values})
+            grams_rows.extend(
+                {"field": field, "gram": gram, "user_id": user_id}
+                for field in UserSearchGramsMixin.SEARCH_FIELDS
+                for gram in trigrams(values[field])
+            )
+            usernames.append(username)
+
+            if len(users_rows) == INSERT_BATCH_SIZE:
+                connection.execute(insert(UsersORM), users_rows)
+                connection.execute(insert(UserSearchGramsORM), grams_rows)
+                users_rows, grams_rows = [], []
+
+        if users_rows:
+            connection.execute(insert(UsersORM), users_rows)
+            connection.execute(insert(UserSearchGramsORM), grams_rows)
+    return usernames
+
+
+def scan_predicate(filters: GetUsersQueryFilters):
+    """The users filters predicate before the trigram index."""
+    conditions = []
+    if filters.username is not None:
+        conditions.append(func.lower(UsersORM.username).ilike(f"%{filters.username.lower()}%"))
+    if filters.email is not None:
+        conditions.append(func.lower(UsersORM.email).ilike(f"%{filters.email.lower()}%"))
+    return and_(*conditions)
+
+
+def search(database_connector: DatabaseConnector, predicate) -> tuple[int, int]:
+    with database_connector.engine.connect() as connection:
+        page = connection.execute(select(UsersORM.id).where(predicate).order_by(UsersORM.id).limit(PAGE_ITEMS)).all()
+        total = connection.execute(select(func.count()).select_from(UsersORM).where(predicate)).scalar_one()
+    return len(page), total
+
+
+def report(name: str, before, after, number: int):
+    before_ms = min(timeit.repeat(before, number=number, repeat=3)) / number * 1e3
+    after_ms = min(timeit.repeat(after, number=number, repeat=3)) / number * 1e3
+    print(f"{name:<36} {before_ms:>10.2f} ms {after_ms:>10.2f} ms {before_ms / after_ms:>7.1f}x")  # noqa: T201
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1_000_000, help="users in the database")
+    parser.add_argument("--number", type=int, default=20, help="searches per measurement")
+    args = parser.parse_args()
+
+    rng = random.Random(42)  # noqa: S311
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # the bulk load statements would fill the slow query log
+        database_connector = DatabaseConnector(
+            db_url=f"sqlite:///{Path(tmp_dir) / 'users.db'}",
+            slow_query_settings=SlowQuerySettings(threshold_seconds=3600),
+        )
+        BaseORM.metadata.create_all(bind=database_connector.engine)
+        usernames = fill_users(database_connector, args.users, rng)
+        username = rng.choice(usernames)
+
+        searches = {
+            f"username '{username[:3]}' (3 chars)": GetUsersQueryFilters(username=username[:3]),
+            f"username '{username[1:7]}' (6 chars)": GetUsersQueryFilters(username=username[1:7]),
+            f"email '{username}@'": GetUsersQueryFilters(email=f"{username}@"),
+            "username 'zzzzzz' (no match)": GetUsersQueryFilters(username="zzzzzz"),
+        }
+
+        print(f"{args.users} users, {'per search':<24} {'before':>13} {'after':>13} {'speedup':>8}")  # noqa: T201
+        for name, filters in searches.items():
+            if search(database_connector, scan_predicate(filters)) != search(
+                database_connector, filters.get_predicate()
+            ):
+                raise SystemExit(f"{name}: the trigram index and the scan disagree")
+            report(
+                name,
+                lambda filters=filters: search(database_connector, scan_predicate(filters)),
+                lambda filters=filters: search(database_connector, filters.get_predicate()),
+                args.number,
+            )
+
+        dispose_shared_engines()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,23 @@ import uuid
 from unittest.mock import patch
 
 import pytest
-
-from todoapp.adapters.app.dependencies import get_config, get_database_connector, get_todos_service, get_users_service
+from sqlalchemy import text
+
+from todoapp.adapters.app.dependencies import (
+    get_async_database_connector,
+    get_config,
+    get_database_connector,
+    get_todos_service,
+    get_users_service,
+)
 from todoapp.adapters.database.database import DatabaseConnector
 from todoapp.adapters.database.models import BaseORM
 from todoapp.config import Config
 from todoapp.domain.models.todo import Todo
 from todoapp.domain.models.user import User, UserRole
-from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.repositories.data_context import AsyncDataContext, DataContext
 from todoapp.domain.services.todos.commands.add_todo import AddTodoCommand
+from todoapp.domain.services.todos.todo_stats_cache import todo_stats_cache
 from todoapp.domain.services.todos.todos_service import TodosService
 from todoapp.domain.services.users.commands.add_user import AddUserCommand
 from todoapp.domain.services.users.users_service import UsersService
@@ -25,10 +33,14 @@ def config():
 def db(config: Config) -> DatabaseConnector:
     database_connector = get_database_connector(config=config)
 
+    # the schema is built by the migrations only, so tables added by newer revisions are never created twice
     BaseORM.metadata.drop_all(bind=database_connector.engine)
-    BaseORM.metadata.create_all(bind=database_connector.engine)
+    with database_connector.engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
 
     database_connector.migrate()
+    # cached stats would outlive the database they were computed from
+    todo_stats_cache.clear()
 
     return database_connector
 
@@ -39,13 +51,18 @@ def datacontext(db) -> DataContext:
 
 
 @pytest.fixture(scope="function")
-def users_service(datacontext) -> UsersService:
-    return get_users_service(data_context=datacontext)
+def async_datacontext(config: Config) -> AsyncDataContext:
+    return AsyncDataContext(database_connector=get_async_database_connector(config=config))
+
+
+@pytest.fixture(scope="function")
+def users_service(datacontext, async_datacontext) -> UsersService:
+    return get_users_service(data_context=datacontext, async_data_context=async_datacontext)
 
 
 @pytest.fixture(scope="function")
-def todos_service(datacontext) -> TodosService:
-    return get_todos_service(data_context=datacontext)
+def todos_service(datacontext, async_datacontext) -> TodosService:
+    return get_todos_service(data_context=datacontext, async_data_context=async_datacontext)
 
 
 @pytest.fixture
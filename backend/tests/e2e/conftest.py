@@ -19,8 +19,8 @@ def client() -> Generator[TestClient]:
     from todoapp.adapters.app.app import create_app  # noqa: PLC0415
 
     app = create_app()
-    client = TestClient(app)
-    yield client
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(scope="function")
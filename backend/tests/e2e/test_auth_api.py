@@ -7,7 +7,10 @@ from unittest.mock import patch
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from todoapp.adapters.app.rate_limiter import RateLimit
 from todoapp.domain.commons.date_utils import to_iso_format_with_z
+from todoapp.domain.exceptions import ServiceUnavailableError
+from todoapp.domain.services.auth.password_hasher import password_hasher
 from todoapp.domain.services.auth.token import JWTToken
 from todoapp.domain.services.users.users_dtos import UserDTO
 
@@ -48,6 +51,45 @@ class TestLogin:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.json()["detail"]["msg"] == "Invalid credentials. Please check your username and password."
 
+    def test_shed_when_password_hashing_is_saturated(self, user_admin_mock, client: Generator[TestClient]):
+        fake_user, fake_password = user_admin_mock
+        with patch(
+            "todoapp.domain.services.auth.auth.password_hasher.verify_and_update",
+            side_effect=ServiceUnavailableError("Too many password checks in progress, please retry later."),
+        ):
+            response = client.post("/auth/login", json={"email": fake_user.email, "password": fake_password})
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "1"
+
+    def test_rate_limited_per_ip(self, user_admin_mock, client: Generator[TestClient]):
+        fake_user, fake_password = user_admin_mock
+        client.app.state.rate_limiter.ip_limit = RateLimit(requests=2)
+
+        response = client.post("/auth/login", json={"email": fake_user.email, "password": "sdasd"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.post("/auth/login", json={"email": fake_user.email, "password": fake_password})
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.post("/auth/login", json={"email": fake_user.email, "password": fake_password})
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) >= 1
+        # the other routes are limited per user only
+        assert client.get("/bar").status_code == status.HTTP_200_OK
+
+    def test_hashing_workers_stop_with_the_app(self, user_admin_mock):
+        from todoapp.adapters.app.app import create_app  # noqa: PLC0415
+
+        fake_user, fake_password = user_admin_mock
+        with TestClient(create_app()) as client:
+            response = client.post("/auth/login", json={"email": fake_user.email, "password": fake_password})
+            assert response.status_code == status.HTTP_200_OK
+            workers = list(password_hasher._pool._processes.values())
+            assert workers
+
+        assert password_hasher._pool is None
+        assert not any(worker.is_alive() for worker in workers)
+
 
 class TestRefreshToken:
     def test_success_valid_token_when_valid_refresh_token(self, user_admin_mock, client: Generator[TestClient]):
@@ -0,0 +1,49 @@
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from todoapp.adapters.app.controllers.database.database_controller import PoolStatisticsAPI, SlowQueryAPI
+from todoapp.adapters.database.slow_queries import SlowQuery, slow_query_log
+
+
+class TestPoolStatisticsAPI:
+    def test_admin_gets_pool_statistics(self, authorization_admin_header, client: TestClient):
+        response = client.get("/database/pool", headers=authorization_admin_header)
+        assert response.status_code == status.HTTP_200_OK
+
+        pool_statistics = PoolStatisticsAPI(**response.json())
+        assert pool_statistics.checkouts > 0
+
+    def test_forbidden_for_normal_user(self, authorization_normal_header, client: TestClient):
+        response = client.get("/database/pool", headers=authorization_normal_header)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.fixture
+def recorded_slow_query():
+    slow_query = SlowQuery(
+        statement="SELECT * FROM todos WHERE title = ?",
+        parameters=["?"],
+        duration_seconds=3600,
+        recorded_at=datetime.now(UTC),
+    )
+    slow_query_log.record(slow_query)
+    yield slow_query
+    slow_query_log.clear()
+
+
+class TestSlowQueriesAPI:
+    def test_admin_gets_slow_queries(self, authorization_admin_header, recorded_slow_query, client: TestClient):
+        response = client.get("/database/slow-queries", headers=authorization_admin_header)
+        assert response.status_code == status.HTTP_200_OK
+
+        slow_queries = [SlowQueryAPI(**slow_query) for slow_query in response.json()]
+        assert slow_queries[0].statement == recorded_slow_query.statement
+        assert slow_queries[0].parameters == ["?"]
+        assert slow_queries[0].duration_seconds == recorded_slow_query.duration_seconds
+
+    def test_forbidden_for_normal_user(self, authorization_normal_header, client: TestClient):
+        response = client.get("/database/slow-queries", headers=authorization_normal_header)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
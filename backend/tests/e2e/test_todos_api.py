@@ -1,14 +1,26 @@
+import csv
+import io
+import json
 import uuid
+from datetime import UTC, datetime
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
 from todoapp.adapters.app.controllers.common.pagination_api import PaginationResultAPI
-from todoapp.adapters.app.controllers.todos.todo_result_api import TodoResultAPI
+from todoapp.adapters.app.controllers.todos.todo_result_api import (
+    AddTodosResultAPI,
+    ImportTodosResultAPI,
+    TodoResultAPI,
+)
+from todoapp.adapters.app.rate_limiter import RateLimit
 from todoapp.domain.models.todo import Todo
 from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.todos.commands.archive_todos import ArchiveTodosCommand
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
 from todoapp.domain.services.todos.todos_dtos import TodoDTO
+from todoapp.domain.services.todos.todos_service import TodosService
 from todoapp.domain.services.users.users_dtos import UserDTO
 
 
@@ -57,6 +69,280 @@ class TestAddTodoAPI:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+class TestAddTodosAPI:
+    def test_creates_all_todos(self, authorization_admin_header, datacontext: DataContext, client: TestClient):
+        todos_request_body = {
+            "todos": [{"title": f"title {i}", "description": f"description {i}", "priority": 5} for i in range(3)]
+        }
+        response = client.post("/todos/bulk", headers=authorization_admin_header, json=todos_request_body)
+        assert response.status_code == status.HTTP_200_OK
+
+        result = AddTodosResultAPI(**response.json())
+        assert [todo.title for todo in result.created] == ["title 0", "title 1", "title 2"]
+        assert result.failed == []
+        assert result.rows_per_second > 0
+
+        assert datacontext.todos_repo.count() == 3
+        for todo in result.created:
+            assert datacontext.todos_repo.get_by_id(id=str(todo.id)).title == todo.title
+
+    def test_reports_conflicts_per_item(
+        self, authorization_admin_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        todos_request_body = {
+            "todos": [
+                {"title": "new title", "description": "description", "priority": 5},
+                {"title": todos_data[0].title, "description": "description", "priority": 5},
+                {"title": "new title", "description": "description", "priority": 5},
+            ]
+        }
+        response = client.post("/todos/bulk", headers=authorization_admin_header, json=todos_request_body)
+        assert response.status_code == status.HTTP_200_OK
+
+        result = AddTodosResultAPI(**response.json())
+        assert [todo.title for todo in result.created] == ["new title"]
+        assert [(failure.index, failure.title) for failure in result.failed] == [
+            (1, todos_data[0].title),
+            (2, "new title"),
+        ]
+        assert datacontext.todos_repo.count() == len(todos_data) + 1
+
+    @pytest.mark.parametrize(
+        "todos",
+        [
+            [],
+            [{"title": "fa", "description": "fake description", "priority": 5}],
+            [{"title": "fake title", "description": "fake description", "priority": 0}],
+        ],
+    )
+    def test_add_validation_error(self, todos: list[dict], authorization_admin_header, client: TestClient):
+        response = client.post("/todos/bulk", headers=authorization_admin_header, json={"todos": todos})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestImportTodosAPI:
+    def test_imports_ndjson_reporting_errors_per_line(
+        self, authorization_admin_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        lines = [
+            json.dumps({"title": "new title 1", "description": "description", "priority": 5}),
+            "{not json",
+            json.dumps({"title": "fa", "description": "description", "priority": 5}),
+            "",
+            json.dumps({"title": todos_data[0].title, "description": "description", "priority": 5}),
+            json.dumps({"title": "new title 2", "description": "description"}),
+            json.dumps({"title": "new title 3", "description": "description", "priority": 1}),
+        ]
+        response = client.post(
+            "/todos/import",
+            headers={**authorization_admin_header, "Content-Type": "application/x-ndjson"},
+            content="\n".join(lines),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        result = ImportTodosResultAPI(**response.json())
+        assert (result.lines, result.imported, result.failed) == (6, 2, 4)
+        assert [error.line for error in result.errors] == [2, 3, 6, 5]
+        assert datacontext.todos_repo.get_by_title("new title 3").priority == 1
+        assert datacontext.todos_repo.count() == len(todos_data) + 2
+
+    def test_imports_csv_in_chunks(self, authorization_admin_header, datacontext: DataContext, client: TestClient):
+        rows = "".join(f'"title {i}","descripción, {i}",{1 + i % 10}\n' for i in range(1200))
+        body = f"title,description,priority\n{rows}".encode()
+        # chunk boundaries fall anywhere, even inside a line or a multi-byte character
+        chunks = [body[start : start + 1001] for start in range(0, len(body), 1001)]
+
+        response = client.post(
+            "/todos/import",
+            headers={**authorization_admin_header, "Content-Type": "text/csv"},
+            params={"format": "csv"},
+            content=iter(chunks),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        result = ImportTodosResultAPI(**response.json())
+        assert (result.lines, result.imported, result.failed) == (1200, 1200, 0)
+        assert datacontext.todos_repo.get_by_title("title 1199").description == "descripción, 1199"
+        assert datacontext.todos_repo.count() == 1200
+
+    def test_reports_wrongly_typed_fields_per_line(
+        self, authorization_admin_header, datacontext: DataContext, client: TestClient
+    ):
+        lines = [
+            json.dumps({"title": ["a", "list"], "description": "description", "priority": 5}),
+            json.dumps({"title": "new title 1", "description": {"a": "dict"}, "priority": 5}),
+            json.dumps({"title": "new title 2", "description": "description", "priority": 2.7}),
+            json.dumps({"title": "new title 3", "description": "description", "priority": True}),
+            json.dumps({"title": "t" * 256, "description": "description", "priority": 5}),
+            json.dumps({"title": "new title 4", "description": "description", "priority": "4"}),
+        ]
+        response = client.post(
+            "/todos/import",
+            headers={**authorization_admin_header, "Content-Type": "application/x-ndjson"},
+            content="\n".join(lines),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        result = ImportTodosResultAPI(**response.json())
+        assert (result.lines, result.imported, result.failed) == (6, 1, 5)
+        assert [(error.line, error.message) for error in result.errors] == [
+            (1, "Invalid fields: title"),
+            (2, "Invalid fields: description"),
+            (3, "Invalid fields: priority"),
+            (4, "Invalid fields: priority"),
+            (5, "Invalid fields: title"),
+        ]
+        assert datacontext.todos_repo.get_by_title("new title 4").priority == 4
+
+    def test_stops_at_invalid_utf8_keeping_the_todos_before(
+        self, authorization_admin_header, datacontext: DataContext, client: TestClient
+    ):
+        rows = "".join(f'"title {i}","description",1\n' for i in range(600))
+        chunks = [f"title,description,priority\n{rows}".encode(), b'"title \xff","description",1\n"title x","d",1\n']
+
+        response = client.post(
+            "/todos/import",
+            headers={**authorization_admin_header, "Content-Type": "text/csv"},
+            params={"format": "csv"},
+            content=iter(chunks),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        result = ImportTodosResultAPI(**response.json())
+        assert (result.lines, result.imported, result.failed) == (601, 600, 1)
+        assert [(error.line, error.message) for error in result.errors] == [(602, "Invalid UTF-8")]
+        assert datacontext.todos_repo.count() == 600
+
+
+class TestEditTodosAPI:
+    def test_edits_todos_by_ids(
+        self, authorization_admin_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        ids = [todos_data[0].id, todos_data[1].id]
+        response = client.patch(
+            "/todos/bulk", headers=authorization_admin_header, json={"ids": ids, "completed": True, "priority": 1}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 2}
+
+        for todo in todos_data:
+            stored_todo = datacontext.todos_repo.get_by_id(id=todo.id)
+            assert stored_todo.completed is (todo.id in ids)
+            assert stored_todo.priority == (1 if todo.id in ids else todo.priority)
+
+        assert datacontext.todos_repo.count(filters=GetTodosQueryFilters(priority=1)) == 2
+
+    def test_edits_todos_by_filters(
+        self, authorization_admin_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        owner_id = todos_data[0].owner_id
+        response = client.patch(
+            "/todos/bulk",
+            headers=authorization_admin_header,
+            json={"filters": {"owner_id": owner_id}, "description": "bulk description"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": len([todo for todo in todos_data if todo.owner_id == owner_id])}
+
+        for todo in todos_data:
+            stored_todo = datacontext.todos_repo.get_by_id(id=todo.id)
+            assert (stored_todo.description == "bulk description") is (todo.owner_id == owner_id)
+
+    def test_normal_user_only_edits_own_todos(
+        self,
+        authorization_normal_header,
+        user_normal_mock,
+        todos_data: list[Todo],
+        datacontext: DataContext,
+        client: TestClient,
+    ):
+        user, _ = user_normal_mock
+        own_todo = Todo(title="own title", description="own description", priority=5, owner_id=str(user.id))
+        datacontext.todos_repo.add(own_todo)
+
+        response = client.patch(
+            "/todos/bulk",
+            headers=authorization_normal_header,
+            json={"ids": [own_todo.id, todos_data[0].id], "completed": True},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 1}
+        assert datacontext.todos_repo.get_by_id(id=own_todo.id).completed is True
+        assert datacontext.todos_repo.get_by_id(id=todos_data[0].id).completed is False
+
+    @pytest.mark.parametrize(
+        "body, expected_status",
+        [
+            ({"completed": True}, status.HTTP_400_BAD_REQUEST),
+            ({"ids": [str(uuid.uuid4())]}, status.HTTP_400_BAD_REQUEST),
+            ({"ids": [], "completed": True}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+            ({"filters": {}, "completed": True}, status.HTTP_400_BAD_REQUEST),
+            ({"ids": [str(uuid.uuid4())], "priority": 11}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        ],
+    )
+    def test_edit_validation_error(
+        self, body: dict, expected_status: int, authorization_admin_header, client: TestClient
+    ):
+        response = client.patch("/todos/bulk", headers=authorization_admin_header, json=body)
+        assert response.status_code == expected_status
+
+
+class TestDeleteTodosAPI:
+    def test_deletes_todos_by_ids(
+        self, authorization_admin_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        ids = [todos_data[0].id, todos_data[1].id, str(uuid.uuid4())]
+        response = client.request("DELETE", "/todos/bulk", headers=authorization_admin_header, json={"ids": ids})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 2}
+
+        assert datacontext.todos_repo.get_by_id(id=todos_data[0].id) is None
+        assert datacontext.todos_repo.count() == len(todos_data) - 2
+
+    def test_deletes_todos_by_filters(
+        self, authorization_admin_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        priority = todos_data[0].priority
+        response = client.request(
+            "DELETE", "/todos/bulk", headers=authorization_admin_header, json={"filters": {"priority": priority}}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": len([todo for todo in todos_data if todo.priority == priority])}
+        assert datacontext.todos_repo.count(filters=GetTodosQueryFilters(priority=priority)) == 0
+
+    def test_normal_user_only_deletes_own_todos(
+        self, authorization_normal_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        priority = todos_data[0].priority
+        response = client.request(
+            "DELETE", "/todos/bulk", headers=authorization_normal_header, json={"filters": {"priority": priority}}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 0}
+        assert datacontext.todos_repo.count() == len(todos_data)
+
+    @pytest.mark.parametrize(
+        "body, expected_status",
+        [
+            ({}, status.HTTP_400_BAD_REQUEST),
+            ({"filters": {}}, status.HTTP_400_BAD_REQUEST),
+            ({"ids": []}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        ],
+    )
+    def test_delete_without_ids_nor_filters(
+        self,
+        body: dict,
+        expected_status: int,
+        authorization_admin_header,
+        todos_data: list[Todo],
+        datacontext: DataContext,
+        client: TestClient,
+    ):
+        response = client.request("DELETE", "/todos/bulk", headers=authorization_admin_header, json=body)
+        assert response.status_code == expected_status
+        assert datacontext.todos_repo.count() == len(todos_data)
+
+
 class TestEditTodoAPI:
     @pytest.mark.parametrize(
         "description, priority, completed",
@@ -119,6 +405,56 @@ class TestEditTodoAPI:
         response = client.put(f"/todo/{existing_todo.id}", headers=authorization_admin_header, json=todo_request_body)
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+    def test_edit_not_found(self, authorization_admin_header, todos_data: list[Todo], client: TestClient):  # noqa: ARG002
+        todo_request_body = {"description": "new description", "priority": 2, "completed": True}
+        response = client.put(f"/todo/{uuid.uuid4()}", headers=authorization_admin_header, json=todo_request_body)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_edit_not_found_when_other_user_owned_todo(
+        self, authorization_normal_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        other_todo = todos_data[1]
+        todo_request_body = {"description": "new description", "priority": 2, "completed": True}
+        response = client.put(f"/todo/{other_todo.id}", headers=authorization_normal_header, json=todo_request_body)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert datacontext.todos_repo.get_by_id(id=other_todo.id) == other_todo
+
+
+class TestPatchTodoAPI:
+    def test_patch_only_changes_given_fields(
+        self, authorization_admin_header, datacontext: DataContext, todos_data: list[Todo], client: TestClient
+    ):
+        existing_todo = todos_data[1]
+        response = client.patch(
+            f"/todo/{existing_todo.id}", headers=authorization_admin_header, json={"completed": True}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        todo: Todo = datacontext.todos_repo.get_by_id(id=existing_todo.id)
+        assert todo.completed is True
+        assert todo.description == existing_todo.description
+        assert todo.priority == existing_todo.priority
+        assert TodoResultAPI(**response.json()) == TodoResultAPI.from_domain(todo)
+
+    @pytest.mark.parametrize("todo_request_body", [{"description": "fa"}, {"priority": 11}, {"completed": "jasdkds"}])
+    def test_patch_validation_error(
+        self, todo_request_body: dict, authorization_admin_header, todos_data: list[Todo], client: TestClient
+    ):
+        response = client.patch(f"/todo/{todos_data[1].id}", headers=authorization_admin_header, json=todo_request_body)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_patch_without_fields(self, authorization_admin_header, todos_data: list[Todo], client: TestClient):
+        response = client.patch(f"/todo/{todos_data[1].id}", headers=authorization_admin_header, json={})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_patch_not_found_when_other_user_owned_todo(
+        self, authorization_normal_header, todos_data: list[Todo], client: TestClient
+    ):
+        response = client.patch(
+            f"/todo/{todos_data[1].id}", headers=authorization_normal_header, json={"completed": True}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 class TestDeleteTodoAPI:
     def test_delete_success(
@@ -131,6 +467,18 @@ class TestDeleteTodoAPI:
         todo: Todo = datacontext.todos_repo.get_by_id(id=str(existing_todo.id))
         assert todo is None
 
+    def test_delete_not_found(self, authorization_admin_header, todos_data: list[Todo], client: TestClient):  # noqa: ARG002
+        response = client.delete(f"/todo/{uuid.uuid4()}", headers=authorization_admin_header)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_delete_not_found_when_other_user_owned_todo(
+        self, authorization_normal_header, todos_data: list[Todo], datacontext: DataContext, client: TestClient
+    ):
+        other_todo = todos_data[0]
+        response = client.delete(f"/todo/{other_todo.id}", headers=authorization_normal_header)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert datacontext.todos_repo.get_by_id(id=other_todo.id) == other_todo
+
 
 class TestGetTodoAPI:
     def test_get_success(self, authorization_admin_header, todos_data: list[Todo], client: TestClient):
@@ -232,3 +580,194 @@ class TestGetTodosAPI:
         pagination = PaginationResultAPI(**response.json())
         assert len(pagination.items) <= page_items
         assert pagination.total_items == total_items
+
+    @pytest.mark.parametrize(
+        ("order", "order_by"),
+        [(0, None), (1, "title"), (2, "title"), (2, "priority")],
+    )
+    def test_get_todos_with_cursor(
+        self, order: int, order_by: str | None, authorization_admin_header: dict, client: TestClient, todos_data
+    ):
+        body = {"items": 1, "order": order, "order_by": order_by}
+        seen_ids = []
+
+        while True:
+            response = client.post("/todos/", headers=authorization_admin_header, json=body)
+            assert response.status_code == status.HTTP_200_OK
+
+            pagination = PaginationResultAPI(**response.json())
+            seen_ids.extend(todo["id"] for todo in pagination.items)
+            if pagination.next_cursor is None:
+                break
+            body["cursor"] = pagination.next_cursor
+
+        assert sorted(seen_ids) == sorted(todo.id for todo in todos_data)
+
+    @pytest.mark.parametrize(("q", "total_items"), [("II", 2), ("description", 4), ("nothing", 0)])
+    def test_get_todos_search(
+        self,
+        q: str,
+        total_items: int,
+        authorization_admin_header: dict,
+        client: TestClient,
+        todos_data: list[Todo],  # noqa: ARG002
+    ):
+        body = {"items": 10, "filters": {"q": q}}
+
+        response = client.post("/todos/", headers=authorization_admin_header, json=body)
+        assert response.status_code == status.HTTP_200_OK
+
+        pagination = PaginationResultAPI(**response.json())
+        assert pagination.total_items == total_items
+        assert all(q in todo["title"] or q in todo["description"] for todo in pagination.items)
+        assert pagination.next_cursor is None
+
+    def test_get_todos_search_validation_error(self, authorization_admin_header: dict, client: TestClient):
+        response = client.post("/todos/", headers=authorization_admin_header, json={"filters": {"q": "  "}})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_get_todos_with_invalid_cursor(self, authorization_admin_header: dict, client: TestClient):
+        body = {"items": 1, "cursor": "not a cursor"}
+
+        response = client.post("/todos/", headers=authorization_admin_header, json=body)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize(("page", "include_total", "total_items"), [(1, True, 4), (10, True, 4), (1, False, None)])
+    def test_get_todos_total_items(
+        self,
+        page: int,
+        include_total: bool,  # noqa: FBT001
+        total_items: int | None,
+        authorization_admin_header: dict,
+        client: TestClient,
+        todos_data: list[Todo],  # noqa: ARG002
+    ):
+        body = {"page": page, "items": 1, "include_total": include_total}
+
+        response = client.post("/todos/", headers=authorization_admin_header, json=body)
+        assert response.status_code == status.HTTP_200_OK
+
+        pagination = PaginationResultAPI(**response.json())
+        assert pagination.total_items == total_items
+
+    @pytest.mark.parametrize(("include_archived", "total_items"), [(False, 2), (True, 4)])
+    def test_get_todos_include_archived(
+        self,
+        include_archived: bool,  # noqa: FBT001
+        total_items: int,
+        authorization_admin_header: dict,
+        client: TestClient,
+        datacontext: DataContext,
+        todos_service: TodosService,
+        todos_data: list[Todo],
+    ):
+        archived_ids = [todos_data[0].id, todos_data[2].id]
+        datacontext.todos_repo.update_many({"completed": True}, ids=archived_ids)
+        archived = todos_service.archive_todos(
+            archive_todos_command=ArchiveTodosCommand(completed_before=datetime.now(UTC).replace(tzinfo=None))
+        )
+        assert archived.affected == 2
+
+        body = {"items": 10, "include_archived": include_archived}
+        response = client.post("/todos/", headers=authorization_admin_header, json=body)
+        assert response.status_code == status.HTTP_200_OK
+
+        pagination = PaginationResultAPI(**response.json())
+        assert pagination.total_items == total_items
+        listed_ids = {todo["id"] for todo in pagination.items}
+        assert bool(listed_ids & set(archived_ids)) == include_archived
+
+    def test_rate_limited_per_user(
+        self, authorization_admin_header: dict, authorization_normal_header: dict, client: TestClient
+    ):
+        client.app.state.rate_limiter.user_limit = RateLimit(requests=2)
+
+        for _ in range(2):
+            response = client.post("/todos/", headers=authorization_admin_header, json={})
+            assert response.status_code == status.HTTP_200_OK
+
+        response = client.post("/todos/", headers=authorization_admin_header, json={})
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) >= 1
+
+        response = client.post("/todos/", headers=authorization_normal_header, json={})
+        assert response.status_code == status.HTTP_200_OK
+
+
+class TestGetTodoStatsAPI:
+    def test_admin_gets_stats_of_owner(self, authorization_admin_header: dict, client: TestClient, todos_data):
+        owner_id = todos_data[0].owner_id
+
+        response = client.get("/todos/stats", headers=authorization_admin_header, params={"owner_id": owner_id})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "owner_id": owner_id,
+            "total": 2,
+            "completed": 0,
+            "pending": 2,
+            "priorities": [{"priority": 5, "completed": 0, "pending": 2}],
+        }
+
+    def test_stats_follow_writes(self, authorization_admin_header: dict, client: TestClient, todos_data):
+        todo = todos_data[0]
+        params = {"owner_id": todo.owner_id}
+        assert client.get("/todos/stats", headers=authorization_admin_header, params=params).json()["completed"] == 0
+
+        response = client.patch(f"/todo/{todo.id}", headers=authorization_admin_header, json={"completed": True})
+        assert response.status_code == status.HTTP_200_OK
+
+        stats = client.get("/todos/stats", headers=authorization_admin_header, params=params).json()
+        assert stats["completed"] == 1
+        assert stats["pending"] == 1
+
+    def test_normal_user_only_gets_own_stats(
+        self,
+        authorization_normal_header: dict,
+        user_normal_mock: tuple[UserDTO, str],
+        client: TestClient,
+        todos_data: list[Todo],
+    ):
+        user, _ = user_normal_mock
+
+        response = client.get(
+            "/todos/stats", headers=authorization_normal_header, params={"owner_id": todos_data[0].owner_id}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["owner_id"] == str(user.id)
+        assert response.json()["total"] == 0
+
+
+class TestExportTodosAPI:
+    def test_export_ndjson(self, authorization_admin_header: dict, client: TestClient, todos_data: list[Todo]):
+        response = client.get("/todos/export", headers=authorization_admin_header)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        todos = [TodoResultAPI(**json.loads(line)) for line in response.text.splitlines()]
+        assert sorted(str(todo.id) for todo in todos) == sorted(todo.id for todo in todos_data)
+
+    def test_export_csv_with_filters(
+        self, authorization_admin_header: dict, client: TestClient, todos_data: list[Todo]
+    ):
+        priority = todos_data[0].priority
+        response = client.get(
+            "/todos/export", headers=authorization_admin_header, params={"format": "csv", "priority": priority}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert list(rows[0]) == list(TodoResultAPI.model_fields)
+        assert sorted(row["id"] for row in rows) == sorted(todo.id for todo in todos_data if todo.priority == priority)
+
+    def test_normal_user_only_exports_own_todos(
+        self,
+        authorization_normal_header: dict,
+        client: TestClient,
+        todos_data: list[Todo],
+    ):
+        response = client.get(
+            "/todos/export", headers=authorization_normal_header, params={"owner_id": todos_data[0].owner_id}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == ""
@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 import uuid
 
 import pytest
@@ -203,3 +206,56 @@ class TestGetUsersAPI:
         pagination = PaginationResultAPI(**response.json())
         assert len(pagination.items) <= page_items
         assert pagination.total_items == total_items
+
+    def test_get_users_with_cursor(self, authorization_admin_header: dict, client: TestClient, users_data: list[User]):
+        body = {"items": 2, "order": 1, "order_by": "username"}
+        usernames = []
+
+        while True:
+            response = client.post("/users/", headers=authorization_admin_header, json=body)
+            assert response.status_code == status.HTTP_200_OK
+
+            pagination = PaginationResultAPI(**response.json())
+            usernames.extend(user["username"] for user in pagination.items)
+            if pagination.next_cursor is None:
+                break
+            body["cursor"] = pagination.next_cursor
+
+        # compared unordered because the username collation depends on the database
+        assert sorted(usernames) == sorted([user.username for user in users_data] + ["admintodoapp"])
+
+    def test_get_users_rejects_unsortable_fields(self, authorization_admin_header: dict, client: TestClient):
+        body = {"items": 1, "order": 1, "order_by": "password"}
+
+        response = client.post("/users/", headers=authorization_admin_header, json=body)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": {"msg": "Cannot sort by 'password', only by: email, role, username"}}
+
+
+class TestExportUsersAPI:
+    def test_export_ndjson(self, authorization_admin_header: dict, client: TestClient, users_data: list[User]):
+        response = client.get("/users/export", headers=authorization_admin_header)
+        assert response.status_code == status.HTTP_200_OK
+
+        users = [UserResultAPI(**json.loads(line)) for line in response.text.splitlines()]
+        assert {str(user.id) for user in users} >= {user.id for user in users_data}
+        assert all("password" not in line for line in response.text.splitlines())
+
+    def test_export_csv_with_filters(
+        self, authorization_admin_header: dict, client: TestClient, users_data: list[User]
+    ):
+        response = client.get(
+            "/users/export",
+            headers=authorization_admin_header,
+            params={"format": "csv", "roles": [UserRole.NORMAL.value]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert sorted(row["id"] for row in rows) == sorted(
+            user.id for user in users_data if user.role == UserRole.NORMAL
+        )
+
+    def test_export_forbidden_for_normal_user(self, authorization_normal_header: dict, client: TestClient):
+        response = client.get("/users/export", headers=authorization_normal_header)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,44 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+
+from todoapp.adapters.database.database import dispose_shared_async_engines
+from todoapp.domain.models.todo import Todo
+from todoapp.domain.models.user import User, UserRole
+from todoapp.domain.repositories.data_context import AsyncDataContext, DataContext
+
+# the repositories run on the configured test database (datacontext and async_datacontext, from tests/conftest.py),
+# so each dialect gets its own upserts and full-text search covered
+load_dotenv(".env.testing", override=True)
+
+
+@pytest_asyncio.fixture
+async def async_datacontext(db, async_datacontext: AsyncDataContext) -> AsyncDataContext:
+    # db rebuilds the schema, so a test using only the async repositories starts on an empty database too
+    yield async_datacontext
+    # the async engine connections belong to the event loop of the test
+    await dispose_shared_async_engines()
+
+
+@pytest.fixture
+def owner(datacontext: DataContext) -> User:
+    return datacontext.users_repo.add(
+        User(
+            id=str(uuid.UUID("d2a09b40-9da4-4db7-8035-cd9a50a192fd")),
+            username="User 1",
+            email="user1@foo.com",
+            password="password",
+            role=UserRole.NORMAL,
+            is_active=True,
+        )
+    )
+
+
+@pytest.fixture
+def make_todo(owner: User):
+    def _make_todo(title: str, priority: int = 5) -> Todo:
+        return Todo(title=title, description=f"{title} description", priority=priority, owner_id=owner.id)
+
+    return _make_todo
@@ -0,0 +1,193 @@
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from todoapp.domain.models.base_model import KeysetCursor, SortDirection
+from todoapp.domain.models.user import User, UserRole
+from todoapp.domain.repositories.data_context import AsyncDataContext
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+from todoapp.domain.services.users.queries.get_users import GetUsersQueryFilters
+
+
+def make_user(username: str) -> User:
+    email = f"{username.replace(' ', '').lower()}@foo.com"
+    return User(
+        id=str(uuid.uuid4()), username=username, email=email, password="password", role=UserRole.NORMAL, is_active=True
+    )
+
+
+class TestAsyncRepositoryBase:
+    @pytest.mark.asyncio
+    async def test_add_and_get_by_id(self, make_todo, async_datacontext: AsyncDataContext):
+        todo = await async_datacontext.todos_repo.add(make_todo("title 1"))
+
+        stored_todo = await async_datacontext.todos_repo.get_by_id(todo.id)
+
+        assert stored_todo == todo
+
+    @pytest.mark.asyncio
+    async def test_get_and_count_with_filters(self, make_todo, async_datacontext: AsyncDataContext):
+        for i in range(3):
+            await async_datacontext.todos_repo.add(make_todo(f"title {i}", priority=1 + i % 2))
+
+        filters = GetTodosQueryFilters(priority=1)
+        todos = await async_datacontext.todos_repo.get(
+            filters=filters, order=SortDirection.DESC, order_by="title", limit=10
+        )
+
+        assert [todo.title for todo in todos] == ["title 2", "title 0"]
+        assert await async_datacontext.todos_repo.count(filters=filters) == 2
+
+    @pytest.mark.asyncio
+    async def test_update(self, make_todo, async_datacontext: AsyncDataContext):
+        todo = await async_datacontext.todos_repo.add(make_todo("title 1"))
+        todo.completed = True
+
+        updated_todo = await async_datacontext.todos_repo.update(todo)
+
+        assert updated_todo.completed is True
+
+    @pytest.mark.asyncio
+    async def test_update_only_sets_changed_fields(self, make_todo, async_datacontext: AsyncDataContext):
+        todo = await async_datacontext.todos_repo.add(make_todo("title 1"))
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = async_datacontext.database_connector.engine.sync_engine
+        event.listen(engine, "before_cursor_execute", record_statement)
+        try:
+            todo.description = "new description"
+            updated_todo = await async_datacontext.todos_repo.update(todo)
+            await async_datacontext.todos_repo.update(updated_todo)
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+
+        updates = [statement for statement in statements if statement.startswith("UPDATE todos")]
+        assert len(updates) == 1
+        assert "SET description=" in updates[0]
+        assert "title" not in updates[0]
+        assert updated_todo.description == "new description"
+
+    @pytest.mark.asyncio
+    async def test_stream(self, make_todo, async_datacontext: AsyncDataContext):
+        todos = [await async_datacontext.todos_repo.add(make_todo(f"title {i}", priority=1 + i % 2)) for i in range(5)]
+
+        streamed = [
+            todo
+            async for todo in async_datacontext.todos_repo.stream(
+                filters=GetTodosQueryFilters(priority=1), batch_size=2
+            )
+        ]
+
+        assert sorted(streamed, key=lambda todo: todo.title) == [todo for todo in todos if todo.priority == 1]
+
+    @pytest.mark.asyncio
+    async def test_delete(self, make_todo, async_datacontext: AsyncDataContext):
+        todo = await async_datacontext.todos_repo.add(make_todo("title 1"))
+
+        await async_datacontext.todos_repo.delete(todo)
+
+        assert await async_datacontext.todos_repo.get_by_id(todo.id) is None
+
+    @pytest.mark.asyncio
+    async def test_get_by_email(self, owner: User, async_datacontext: AsyncDataContext):
+        user = await async_datacontext.users_repo.get_by_email("user1@foo.com")
+
+        assert user.id == owner.id
+
+    @pytest.mark.asyncio
+    async def test_get_page_returns_total_of_filters(self, make_todo, async_datacontext: AsyncDataContext):
+        for i in range(5):
+            await async_datacontext.todos_repo.add(make_todo(f"title {i}"))
+
+        first_page, total_items = await async_datacontext.todos_repo.get_page(
+            order=SortDirection.ASC, order_by="title", limit=2
+        )
+        assert [todo.title for todo in first_page] == ["title 0", "title 1"]
+        assert total_items == 5
+
+        after = KeysetCursor(last_id=first_page[-1].id, last_value=first_page[-1].title)
+        second_page, total_items = await async_datacontext.todos_repo.get_page(
+            order=SortDirection.ASC, order_by="title", limit=2, after=after
+        )
+        assert [todo.title for todo in second_page] == ["title 2", "title 3"]
+        assert total_items == 5
+
+    @pytest.mark.asyncio
+    async def test_get_page_without_total(self, make_todo, async_datacontext: AsyncDataContext):
+        await async_datacontext.todos_repo.add(make_todo("title 1"))
+
+        todos, total_items = await async_datacontext.todos_repo.get_page(include_total=False)
+
+        assert len(todos) == 1
+        assert total_items is None
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_best_matches_first(self, make_todo, async_datacontext: AsyncDataContext):
+        await async_datacontext.todos_repo.add(make_todo("buy milk"))
+        await async_datacontext.todos_repo.add(make_todo("milk and bread"))
+        await async_datacontext.todos_repo.add(make_todo("bread rolls"))
+        await async_datacontext.todos_repo.add(make_todo("call mom"))
+
+        todos, total_items = await async_datacontext.todos_repo.get_page(filters=GetTodosQueryFilters(q="milk bread"))
+
+        assert todos[0].title == "milk and bread"
+        assert total_items == 3
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_interpret_query_syntax(self, make_todo, async_datacontext: AsyncDataContext):
+        await async_datacontext.todos_repo.add(make_todo("buy milk"))
+
+        todos = await async_datacontext.todos_repo.get(filters=GetTodosQueryFilters(q='milk" OR NEAR(*'))
+
+        assert [todo.title for todo in todos] == ["buy milk"]
+
+    @pytest.mark.asyncio
+    async def test_search_index_follows_writes(self, make_todo, async_datacontext: AsyncDataContext):
+        todo = await async_datacontext.todos_repo.add(make_todo("buy milk"))
+        other_todo = await async_datacontext.todos_repo.add(make_todo("buy bread"))
+
+        todo.title = "call mom"
+        todo.description = "call mom description"
+        await async_datacontext.todos_repo.update(todo)
+        await async_datacontext.todos_repo.delete(other_todo)
+
+        assert await async_datacontext.todos_repo.count(filters=GetTodosQueryFilters(q="buy")) == 0
+        assert await async_datacontext.todos_repo.count(filters=GetTodosQueryFilters(q="mom")) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("owner")
+    @pytest.mark.parametrize(
+        ("filters", "usernames"),
+        [
+            (GetUsersQueryFilters(username="ER 1"), ["User 1"]),
+            (GetUsersQueryFilters(username="us"), ["User 1", "User 2"]),
+            (GetUsersQueryFilters(email="2@foo"), ["User 2"]),
+            (GetUsersQueryFilters(email="r1@foo.com"), ["User 1"]),
+            (GetUsersQueryFilters(email="foo.es"), []),
+        ],
+    )
+    async def test_search_users(
+        self, filters: GetUsersQueryFilters, usernames: list[str], async_datacontext: AsyncDataContext
+    ):
+        await async_datacontext.users_repo.add(make_user("User 2"))
+
+        users = await async_datacontext.users_repo.get(filters=filters, order=SortDirection.ASC, order_by="username")
+
+        assert [user.username for user in users] == usernames
+
+    @pytest.mark.asyncio
+    async def test_users_search_index_follows_writes(self, async_datacontext: AsyncDataContext):
+        user = await async_datacontext.users_repo.add(make_user("User 2"))
+        other_user = await async_datacontext.users_repo.add(make_user("User 3"))
+
+        user.email = "renamed@bar.com"
+        await async_datacontext.users_repo.update(user)
+        await async_datacontext.users_repo.delete(other_user)
+
+        assert await async_datacontext.users_repo.count(filters=GetUsersQueryFilters(email="2@foo")) == 0
+        assert await async_datacontext.users_repo.count(filters=GetUsersQueryFilters(email="renamed")) == 1
+        assert await async_datacontext.users_repo.count(filters=GetUsersQueryFilters(username="user 3")) == 0
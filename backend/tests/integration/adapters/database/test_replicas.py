@@ -0,0 +1,103 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from todoapp.adapters.database.database import (
+    AsyncDatabaseConnector,
+    DatabaseConnector,
+    dispose_shared_async_engines,
+    dispose_shared_engines,
+)
+from todoapp.adapters.database.models import BaseORM
+from todoapp.adapters.database.replicas import ReplicaSettings, consistency_key, read_your_writes_tracker
+from todoapp.domain.models.user import User
+from todoapp.domain.repositories.data_context import AsyncDataContext, DataContext
+
+
+@pytest.fixture
+def db_paths(tmp_path) -> tuple[str, str]:
+    # two independent sqlite files: nothing replicates, so a read shows which one served it
+    db_paths = (str(tmp_path / "primary.db"), str(tmp_path / "replica.db"))
+    for db_path in db_paths:
+        BaseORM.metadata.create_all(bind=DatabaseConnector(db_url=f"sqlite:///{db_path}").engine)
+
+    yield db_paths
+
+    dispose_shared_engines()
+    read_your_writes_tracker.clear()
+
+
+@pytest.fixture
+def datacontext(db_paths) -> DataContext:
+    primary_path, _ = db_paths
+    return DataContext(
+        database_connector=DatabaseConnector(
+            db_url=f"sqlite:///{primary_path}", replica_settings=ReplicaSettings(read_your_writes_seconds=60)
+        )
+    )
+
+
+@pytest_asyncio.fixture
+async def async_datacontext(db_paths) -> AsyncDataContext:
+    primary_path, replica_path = db_paths
+    yield AsyncDataContext(
+        database_connector=AsyncDatabaseConnector(
+            db_url=f"sqlite+aiosqlite:///{primary_path}",
+            replica_settings=ReplicaSettings(urls=[f"sqlite+aiosqlite:///{replica_path}"]),
+        )
+    )
+    await dispose_shared_async_engines()
+
+
+@pytest.fixture
+def user_consistency_key(owner: User):
+    token = consistency_key.set(owner.id)
+    yield owner.id
+    consistency_key.reset(token)
+
+
+class TestReplicaRouting:
+    @pytest.mark.asyncio
+    async def test_queries_read_from_replica(
+        self, make_todo, datacontext: DataContext, async_datacontext: AsyncDataContext
+    ):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+
+        assert datacontext.todos_repo.get_by_id(todo.id) == todo
+        assert await async_datacontext.todos_repo.get_by_id(todo.id) is None
+        assert await async_datacontext.todos_repo.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_writer_reads_from_primary_after_writing(
+        self, user_consistency_key, make_todo, datacontext: DataContext, async_datacontext: AsyncDataContext
+    ):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+
+        assert read_your_writes_tracker.is_pinned(user_consistency_key)
+        assert await async_datacontext.todos_repo.get_by_id(todo.id) == todo
+
+    @pytest.mark.asyncio
+    async def test_other_users_keep_reading_from_replica(
+        self, owner: User, make_todo, datacontext: DataContext, async_datacontext: AsyncDataContext
+    ):
+        token = consistency_key.set(owner.id)
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+        consistency_key.reset(token)
+
+        token = consistency_key.set(str(uuid.uuid4()))
+        try:
+            assert await async_datacontext.todos_repo.get_by_id(todo.id) is None
+        finally:
+            consistency_key.reset(token)
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_pin_to_primary(
+        self, user_consistency_key, datacontext: DataContext, async_datacontext: AsyncDataContext
+    ):
+        read_your_writes_tracker.clear()
+
+        datacontext.todos_repo.count()
+        await async_datacontext.todos_repo.count()
+
+        assert not read_your_writes_tracker.is_pinned(user_consistency_key)
@@ -0,0 +1,136 @@
+import uuid
+
+from sqlalchemy import select
+
+from todoapp.adapters.database.models import TodoCountersORM
+from todoapp.domain.models.user import User
+from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+from todoapp.domain.services.users.queries.get_users import GetUsersQueryFilters
+
+
+def get_counters(datacontext: DataContext) -> dict[tuple, int]:
+    with datacontext.database_connector.session_scope() as session:
+        counters = session.execute(select(TodoCountersORM)).scalars()
+        return {(counter.owner_id, counter.priority, counter.completed): counter.total for counter in counters}
+
+
+class TestTodoCounters:
+    def test_add_increments_counter(self, owner: User, make_todo, datacontext: DataContext):
+        datacontext.todos_repo.add(make_todo("title 1"))
+        datacontext.todos_repo.add(make_todo("title 2"))
+        datacontext.todos_repo.add(make_todo("title 3", priority=1))
+
+        assert get_counters(datacontext) == {(owner.id, 5, False): 2, (owner.id, 1, False): 1}
+
+    def test_add_many_increments_counters_once_per_key(self, owner: User, make_todo, datacontext: DataContext):
+        todos = datacontext.todos_repo.add_many([make_todo(f"title {i}", priority=1 + i % 2) for i in range(5)])
+
+        assert len(todos) == 5
+        found_todos = datacontext.todos_repo.get_by_titles(["title 0", "title 4", "missing"])
+        assert sorted(found_todos, key=lambda todo: todo.title) == [todos[0], todos[4]]
+        assert get_counters(datacontext) == {(owner.id, 1, False): 3, (owner.id, 2, False): 2}
+
+    def test_update_moves_todo_between_counters(self, owner: User, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+        datacontext.todos_repo.add(make_todo("title 2"))
+
+        todo.completed = True
+        todo.priority = 1
+        datacontext.todos_repo.update(todo)
+
+        assert get_counters(datacontext) == {(owner.id, 5, False): 1, (owner.id, 1, True): 1}
+
+    def test_update_of_other_fields_keeps_counters(self, owner: User, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+
+        todo.title = "new title"
+        datacontext.todos_repo.update(todo)
+
+        assert get_counters(datacontext) == {(owner.id, 5, False): 1}
+
+    def test_delete_decrements_counter(self, owner: User, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+        datacontext.todos_repo.add(make_todo("title 2"))
+
+        datacontext.todos_repo.delete(todo)
+
+        assert get_counters(datacontext) == {(owner.id, 5, False): 1}
+
+    def test_update_many_moves_todos_between_counters(self, owner: User, make_todo, datacontext: DataContext):
+        todos = datacontext.todos_repo.add_many([make_todo(f"title {i}", priority=1 + i % 2) for i in range(5)])
+
+        affected = datacontext.todos_repo.update_many(
+            values={"completed": True}, ids=[todo.id for todo in todos[:3]], filters=GetTodosQueryFilters(priority=1)
+        )
+
+        assert affected == 2
+        assert get_counters(datacontext) == {
+            (owner.id, 1, False): 1,
+            (owner.id, 1, True): 2,
+            (owner.id, 2, False): 2,
+        }
+
+    def test_update_many_of_other_fields_keeps_counters(self, owner: User, make_todo, datacontext: DataContext):
+        datacontext.todos_repo.add_many([make_todo(f"title {i}") for i in range(2)])
+
+        assert datacontext.todos_repo.update_many(values={"description": "new description"}) == 2
+        assert get_counters(datacontext) == {(owner.id, 5, False): 2}
+
+    def test_delete_many_decrements_counters(self, owner: User, make_todo, datacontext: DataContext):
+        datacontext.todos_repo.add_many([make_todo(f"title {i}", priority=1 + i % 2) for i in range(5)])
+
+        affected = datacontext.todos_repo.delete_many(filters=GetTodosQueryFilters(priority=2))
+
+        assert affected == 2
+        assert get_counters(datacontext) == {(owner.id, 1, False): 3, (owner.id, 2, False): 0}
+        assert datacontext.todos_repo.count() == 3
+
+    def test_update_one_only_updates_matching_todo(self, owner: User, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+
+        other_owner = GetTodosQueryFilters(owner_id=str(uuid.uuid4()))
+        assert datacontext.todos_repo.update_one(todo.id, {"completed": True}, filters=other_owner) is None
+
+        updated = datacontext.todos_repo.update_one(
+            todo.id, {"completed": True}, filters=GetTodosQueryFilters(owner_id=owner.id)
+        )
+
+        assert updated.completed is True
+        assert datacontext.todos_repo.get_by_id(todo.id) == updated
+        assert get_counters(datacontext) == {(owner.id, 5, False): 0, (owner.id, 5, True): 1}
+
+    def test_update_one_of_other_fields_keeps_counters(self, owner: User, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+
+        updated = datacontext.todos_repo.update_one(todo.id, {"description": "new description"})
+
+        assert updated.description == "new description"
+        assert datacontext.todos_repo.update_one(str(uuid.uuid4()), {"description": "new description"}) is None
+        assert get_counters(datacontext) == {(owner.id, 5, False): 1}
+
+    def test_delete_one_only_deletes_matching_todo(self, owner: User, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+
+        assert not datacontext.todos_repo.delete_one(todo.id, filters=GetTodosQueryFilters(owner_id=str(uuid.uuid4())))
+        assert datacontext.todos_repo.delete_one(todo.id, filters=GetTodosQueryFilters(owner_id=owner.id))
+        assert not datacontext.todos_repo.delete_one(todo.id)
+
+        assert datacontext.todos_repo.get_by_id(todo.id) is None
+        assert get_counters(datacontext) == {(owner.id, 5, False): 0}
+
+    def test_count_is_answered_from_counters(self, owner: User, make_todo, datacontext: DataContext):
+        for i in range(3):
+            datacontext.todos_repo.add(make_todo(f"title {i}", priority=1 + i % 2))
+
+        query = str(datacontext.todos_repo._count_query(filters=GetTodosQueryFilters(owner_id=owner.id)))
+
+        assert TodoCountersORM.__tablename__ in query
+        assert datacontext.todos_repo.count() == 3
+        assert datacontext.todos_repo.count(filters=GetTodosQueryFilters(priority=1)) == 2
+        assert datacontext.todos_repo.count(filters=GetTodosQueryFilters(owner_id=str(uuid.uuid4()))) == 0
+
+    def test_count_falls_back_to_todos_when_filters_are_not_covered(self, datacontext: DataContext):
+        query = str(datacontext.todos_repo._count_query(filters=GetUsersQueryFilters(username="user")))
+
+        assert TodoCountersORM.__tablename__ not in query
@@ -0,0 +1,102 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from todoapp.adapters.database.models import TodosArchiveORM, TodosORM
+from todoapp.domain.models.base_model import SortDirection
+from todoapp.domain.models.todo import Todo
+from todoapp.domain.models.user import User
+from todoapp.domain.repositories.data_context import AsyncDataContext, DataContext
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+
+# completed_at is naive UTC, and MySQL DATETIME columns drop the microseconds
+NOW = datetime.now(UTC).replace(tzinfo=None, microsecond=0)
+
+
+def completed_at(datacontext: DataContext, todo: Todo) -> datetime | None:
+    with datacontext.database_connector.session_scope() as session:
+        return session.execute(select(TodosORM.completed_at).where(TodosORM.id == todo.id)).scalar_one()
+
+
+def complete(datacontext: DataContext, todos: list[Todo], days_ago: int):
+    datacontext.todos_repo.update_many({"completed": True}, ids=[todo.id for todo in todos])
+    with datacontext.database_connector.session_scope() as session:
+        session.execute(
+            update(TodosORM)
+            .where(TodosORM.id.in_([todo.id for todo in todos]))
+            .values(completed_at=NOW - timedelta(days=days_ago))
+        )
+
+
+class TestTodosCompletedAt:
+    def test_completing_stamps_the_first_completion_only(self, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+        assert completed_at(datacontext, todo) is None
+
+        datacontext.todos_repo.update_one(todo.id, {"completed": True})
+        first_completed_at = completed_at(datacontext, todo)
+        assert first_completed_at is not None
+
+        datacontext.todos_repo.update_many({"completed": True}, ids=[todo.id])
+        assert completed_at(datacontext, todo) == first_completed_at
+
+        todo = datacontext.todos_repo.get_by_id(todo.id)
+        todo.completed = False
+        datacontext.todos_repo.update(todo)
+        assert completed_at(datacontext, todo) is None
+
+
+class TestTodosArchive:
+    def test_archive_moves_old_completed_todos_in_batches(self, owner: User, make_todo, datacontext: DataContext):
+        old_todos = [datacontext.todos_repo.add(make_todo(f"old {i}", priority=1 + i % 2)) for i in range(3)]
+        recent_todo = datacontext.todos_repo.add(make_todo("recent"))
+        pending_todo = datacontext.todos_repo.add(make_todo("pending"))
+        complete(datacontext, old_todos, days_ago=40)
+        complete(datacontext, [recent_todo], days_ago=1)
+
+        completed_before = NOW - timedelta(days=30)
+        assert datacontext.todos_repo.archive_completed(completed_before, limit=2) == {owner.id: 2}
+        assert datacontext.todos_repo.archive_completed(completed_before, limit=2) == {owner.id: 1}
+        assert datacontext.todos_repo.archive_completed(completed_before, limit=2) == {}
+
+        remaining = datacontext.todos_repo.get(order=SortDirection.ASC, order_by="title")
+        assert [todo.id for todo in remaining] == [pending_todo.id, recent_todo.id]
+        assert datacontext.todos_repo.count_by_priority_and_completed(owner.id) == {(5, False): 1, (5, True): 1}
+
+        with datacontext.database_connector.session_scope() as session:
+            archived = session.execute(select(TodosArchiveORM).order_by(TodosArchiveORM.title)).scalars().all()
+            assert [(todo.title, todo.priority, todo.completed) for todo in archived] == [
+                ("old 0", 1, True),
+                ("old 1", 2, True),
+                ("old 2", 1, True),
+            ]
+            assert all(todo.completed_at == NOW - timedelta(days=40) for todo in archived)
+
+
+class TestTodosIncludeArchived:
+    @pytest.mark.asyncio
+    async def test_get_page_reads_archive_only_when_asked(
+        self, make_todo, datacontext: DataContext, async_datacontext: AsyncDataContext
+    ):
+        todos = [datacontext.todos_repo.add(make_todo(f"title {i}", priority=1 + i % 2)) for i in range(4)]
+        complete(datacontext, todos[:2], days_ago=40)
+        datacontext.todos_repo.archive_completed(NOW - timedelta(days=30), limit=10)
+
+        page, total_items = await async_datacontext.todos_repo.get_page(limit=10)
+        assert {todo.title for todo in page} == {"title 2", "title 3"}
+        assert total_items == 2
+
+        page, total_items = await async_datacontext.todos_repo.get_page(
+            order=SortDirection.DESC, order_by="title", limit=3, include_archived=True
+        )
+        assert [todo.title for todo in page] == ["title 3", "title 2", "title 1"]
+        assert total_items == 4
+        assert (page[2].id, page[2].completed) == (todos[1].id, True)
+
+        filters = GetTodosQueryFilters(priority=1, q="title")
+        page, total_items = await async_datacontext.todos_repo.get_page(
+            filters=filters, order=SortDirection.ASC, order_by="title", include_archived=True
+        )
+        assert [todo.title for todo in page] == ["title 0", "title 2"]
+        assert total_items == 2
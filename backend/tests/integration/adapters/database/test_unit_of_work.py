@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import pytest
+
+from todoapp.domain.models.user import User, UserRole
+from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.auth.auth import Auth
+from todoapp.domain.services.users.commands.add_user import AddUserCommand
+from todoapp.domain.services.users.commands.edit_user import EditUserCommand
+from todoapp.domain.services.users.users_service import UsersService
+
+
+class TestUnitOfWork:
+    def test_repositories_share_one_connection(self, owner: User, make_todo, datacontext: DataContext):
+        checkouts = datacontext.database_connector.pool_statistics().checkouts
+
+        with datacontext.unit_of_work():
+            owner.username = "User 1 renamed"
+            datacontext.users_repo.update(owner)
+            todo = datacontext.todos_repo.add(make_todo("title 1"))
+            todo.completed = True
+            datacontext.todos_repo.update(todo)
+            datacontext.todos_repo.get_by_id(todo.id)
+
+        assert datacontext.database_connector.pool_statistics().checkouts == checkouts + 1
+        assert datacontext.todos_repo.get_by_id(todo.id).completed is True
+
+    def test_rolls_back_every_write_on_error(self, owner: User, make_todo, datacontext: DataContext):
+        with pytest.raises(RuntimeError), datacontext.unit_of_work():
+            owner.username = "User 1 renamed"
+            datacontext.users_repo.update(owner)
+            datacontext.todos_repo.add(make_todo("title 1"))
+            raise RuntimeError
+
+        assert datacontext.users_repo.get_by_id(owner.id).username == "User 1"
+        assert datacontext.todos_repo.count() == 0
+
+    def test_reads_see_earlier_writes(self, make_todo, datacontext: DataContext):
+        todo = datacontext.todos_repo.add(make_todo("title 1"))
+
+        with datacontext.unit_of_work():
+            datacontext.todos_repo.get_by_id(todo.id)
+            datacontext.todos_repo.update_many(values={"priority": 1}, ids=[todo.id])
+            assert datacontext.todos_repo.get_by_id(todo.id).priority == 1
+
+            datacontext.todos_repo.delete_many(ids=[todo.id])
+            assert datacontext.todos_repo.get_by_id(todo.id) is None
+
+    def test_nested_units_of_work_commit_with_the_outer_one(self, make_todo, datacontext: DataContext):
+        with pytest.raises(RuntimeError), datacontext.unit_of_work():
+            with datacontext.unit_of_work():
+                datacontext.todos_repo.add(make_todo("title 1"))
+            raise RuntimeError
+
+        assert datacontext.todos_repo.count() == 0
+
+    def test_runs_after_commit_callbacks_once_committed(self, make_todo, datacontext: DataContext):
+        committed = []
+
+        with datacontext.unit_of_work():
+            todo = datacontext.todos_repo.add(make_todo("title 1"))
+            datacontext.after_commit(lambda: committed.append(datacontext.todos_repo.get_by_id(todo.id) is not None))
+            assert committed == []
+
+        assert committed == [True]
+
+    def test_drops_after_commit_callbacks_on_rollback(self, datacontext: DataContext):
+        committed = []
+
+        with pytest.raises(RuntimeError), datacontext.unit_of_work():
+            datacontext.after_commit(lambda: committed.append(True))
+            raise RuntimeError
+
+        datacontext.after_commit(lambda: committed.append(False))
+        assert committed == [False]
+
+    def test_users_commands_hash_passwords_without_holding_a_connection(self, datacontext: DataContext):
+        users_service = UsersService(data_context=datacontext, async_data_context=None)
+        pool = datacontext.database_connector.engine.pool
+        checked_out_while_hashing = []
+
+        def create_hashed_password(password: str) -> str:
+            checked_out_while_hashing.append(pool.checkedout())
+            return f"hashed {password}"
+
+        with patch.object(Auth, "create_hashed_password", side_effect=create_hashed_password):
+            user = users_service.add_user(
+                AddUserCommand(username="User 2", email="user2@foo.com", password="password", role=UserRole.NORMAL)
+            )
+            edit_user_command = EditUserCommand(password="new password")
+            edit_user_command.id = user.id
+            users_service.edit_user(edit_user_command)
+
+        assert checked_out_while_hashing == [0, 0]
+        assert datacontext.users_repo.get_by_id(str(user.id)).password == "hashed new password"
@@ -26,6 +26,9 @@ class DummyTokenHandler:
             "is_refresh_token": self.refresh,
         }
 
+    def verify_token(self, token: str) -> dict | None:
+        return self.get_token_data(token) if self.is_valid_token(token) else None
+
 
 def make_credentials(token: str = "valid"):
     from fastapi.security import HTTPAuthorizationCredentials
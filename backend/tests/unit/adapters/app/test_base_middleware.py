@@ -0,0 +1,81 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from todoapp.adapters.app.exception_handlers import ExceptionHandlers
+from todoapp.adapters.app.middlewares.base_middleware import BaseMiddleware
+from todoapp.domain.exceptions import NotFoundError, TooManyRequestsError
+
+
+class HeaderMiddleware(BaseMiddleware):
+    """Rejects the requests without an x-allowed header, and tags the responses of the others."""
+
+    async def middleware_process(self, scope: Scope, receive: Receive, send: Send, call_next: ASGIApp):
+        if (b"x-allowed", b"yes") not in scope["headers"]:
+            raise TooManyRequestsError("Not allowed.", retry_after_seconds=7)
+        if scope["path"] == "/late":
+            await call_next(scope, receive, send)
+            raise TooManyRequestsError("Too late.", retry_after_seconds=7)
+
+        async def send_tagged(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message["headers"], (b"x-tagged", b"yes")]
+            await send(message)
+
+        await call_next(scope, receive, send_tagged)
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/found")
+    def found():
+        return {"found": True}
+
+    @app.get("/missing")
+    def missing():
+        raise NotFoundError("Missing.")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"first,", b"second"]), media_type="text/plain")
+
+    @app.get("/late")
+    def late():
+        return {"late": True}
+
+    ExceptionHandlers().register_on_app(app)
+    HeaderMiddleware().register_on_app(app)
+    return TestClient(app)
+
+
+def test_passes_requests_and_responses_through():
+    with make_client() as client:
+        response = client.get("/found", headers={"x-allowed": "yes"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"found": True}
+        assert response.headers["x-tagged"] == "yes"
+
+        response = client.get("/stream", headers={"x-allowed": "yes"})
+        assert response.text == "first,second"
+        assert response.headers["x-tagged"] == "yes"
+
+
+def test_maps_exceptions_through_the_exception_handlers():
+    with make_client() as client:
+        response = client.get("/missing", headers={"x-allowed": "yes"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": {"msg": "Missing."}}
+        assert response.headers["x-tagged"] == "yes"
+
+        response = client.get("/found")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json() == {"detail": {"msg": "Not allowed."}}
+        assert response.headers["Retry-After"] == "7"
+
+
+def test_reraises_the_exceptions_raised_after_the_response_started():
+    with make_client() as client, pytest.raises(TooManyRequestsError):
+        client.get("/late", headers={"x-allowed": "yes"})
@@ -0,0 +1,161 @@
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from todoapp.adapters.app.rate_limiter import (
+    InMemoryRateLimitStore,
+    RateLimit,
+    RateLimiter,
+    SharedRateLimitStore,
+)
+from todoapp.domain.exceptions import TooManyRequestsError
+from todoapp.domain.models.user import UserInfo, UserRole
+
+# the start of a window
+NOW = 1_000_020.0
+USER = UserInfo(user_id=str(uuid.uuid4()), email="user1@foo.com", roles=[UserRole.NORMAL])
+
+
+class LocalRedis:
+    """Stand-in for a redis server, with the commands used by SharedRateLimitStore."""
+
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.expirations: dict[str, int] = {}
+        self.round_trips = 0
+
+    def pipeline(self, *, transaction: bool) -> "LocalPipeline":
+        assert transaction
+        return LocalPipeline(self)
+
+    def set(self, key: str, value: int, ex: int, *, nx: bool) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        self.expirations[key] = ex
+        return True
+
+    def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def get(self, key: str) -> bytes | None:
+        return str(self.values[key]).encode() if key in self.values else None
+
+
+class LocalPipeline:
+    """Queues the commands, run one after the other on execute."""
+
+    def __init__(self, local_redis: LocalRedis):
+        self.local_redis = local_redis
+        self.commands = []
+
+    async def __aenter__(self) -> "LocalPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.commands.clear()
+
+    def __getattr__(self, name: str):
+        command = getattr(self.local_redis, name)
+        return lambda *args, **kwargs: self.commands.append((command, args, kwargs))
+
+    async def execute(self) -> list:
+        self.local_redis.round_trips += 1
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+def make_rate_limiter(store=None) -> RateLimiter:
+    return RateLimiter(
+        ip_limit=RateLimit(requests=2, window_seconds=60),
+        user_limit=RateLimit(requests=4, window_seconds=60),
+        store=store or InMemoryRateLimitStore(),
+    )
+
+
+async def hit_user_at(rate_limiter: RateLimiter, now: float):
+    with patch("todoapp.adapters.app.rate_limiter.time.time", return_value=now):
+        await rate_limiter.hit_user(USER)
+
+
+@pytest.mark.asyncio
+async def test_rejects_past_the_limit_until_the_previous_window_fades():
+    rate_limiter = make_rate_limiter()
+
+    for _ in range(4):
+        await hit_user_at(rate_limiter, NOW + 30)
+    with pytest.raises(TooManyRequestsError) as exc:
+        await hit_user_at(rate_limiter, NOW + 30)
+    assert exc.value.retry_after_seconds == 54
+
+    # 3 s into the next window the 5 hits (the rejected one included) still weigh 4.75
+    with pytest.raises(TooManyRequestsError) as exc:
+        await hit_user_at(rate_limiter, NOW + 63)
+    assert exc.value.retry_after_seconds == 33
+
+    await hit_user_at(rate_limiter, NOW + 96)
+    # a window without hits forgets the previous ones
+    for _ in range(4):
+        await hit_user_at(rate_limiter, NOW + 190)
+
+
+@pytest.mark.asyncio
+async def test_limits_ips_and_users_apart():
+    rate_limiter = make_rate_limiter()
+
+    with patch("todoapp.adapters.app.rate_limiter.time.time", return_value=NOW):
+        await rate_limiter.hit_ip("10.0.0.1")
+        await rate_limiter.hit_ip("10.0.0.1")
+        with pytest.raises(TooManyRequestsError):
+            await rate_limiter.hit_ip("10.0.0.1")
+
+        await rate_limiter.hit_ip("10.0.0.2")
+        await rate_limiter.hit_user(USER)
+
+
+@pytest.mark.parametrize(
+    ("path", "limited"), [("/auth/login", True), ("/auth/refresh", True), ("/authors", False), ("/todos/", False)]
+)
+def test_limits_ips_on_the_auth_routes_only(path: str, limited: bool):  # noqa: FBT001
+    assert make_rate_limiter().limits_ip(path) == limited
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_drops_the_least_recently_hit_keys():
+    store = InMemoryRateLimitStore(max_keys=2)
+
+    await store.hit("a", window=10, window_seconds=60)
+    await store.hit("b", window=10, window_seconds=60)
+    await store.hit("a", window=10, window_seconds=60)
+    await store.hit("c", window=11, window_seconds=60)
+
+    assert await store.hit("a", window=11, window_seconds=60) == (2, 1)
+    assert await store.hit("b", window=11, window_seconds=60) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_shared_store_limits_every_worker_together():
+    local_redis = LocalRedis()
+    workers = [make_rate_limiter(SharedRateLimitStore(local_redis)) for _ in range(2)]
+
+    for worker in workers * 2:
+        await hit_user_at(worker, NOW + 10)
+    for worker in workers:
+        with pytest.raises(TooManyRequestsError):
+            await hit_user_at(worker, NOW + 10)
+
+    assert local_redis.expirations == {f"rate_limit:user:{USER.user_id}:{int(NOW // 60)}": 120}
+    assert local_redis.round_trips == 6
+
+
+@pytest.mark.asyncio
+async def test_lets_requests_through_when_the_store_fails():
+    class BrokenRedis(LocalRedis):
+        def incr(self, key: str) -> int:  # noqa: ARG002
+            raise ConnectionError("store down")
+
+    rate_limiter = make_rate_limiter(SharedRateLimitStore(BrokenRedis()))
+
+    for _ in range(10):
+        await hit_user_at(rate_limiter, NOW)
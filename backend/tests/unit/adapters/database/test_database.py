@@ -0,0 +1,55 @@
+import pytest
+
+from todoapp.adapters.database.database import DatabaseConnector, PoolSettings, dispose_shared_engines
+
+
+@pytest.fixture
+def db_url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'todos.db'}"
+
+
+@pytest.fixture(autouse=True)
+def shared_engines():
+    yield
+    dispose_shared_engines()
+
+
+class TestSharedEngine:
+    def test_same_url_shares_engine(self, db_url: str):
+        first = DatabaseConnector(db_url=db_url)
+        second = DatabaseConnector(db_url=db_url)
+
+        assert first.engine is second.engine
+
+    def test_different_url_uses_different_engine(self, db_url: str, tmp_path):
+        first = DatabaseConnector(db_url=db_url)
+        second = DatabaseConnector(db_url=f"sqlite:///{tmp_path / 'other.db'}")
+
+        assert first.engine is not second.engine
+
+    def test_pool_settings_are_applied(self, db_url: str):
+        database_connector = DatabaseConnector(
+            db_url=db_url, pool_settings=PoolSettings(size=3, max_overflow=1, timeout_seconds=5)
+        )
+
+        assert database_connector.engine.pool.size() == 3
+        assert database_connector.engine.pool._max_overflow == 1
+        assert database_connector.engine.pool._timeout == 5
+
+
+class TestPoolStatistics:
+    def test_counts_checkouts(self, db_url: str):
+        database_connector = DatabaseConnector(db_url=db_url)
+
+        with database_connector.session_scope() as session:
+            session.connection()
+            assert database_connector.pool_statistics().checked_out == 1
+
+        with database_connector.session_scope() as session:
+            session.connection()
+
+        statistics = database_connector.pool_statistics()
+        assert statistics.checkouts == 2
+        assert statistics.checked_out == 0
+        assert statistics.checked_in == 1
+        assert statistics.max_wait_seconds >= statistics.avg_wait_seconds >= 0
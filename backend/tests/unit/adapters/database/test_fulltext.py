@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.exc import CompileError
+
+from todoapp.adapters.database.fulltext import fts5_query, fulltext_match, fulltext_relevance
+from todoapp.adapters.database.models import TodosORM
+
+
+class TestFts5Query:
+    @pytest.mark.parametrize(
+        ("search", "query"),
+        [
+            ("milk", '"milk"'),
+            ("buy  milk", '"buy" OR "milk"'),
+            ('say "hi" NEAR(*', '"say" OR """hi""" OR "NEAR(*"'),
+            ("   ", '""'),
+        ],
+    )
+    def test_quotes_every_word(self, search: str, query: str):
+        assert fts5_query(search) == query
+
+
+class TestFullTextExpressions:
+    def test_mysql_match_against(self):
+        statement = (
+            select(TodosORM.id)
+            .where(fulltext_match(TodosORM.title, TodosORM.description, search="milk"))
+            .order_by(fulltext_relevance(TodosORM.title, TodosORM.description, search="milk"))
+        )
+
+        sql = str(statement.compile(dialect=mysql.dialect()))
+
+        assert sql.count("MATCH (todos.title, todos.description) AGAINST (%s IN NATURAL LANGUAGE MODE)") == 2
+
+    def test_unsupported_dialect(self):
+        statement = select(TodosORM.id).where(fulltext_match(TodosORM.title, search="milk"))
+
+        with pytest.raises(CompileError):
+            statement.compile(dialect=postgresql.dialect())
+
+    def test_statements_are_cacheable(self):
+        def statement(search: str):
+            return (
+                select(TodosORM.id)
+                .where(fulltext_match(TodosORM.title, TodosORM.description, search=search))
+                .order_by(fulltext_relevance(TodosORM.title, TodosORM.description, search=search))
+            )
+
+        # the search is a bound parameter: every search shares the compiled statement
+        cache_key = statement("milk")._generate_cache_key()
+        assert cache_key is not None
+        assert cache_key == statement("bread")._generate_cache_key()
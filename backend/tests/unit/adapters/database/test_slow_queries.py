@@ -0,0 +1,110 @@
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from todoapp.adapters.database.slow_queries import (
+    SlowQuery,
+    SlowQueryListener,
+    SlowQueryLog,
+    SlowQuerySettings,
+    redact_parameters,
+)
+
+
+def make_slow_query(duration_seconds: float) -> SlowQuery:
+    return SlowQuery(
+        statement=f"SELECT {duration_seconds}",
+        parameters=None,
+        duration_seconds=duration_seconds,
+        recorded_at=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'todos.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE todos (id INTEGER PRIMARY KEY, title VARCHAR(255))"))
+    yield engine
+    engine.dispose()
+
+
+class TestSlowQueryLog:
+    def test_keeps_worst_queries_sorted(self):
+        slow_query_log = SlowQueryLog(max_entries=3)
+        for duration_seconds in [0.5, 0.1, 0.9, 0.3, 0.7]:
+            slow_query_log.record(make_slow_query(duration_seconds))
+
+        assert [slow_query.duration_seconds for slow_query in slow_query_log.worst()] == [0.9, 0.7, 0.5]
+
+    def test_resize_drops_fastest_queries(self):
+        slow_query_log = SlowQueryLog(max_entries=3)
+        for duration_seconds in [0.5, 0.1, 0.9]:
+            slow_query_log.record(make_slow_query(duration_seconds))
+
+        slow_query_log.resize(1)
+
+        assert [slow_query.duration_seconds for slow_query in slow_query_log.worst()] == [0.9]
+
+
+class TestRedactParameters:
+    @pytest.mark.parametrize(
+        "parameters, expected",
+        [
+            (None, None),
+            ({"title": "secret", "id": 1}, {"title": "?", "id": "?"}),
+            (("secret", 1), ["?", "?"]),
+            ([("secret", 1), ("other", 2)], "2 parameter sets"),
+        ],
+    )
+    def test_values_are_never_kept(self, parameters, expected):
+        assert redact_parameters(parameters) == expected
+
+
+class TestSlowQueryListener:
+    def test_records_statements_over_threshold(self, engine):
+        slow_query_log = SlowQueryLog()
+        SlowQueryListener(settings=SlowQuerySettings(threshold_seconds=0), log=slow_query_log).attach(engine)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT * FROM todos WHERE title = :title"), {"title": "secret"})
+
+        slow_queries = slow_query_log.worst()
+        assert len(slow_queries) == 1
+        assert slow_queries[0].statement == "SELECT * FROM todos WHERE title = ?"
+        assert slow_queries[0].parameters == ["?"]
+        assert slow_queries[0].explain is None
+
+    def test_ignores_statements_under_threshold(self, engine):
+        slow_query_log = SlowQueryLog()
+        SlowQueryListener(settings=SlowQuerySettings(threshold_seconds=60), log=slow_query_log).attach(engine)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT * FROM todos"))
+
+        assert slow_query_log.worst() == []
+
+    def test_captures_explain(self, engine):
+        slow_query_log = SlowQueryLog()
+        settings = SlowQuerySettings(threshold_seconds=0, explain=True)
+        SlowQueryListener(settings=settings, log=slow_query_log).attach(engine)
+
+        with engine.connect() as connection:
+            rows = connection.execute(text("SELECT * FROM todos WHERE id = :id"), {"id": 1}).all()
+
+        assert rows == []
+        explain = slow_query_log.worst()[0].explain
+        assert explain
+        assert "todos" in " ".join(explain)
+
+    def test_failed_statements_do_not_break_timing(self, engine):
+        slow_query_log = SlowQueryLog()
+        SlowQueryListener(settings=SlowQuerySettings(threshold_seconds=0), log=slow_query_log).attach(engine)
+
+        with engine.connect() as connection:
+            with pytest.raises(Exception, match="no such table"):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT * FROM todos"))
+
+        assert [slow_query.statement for slow_query in slow_query_log.worst()] == ["SELECT * FROM todos"]
@@ -8,6 +8,11 @@ from todoapp.domain.exceptions import UnauthorizedError
 from todoapp.domain.models.user import User, UserRole
 from todoapp.domain.services.auth.auth import Auth
 from todoapp.domain.services.auth.auth_dtos import AuthTokenResultDTO, LoginDTO
+from todoapp.domain.services.auth.password_hasher import (
+    PasswordHashPolicy,
+    PasswordHasher,
+    PasswordHasherSettings,
+)
 
 if TYPE_CHECKING:
     from todoapp.config import Config
@@ -98,6 +103,25 @@ class TestLogin:
         with pytest.raises(UnauthorizedError):
             auth_service.login(login_data)
 
+    def test_rehashes_outdated_password(self, auth_service, mock_data_context, mock_user):
+        mock_user.password = PasswordHasher(
+            PasswordHasherSettings(workers=0, policy=PasswordHashPolicy(bcrypt_rounds=4))
+        ).hash(PASSWORD)
+        login_data = LoginDTO(email=mock_user.email, password=PASSWORD)
+
+        auth_service.login(login_data)
+
+        mock_data_context.users_repo.update.assert_called_once_with(mock_user)
+        assert mock_user.password.startswith("$2b$12$")
+        assert Auth.check_password(PASSWORD, mock_user.password) is True
+
+    def test_keeps_current_password_hash(self, auth_service, mock_data_context, mock_user):
+        login_data = LoginDTO(email=mock_user.email, password=PASSWORD)
+
+        auth_service.login(login_data)
+
+        mock_data_context.users_repo.update.assert_not_called()
+
 
 class TestRefreshToken:
     def test_success_when_valid_token(self, auth_service, mock_token_handler):
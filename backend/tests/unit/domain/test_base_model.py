@@ -0,0 +1,38 @@
+from todoapp.domain.models.todo import Todo
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+
+
+def make_todo() -> Todo:
+    return Todo(title="title 1", description="description", priority=5, owner_id="owner")
+
+
+def test_untracked_model_has_no_changed_fields():
+    todo = make_todo()
+
+    todo.completed = True
+
+    assert todo.changed_fields() is None
+
+
+def test_tracked_model_records_changed_fields():
+    todo = make_todo().track_changes()
+
+    todo.completed = True
+    todo.priority = 5
+
+    assert todo.changed_fields() == {"completed"}
+    assert todo.track_changes().changed_fields() == set()
+
+
+def test_tracking_does_not_affect_equality():
+    todo = make_todo()
+
+    assert todo.track_changes() == Todo(
+        title="title 1", description="description", priority=5, owner_id="owner", id=todo.id
+    )
+
+
+def test_filters_are_empty_when_no_field_is_set():
+    assert GetTodosQueryFilters().is_empty() is True
+    assert GetTodosQueryFilters(priority=1).is_empty() is False
+    assert GetTodosQueryFilters(q="title").is_empty() is False
@@ -0,0 +1,75 @@
+import base64
+from unittest.mock import patch
+
+import pytest
+
+from todoapp.domain.exceptions import BadRequestError
+from todoapp.domain.models.base_model import SortDirection
+from todoapp.domain.models.todo import Todo
+from todoapp.domain.models.user import User, UserRole
+from todoapp.domain.services.common.pagination_cursor import CursorSigner, decode_cursor, encode_cursor
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQuery
+from todoapp.domain.services.users.queries.get_users import GetUsersQuery
+
+
+@pytest.fixture
+def todo() -> Todo:
+    return Todo(title="title", description="description", priority=3, owner_id="owner")
+
+
+class TestCursor:
+    def test_roundtrip_keeps_sort_value_and_id(self, todo: Todo):
+        cursor = encode_cursor(todo, SortDirection.DESC, "priority")
+
+        keyset_cursor = decode_cursor(cursor, SortDirection.DESC, "priority")
+
+        assert keyset_cursor.last_id == todo.id
+        assert keyset_cursor.last_value == 3
+
+    def test_enum_values_are_serialized(self):
+        user = User(
+            id="id", username="user", email="user@foo.com", password="secret", role=UserRole.ADMIN, is_active=True
+        )
+
+        keyset_cursor = decode_cursor(encode_cursor(user, SortDirection.ASC, "role"), SortDirection.ASC, "role")
+
+        assert keyset_cursor.last_value == UserRole.ADMIN.value
+
+    def test_fails_when_order_changes(self, todo: Todo):
+        cursor = encode_cursor(todo, SortDirection.ASC, "title")
+
+        with pytest.raises(BadRequestError):
+            decode_cursor(cursor, SortDirection.DESC, "title")
+
+    def test_fails_when_cursor_is_tampered(self, todo: Todo):
+        payload, signature = encode_cursor(todo, SortDirection.ASC, "priority").split(".")
+        forged_payload = base64.urlsafe_b64decode(payload).replace(b'"value":3', b'"value":1')
+
+        with pytest.raises(BadRequestError):
+            decode_cursor(
+                f"{base64.urlsafe_b64encode(forged_payload).decode()}.{signature}", SortDirection.ASC, "priority"
+            )
+
+    def test_fails_when_signed_with_another_secret(self, todo: Todo):
+        cursor = encode_cursor(todo, SortDirection.ASC, "title")
+        other_signer = CursorSigner()
+        other_signer.configure("another secret")
+
+        with (
+            patch("todoapp.domain.services.common.pagination_cursor.cursor_signer", other_signer),
+            pytest.raises(BadRequestError),
+        ):
+            decode_cursor(cursor, SortDirection.ASC, "title")
+
+    @pytest.mark.parametrize("cursor", ["not a cursor", "eyJpZCI6IDF9", "eyJpZCI6IDF9.", ""])
+    def test_fails_when_invalid_cursor(self, cursor: str):
+        with pytest.raises(BadRequestError):
+            decode_cursor(cursor, SortDirection.NONE, None)
+
+
+class TestSortableFields:
+    def test_rejects_fields_outside_the_listing_ones(self):
+        with pytest.raises(BadRequestError, match="Cannot sort by 'password'"):
+            GetUsersQuery(order=SortDirection.ASC, order_by="password")
+
+        assert GetTodosQuery(order=SortDirection.ASC, order_by="priority").order_by == "priority"
@@ -0,0 +1,78 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from todoapp.domain.exceptions import ServiceUnavailableError
+from todoapp.domain.services.auth.password_hasher import (
+    PasswordHashPolicy,
+    PasswordHasher,
+    PasswordHasherSettings,
+)
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_hashes_and_verifies(workers: int):
+    password_hasher = PasswordHasher(PasswordHasherSettings(workers=workers, max_pending=1))
+
+    try:
+        hashed = password_hasher.hash("supersecret")
+
+        assert hashed != "supersecret"
+        assert password_hasher.verify("supersecret", hashed) is True
+        assert password_hasher.verify("wrongpassword", hashed) is False
+    finally:
+        password_hasher.shutdown()
+
+
+def test_sheds_hashes_past_the_pending_limit():
+    password_hasher = PasswordHasher(PasswordHasherSettings(workers=0, max_pending=1))
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash(_policy: PasswordHashPolicy, password: str) -> str:
+        started.set()
+        release.wait(timeout=5)
+        return password
+
+    with patch("todoapp.domain.services.auth.password_hasher._hash", side_effect=slow_hash):
+        in_flight = threading.Thread(target=password_hasher.hash, args=("first",))
+        in_flight.start()
+        started.wait(timeout=5)
+
+        with pytest.raises(ServiceUnavailableError):
+            password_hasher.hash("second")
+
+        release.set()
+        in_flight.join()
+        assert password_hasher.hash("third") == "third"
+
+
+@pytest.mark.parametrize(
+    ("hashed_with", "needs_update"),
+    [
+        (PasswordHashPolicy(scheme="argon2", argon2_time_cost=1, argon2_memory_cost=1024), False),
+        (PasswordHashPolicy(scheme="argon2", argon2_time_cost=2, argon2_memory_cost=1024), True),
+        (PasswordHashPolicy(scheme="argon2", argon2_time_cost=1, argon2_memory_cost=2048), True),
+        (PasswordHashPolicy(scheme="bcrypt", bcrypt_rounds=4), True),
+    ],
+)
+def test_outdated_hashes_are_verified_and_rehashed(hashed_with: PasswordHashPolicy, needs_update: bool):  # noqa: FBT001
+    policy = PasswordHashPolicy(scheme="argon2", argon2_time_cost=1, argon2_memory_cost=1024)
+    password_hasher = PasswordHasher(PasswordHasherSettings(workers=0, policy=policy))
+    hashed = PasswordHasher(PasswordHasherSettings(workers=0, policy=hashed_with)).hash("supersecret")
+
+    assert password_hasher.needs_update(hashed) is needs_update
+    assert password_hasher.verify_and_update("wrongpassword", hashed) == (False, None)
+
+    valid, updated_hash = password_hasher.verify_and_update("supersecret", hashed)
+    assert valid is True
+    if needs_update:
+        assert updated_hash.startswith("$argon2id$v=19$m=1024,t=1,p=1$")
+        assert password_hasher.needs_update(updated_hash) is False
+    else:
+        assert updated_hash is None
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError, match="scheme"):
+        PasswordHashPolicy(scheme="md5")
@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+from todoapp.domain.services.todos.todo_stats_cache import TodoStatsCache
+from todoapp.domain.services.todos.todos_dtos import TodoStatsDTO
+
+
+def make_stats(owner_id: str) -> TodoStatsDTO:
+    return TodoStatsDTO(owner_id=owner_id, total=1, completed=0, pending=1, priorities=[])
+
+
+def test_returns_stored_stats():
+    cache = TodoStatsCache()
+    cache.set("owner", make_stats("owner"), cache.generation)
+
+    assert cache.get("owner") == make_stats("owner")
+
+
+def test_invalidates_one_owner_or_every_owner():
+    cache = TodoStatsCache()
+    for owner_id in ("owner 1", "owner 2", "owner 3"):
+        cache.set(owner_id, make_stats(owner_id), cache.generation)
+
+    cache.invalidate("owner 1")
+    assert cache.get("owner 1") is None
+    assert cache.get("owner 2") is not None
+
+    cache.invalidate()
+    assert cache.get("owner 2") is None
+    assert cache.get("owner 3") is None
+
+
+def test_does_not_store_stats_computed_before_an_invalidation():
+    cache = TodoStatsCache()
+    generation = cache.generation
+
+    cache.invalidate("owner")
+    cache.set("owner", make_stats("owner"), generation)
+
+    assert cache.get("owner") is None
+
+
+def test_entries_expire():
+    cache = TodoStatsCache(ttl_seconds=30)
+    with patch("todoapp.domain.services.todos.todo_stats_cache.time.monotonic", return_value=100.0):
+        cache.set("owner", make_stats("owner"), cache.generation)
+
+    with patch("todoapp.domain.services.todos.todo_stats_cache.time.monotonic", return_value=131.0):
+        assert cache.get("owner") is None
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 from jose import jwt
@@ -6,6 +7,7 @@ from jose import jwt
 from todoapp.domain.commons.date_utils import get_utc_now
 from todoapp.domain.models.user import UserInfo
 from todoapp.domain.services.auth.token import AbstractToken, JWTToken
+from todoapp.domain.services.auth.verified_tokens_cache import VerifiedTokensCache
 
 SECRET = "supersecret"
 
@@ -59,3 +61,42 @@ class TestGetTokenData:
         decoded_data = token_handler.get_token_data(token)
 
         check_decoded_token_data(decoded_data=decoded_data, user_data=user_data, expiration=expiration)
+
+
+class TestVerifyToken:
+    @pytest.fixture
+    def token_handler(self) -> JWTToken:
+        return JWTToken(secret=SECRET, cache=VerifiedTokensCache())
+
+    def test_returns_data_of_valid_token(self, user_data, token_handler):
+        expiration = get_utc_now() + timedelta(hours=1)
+        token = token_handler.create_token(expiration_date=expiration, data=user_data.to_dict())
+
+        check_decoded_token_data(
+            decoded_data=token_handler.verify_token(token), user_data=user_data, expiration=expiration
+        )
+
+    def test_returns_none_for_invalid_or_expired_token(self, user_data, token_handler):
+        expiration = get_utc_now() - timedelta(hours=1)
+        expired_token = token_handler.create_token(expiration_date=expiration, data=user_data.to_dict())
+
+        assert token_handler.verify_token("invalid.token.value") is None
+        assert token_handler.verify_token(expired_token) is None
+
+    def test_decodes_each_token_once(self, user_data, token_handler):
+        token = token_handler.create_token(expiration_date=get_utc_now() + timedelta(hours=1), data=user_data.to_dict())
+
+        with patch("todoapp.domain.services.auth.token.jwt.decode", wraps=jwt.decode) as decode:
+            first_data = token_handler.verify_token(token)
+            first_data["roles"] = []
+            assert token_handler.verify_token(token)["email"] == user_data.email
+            assert token_handler.verify_token(token)["roles"] == [role.value for role in user_data.roles]
+
+        assert decode.call_count == 1
+
+    def test_cached_token_is_not_valid_for_another_secret(self, user_data, token_handler):
+        token = token_handler.create_token(expiration_date=get_utc_now() + timedelta(hours=1), data=user_data.to_dict())
+        assert token_handler.verify_token(token) is not None
+
+        other_token_handler = JWTToken(secret="othersecret", cache=token_handler.cache)
+        assert other_token_handler.verify_token(token) is None
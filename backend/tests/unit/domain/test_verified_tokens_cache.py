@@ -0,0 +1,26 @@
+from unittest.mock import patch
+
+from todoapp.domain.services.auth.verified_tokens_cache import VerifiedTokensCache
+
+
+def test_returns_stored_claims_until_they_expire():
+    cache = VerifiedTokensCache()
+    with patch("todoapp.domain.services.auth.verified_tokens_cache.time.time", return_value=100.0):
+        cache.set(b"token", {"user_id": "user"}, expires_at=130.0)
+        assert cache.get(b"token") == {"user_id": "user"}
+
+    with patch("todoapp.domain.services.auth.verified_tokens_cache.time.time", return_value=130.0):
+        assert cache.get(b"token") is None
+
+
+def test_drops_least_recently_used_entry():
+    cache = VerifiedTokensCache(max_entries=2)
+    with patch("todoapp.domain.services.auth.verified_tokens_cache.time.time", return_value=100.0):
+        cache.set(b"token 1", {"user_id": "user 1"}, expires_at=200.0)
+        cache.set(b"token 2", {"user_id": "user 2"}, expires_at=200.0)
+        cache.get(b"token 1")
+        cache.set(b"token 3", {"user_id": "user 3"}, expires_at=200.0)
+
+        assert cache.get(b"token 1") is not None
+        assert cache.get(b"token 2") is None
+        assert cache.get(b"token 3") is not None
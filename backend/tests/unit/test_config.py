@@ -0,0 +1,8 @@
+import pytest
+
+from todoapp.config import Config, Environment
+
+
+def test_rejects_unsupported_database_engines():
+    with pytest.raises(ValueError, match="DB_ENGINE postgresql\\+psycopg is not supported, use one of: mysql, sqlite"):
+        Config(environment=Environment(), db_engine="postgresql+psycopg")
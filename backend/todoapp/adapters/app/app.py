@@ -1,16 +1,43 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from todoapp.adapters.app.controllers.auth.auth_controller import AuthController
 from todoapp.adapters.app.controllers.barfoo.barfoo_controller import BarFooController
+from todoapp.adapters.app.controllers.database.database_controller import DatabaseController
 from todoapp.adapters.app.controllers.todos.todo_controller import TodoController
 from todoapp.adapters.app.controllers.todos.todos_controller import TodosController
 from todoapp.adapters.app.controllers.users.user_controller import UserController
 from todoapp.adapters.app.controllers.users.users_controller import UsersController
-from todoapp.adapters.app.dependencies import get_database_connector
-from todoapp.adapters.app.middlewares.exceptions_middleware import ExceptionsMiddleware
+from todoapp.adapters.app.dependencies import get_database_connector, get_rate_limiter, get_todos_archiver
+from todoapp.adapters.app.exception_handlers import ExceptionHandlers
+from todoapp.adapters.app.middlewares.rate_limit_middleware import RateLimitMiddleware
+from todoapp.adapters.database.database import dispose_shared_async_engines, dispose_shared_engines
 from todoapp.adapters.database.seed import Seed
 from todoapp.config import Config
+from todoapp.domain.services.auth.password_hasher import (
+    PasswordHashPolicy,
+    PasswordHasherSettings,
+    password_hasher,
+)
+from todoapp.domain.services.common.pagination_cursor import cursor_signer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    todos_archiver = app.state.todos_archiver
+    if todos_archiver is not None:
+        todos_archiver.start()
+
+    yield
+
+    if todos_archiver is not None:
+        await todos_archiver.stop()
+    dispose_shared_engines()
+    await dispose_shared_async_engines()
+    # the hashing workers would outlive the app otherwise
+    password_hasher.shutdown(wait=True)
 
 
 def create_app() -> FastAPI:
@@ -18,6 +45,23 @@ def create_app() -> FastAPI:
 
     database_connector = get_database_connector(config=config)
 
+    password_hasher.configure(
+        PasswordHasherSettings(
+            workers=config.password_hashing_workers,
+            max_pending=config.password_hashing_max_pending,
+            policy=PasswordHashPolicy(
+                scheme=config.password_hash_scheme,
+                bcrypt_rounds=config.password_bcrypt_rounds,
+                argon2_time_cost=config.password_argon2_time_cost,
+                argon2_memory_cost=config.password_argon2_memory_cost,
+                argon2_parallelism=config.password_argon2_parallelism,
+            ),
+        )
+    )
+
+    # every worker accepts the pagination cursors of the others
+    cursor_signer.configure(config.jwt_secret)
+
     # dev => runs migrations on startup
     # prod=> handle migrations in CI/CD.
     if not config.environment.is_production():
@@ -26,19 +70,31 @@ def create_app() -> FastAPI:
     if not config.environment.is_testing():
         Seed(config).seed()
 
-    app = FastAPI(root_path="/api/v1", title="Todos Repo API", version="0.0.1")
+    app = FastAPI(root_path="/api/v1", title="Todos Repo API", version="0.0.1", lifespan=lifespan)
+    # tests archive explicitly, never in the background
+    app.state.todos_archiver = (
+        get_todos_archiver(config) if config.todos_archive_enabled and not config.environment.is_testing() else None
+    )
+
+    # shared by RateLimitMiddleware (per IP) and Authorization (per user)
+    app.state.rate_limiter = get_rate_limiter(config)
 
     BarFooController().register_on_app(app=app, url_prefix="", tags=["Healthcheck"])
 
     AuthController().register_on_app(app=app, url_prefix="/auth", tags=["Auth"])
 
+    DatabaseController().register_on_app(app=app, url_prefix="/database", tags=["Database"])
+
     UsersController().register_on_app(app=app, url_prefix="/users", tags=["Users"])
     UserController().register_on_app(app=app, url_prefix="/user", tags=["Users"])
 
     TodoController().register_on_app(app=app, url_prefix="/todo", tags=["Todos"])
     TodosController().register_on_app(app=app, url_prefix="/todos", tags=["Todos"])
 
-    ExceptionsMiddleware().register_on_app(app=app)
+    ExceptionHandlers().register_on_app(app=app)
+
+    if app.state.rate_limiter is not None:
+        RateLimitMiddleware(app.state.rate_limiter).register_on_app(app=app)
 
     app.add_middleware(
         CORSMiddleware,
@@ -3,7 +3,9 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from todoapp.adapters.app.dependencies import get_token_handler
+from todoapp.adapters.app.dependencies import get_app_rate_limiter, get_token_handler
+from todoapp.adapters.app.rate_limiter import RateLimiter
+from todoapp.adapters.database.replicas import consistency_key
 from todoapp.domain.models.user import UserInfo, UserRole
 from todoapp.domain.services.auth.token import AbstractToken
 
@@ -13,11 +15,19 @@ class Authorization(HTTPBearer):
         super().__init__()
         self.allowed_roles: list[UserRole] = allowerd_roles if allowerd_roles else list(UserRole)
 
-    async def __call__(self, request: Request, token_handler: Annotated[AbstractToken, Depends(get_token_handler)]):
+    async def __call__(
+        self,
+        request: Request,
+        token_handler: Annotated[AbstractToken, Depends(get_token_handler)],
+        rate_limiter: Annotated[RateLimiter | None, Depends(get_app_rate_limiter)],
+    ):
         credentials: HTTPAuthorizationCredentials = await super().__call__(request)
+        user_info = self._validate_token_and_roles(token_handler, credentials)
 
-        credentials: HTTPAuthorizationCredentials = await super().__call__(request)
-        return self._validate_token_and_roles(token_handler, credentials)
+        # the requests of each user are limited here, the first place they are known
+        if rate_limiter is not None:
+            await rate_limiter.hit_user(user_info)
+        return user_info
 
     def _validate_token_and_roles(
         self, token_handler: AbstractToken, credentials: HTTPAuthorizationCredentials
@@ -25,11 +35,9 @@ class Authorization(HTTPBearer):
         if not credentials or credentials.scheme.lower() != "bearer":
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication scheme.")
 
-        if not token_handler.is_valid_token(credentials.credentials):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
-
-        token_data = token_handler.get_token_data(credentials.credentials)
-        if token_data.get("is_refresh_token"):
+        # a single decode, skipped altogether for the tokens verified recently
+        token_data = token_handler.verify_token(credentials.credentials)
+        if token_data is None or token_data.get("is_refresh_token"):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
 
         user_info = UserInfo.from_dict(token_data)
@@ -37,4 +45,6 @@ class Authorization(HTTPBearer):
         if not any(role in self.allowed_roles for role in user_info.roles):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions.")
 
+        # the user reads their own writes even when queries are served by replicas
+        consistency_key.set(str(user_info.user_id))
         return user_info
@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from enum import StrEnum
+
+from fastapi.responses import StreamingResponse
+from pydantic import Field
+
+from todoapp.adapters.app.controllers.common.conversion_api_domain import ConversionAPIDomain
+from todoapp.domain.services.todos.base_dto import BaseDTO
+
+# rows serialized into each chunk written to the response
+EXPORT_CHUNK_ROWS = 500
+
+
+class DataFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+DATA_MEDIA_TYPES = {
+    DataFormat.NDJSON: "application/x-ndjson",
+    DataFormat.CSV: "text/csv",
+}
+
+
+class ExportAPI(ConversionAPIDomain):
+    """Query parameters of an export: the format plus, in subclasses, the listing filters."""
+
+    format: DataFormat = Field(default=DataFormat.NDJSON)
+
+    def filters_to_domain(self, conversion_type: type) -> any:
+        return conversion_type(**self.model_dump(exclude={"format"}))
+
+
+async def _export_chunks(
+    rows: AsyncIterator[BaseDTO], result_api: type[ConversionAPIDomain], export_format: DataFormat
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    csv_writer = None
+    if export_format == DataFormat.CSV:
+        csv_writer = csv.DictWriter(buffer, fieldnames=list(result_api.model_fields))
+        csv_writer.writeheader()
+
+    buffered_rows = 0
+    async for row in rows:
+        row_data = result_api.from_domain(row).model_dump(mode="json")
+        if csv_writer is not None:
+            csv_writer.writerow(row_data)
+        else:
+            buffer.write(json.dumps(row_data))
+            buffer.write("\n")
+
+        buffered_rows += 1
+        if buffered_rows == EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            buffered_rows = 0
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_response(
+    rows: AsyncIterator[BaseDTO], result_api: type[ConversionAPIDomain], export_format: DataFormat, filename: str
+) -> StreamingResponse:
+    """Chunked response serializing the rows as they are read, so memory does not grow with the export size."""
+    return StreamingResponse(
+        _export_chunks(rows, result_api, export_format),
+        media_type=DATA_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
@@ -0,0 +1,107 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator, Iterable, Iterator
+
+import anyio.from_thread
+
+from todoapp.adapters.app.controllers.common.export_api import DataFormat
+from todoapp.domain.services.todos.commands.import_todos import ImportTodoRecord
+
+# longest line accepted, so a file without line breaks cannot make the import buffer it whole
+MAX_IMPORT_LINE_LENGTH = 64 * 1024
+
+
+class _UnreadableUploadError(Exception):
+    """The upload can not be parsed from this line on."""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(message)
+        self.line = line
+        self.message = message
+
+
+def blocking_iterator[T](async_iterator: AsyncIterator[T]) -> Iterator[T]:
+    """Consume an async iterator from a worker thread (ex: under run_in_threadpool), one event loop hop per item."""
+    while True:
+        try:
+            yield anyio.from_thread.run(anext, async_iterator)
+        except StopAsyncIteration:
+            return
+
+
+def _lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    # UTF-8 lines (line break included) as the body chunks arrive, whatever their boundaries
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    line_number = 1  # of the pending line
+
+    def split(text: str) -> list[str]:
+        nonlocal pending, line_number
+        *lines, pending = (pending + text).split("\n")
+        line_number += len(lines)
+        return [line + "\n" for line in lines]
+
+    for chunk in chunks:
+        try:
+            text = decoder.decode(chunk)
+        except UnicodeDecodeError as e:
+            # e.object is the chunk (after any bytes kept from the previous one): the lines before the error still count
+            yield from split(e.object[: e.start].decode())
+            raise _UnreadableUploadError(line_number, "Invalid UTF-8") from e
+
+        yield from split(text)
+        if len(pending) > MAX_IMPORT_LINE_LENGTH:
+            raise _UnreadableUploadError(line_number, f"Lines must not exceed {MAX_IMPORT_LINE_LENGTH} characters")
+
+    try:
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        raise _UnreadableUploadError(line_number, "Invalid UTF-8") from e
+    if pending:
+        yield pending
+
+
+def _ndjson_records(lines: Iterator[str]) -> Iterator[ImportTodoRecord]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ImportTodoRecord(line=line_number, error=f"Invalid JSON: {e.msg}")
+            continue
+
+        if not isinstance(fields, dict):
+            yield ImportTodoRecord(line=line_number, error="Expected a JSON object")
+            continue
+
+        yield ImportTodoRecord(line=line_number, fields=fields)
+
+
+def _csv_records(lines: Iterator[str]) -> Iterator[ImportTodoRecord]:
+    # the first row is the header with the field names
+    reader = csv.DictReader(lines)
+    try:
+        for fields in reader:
+            yield ImportTodoRecord(line=reader.line_num, fields=fields)
+    except csv.Error as e:
+        raise _UnreadableUploadError(reader.line_num, f"Invalid CSV: {e}") from e
+
+
+def _until_unreadable(records: Iterator[ImportTodoRecord]) -> Iterator[ImportTodoRecord]:
+    try:
+        yield from records
+    except _UnreadableUploadError as e:
+        # the chunks before are already committed: the import stops here and reports how far it got
+        yield ImportTodoRecord(line=e.line, error=e.message, stops_import=True)
+
+
+def parse_records(chunks: Iterable[bytes], data_format: DataFormat) -> Iterator[ImportTodoRecord]:
+    """Records of an NDJSON or CSV upload, parsed incrementally from its body chunks."""
+    lines = _lines(chunks)
+    if data_format == DataFormat.CSV:
+        return _until_unreadable(_csv_records(lines))
+
+    return _until_unreadable(_ndjson_records(lines))
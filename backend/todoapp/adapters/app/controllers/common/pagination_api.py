@@ -12,9 +12,10 @@ T = TypeVar("T")
 
 class PaginationResultAPI[T](ConversionAPIDomain):
     page: int
-    total_items: int
+    total_items: int | None
     page_items: int
     items: list[T]
+    next_cursor: str | None = None
 
 
 class PaginationAPI(ConversionAPIDomain):
@@ -22,7 +23,9 @@ class PaginationAPI(ConversionAPIDomain):
     order_by: str | None = Field(default=None)
     page: int = Field(default=1, ge=1)
     items: int = Field(default=100, ge=1, le=100)
+    cursor: str | None = Field(default=None, description="next_cursor of the previous page (ignores page)")
 
 
 class PaginationFiltersAPI[T](PaginationAPI):
     filters: T | None = Field(default=None)
+    include_total: bool = Field(default=True, description="false skips counting (total_items is null)")
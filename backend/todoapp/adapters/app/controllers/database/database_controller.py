@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Annotated, Any
+
+import attrs
+from fastapi import APIRouter, Depends, status
+
+from todoapp.adapters.app.controllers.common.authorization import Authorization
+from todoapp.adapters.app.controllers.common.base_controller import BaseController
+from todoapp.adapters.app.controllers.common.conversion_api_domain import ConversionAPIDomain
+from todoapp.adapters.app.dependencies import get_database_connector
+from todoapp.adapters.database.database import DatabaseConnector
+from todoapp.domain.models.user import UserRole
+
+
+class PoolStatisticsAPI(ConversionAPIDomain):
+    pool_size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    avg_wait_seconds: float
+
+
+class SlowQueryAPI(ConversionAPIDomain):
+    statement: str
+    parameters: Any
+    duration_seconds: float
+    recorded_at: datetime
+    explain: list[str] | None
+
+
+@attrs.define
+class DatabaseController(BaseController):
+    def _add_url_rules(self, controller: APIRouter) -> None:
+        @controller.get(
+            "/pool",
+            status_code=status.HTTP_200_OK,
+            dependencies=[Depends(Authorization([UserRole.ADMIN]))],
+        )
+        def get_pool_statistics(
+            database_connector: Annotated[DatabaseConnector, Depends(get_database_connector)],
+        ) -> PoolStatisticsAPI:
+            pool_statistics = database_connector.pool_statistics()
+            return PoolStatisticsAPI(
+                **attrs.asdict(pool_statistics),
+                avg_wait_seconds=pool_statistics.avg_wait_seconds,
+            )
+
+        @controller.get(
+            "/slow-queries",
+            status_code=status.HTTP_200_OK,
+            dependencies=[Depends(Authorization([UserRole.ADMIN]))],
+        )
+        def get_slow_queries(
+            database_connector: Annotated[DatabaseConnector, Depends(get_database_connector)],
+        ) -> list[SlowQueryAPI]:
+            return [SlowQueryAPI.from_domain(slow_query) for slow_query in database_connector.slow_queries()]
@@ -1,3 +1,4 @@
+import uuid
 from typing import Annotated
 
 import attrs
@@ -31,6 +32,12 @@ class EditTodoAPI(ConversionAPIDomain):
     completed: bool = Field()
 
 
+class PatchTodoAPI(ConversionAPIDomain):
+    description: str | None = Field(default=None, min_length=3)
+    priority: int | None = Field(default=None, gt=0, le=10)
+    completed: bool | None = Field(default=None)
+
+
 @attrs.define
 class TodoController(BaseController):
     def _add_url_rules(self, controller: APIRouter) -> None:
@@ -52,12 +59,31 @@ class TodoController(BaseController):
             status_code=status.HTTP_200_OK,
         )
         def edit_todo(
+            todo_id: uuid.UUID,
             edit_todo_data: EditTodoAPI,
-            todo: Annotated[TodoDTO, Depends(get_authorized_todo_or_404)],
             todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
         ) -> TodoResultAPI:
             edit_todo_command: EditTodoCommand = edit_todo_data.to_domain(EditTodoCommand)
-            edit_todo_command.id = todo.id
+            edit_todo_command.id = todo_id
+            if not current_user.is_admin():
+                edit_todo_command.owner_id = current_user.user_id
+            return todos_service.edit_todo(edit_todo_command=edit_todo_command)
+
+        @controller.patch(
+            "/{todo_id}",
+            status_code=status.HTTP_200_OK,
+        )
+        def patch_todo(
+            todo_id: uuid.UUID,
+            patch_todo_data: PatchTodoAPI,
+            todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
+        ) -> TodoResultAPI:
+            edit_todo_command: EditTodoCommand = patch_todo_data.to_domain(EditTodoCommand)
+            edit_todo_command.id = todo_id
+            if not current_user.is_admin():
+                edit_todo_command.owner_id = current_user.user_id
             return todos_service.edit_todo(edit_todo_command=edit_todo_command)
 
         @controller.delete(
@@ -65,16 +91,20 @@ class TodoController(BaseController):
             status_code=status.HTTP_204_NO_CONTENT,
         )
         def delete_todo(
-            todo: Annotated[TodoDTO, Depends(get_authorized_todo_or_404)],
+            todo_id: uuid.UUID,
             todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
         ):
-            todos_service.delete_todo(delete_todo_command=DeleteTodoCommand(id=todo.id))
+            delete_todo_command = DeleteTodoCommand(id=todo_id)
+            if not current_user.is_admin():
+                delete_todo_command.owner_id = current_user.user_id
+            todos_service.delete_todo(delete_todo_command=delete_todo_command)
 
         @controller.get(
             "/{todo_id}",
             status_code=status.HTTP_200_OK,
         )
-        def get_todo(
+        async def get_todo(
             todo: Annotated[TodoDTO, Depends(get_authorized_todo_or_404)],
         ) -> TodoResultAPI:
             return TodoResultAPI.from_domain(todo)
@@ -9,3 +9,48 @@ class TodoResultAPI(ConversionAPIDomain):
     description: str
     priority: int
     completed: bool
+
+
+class AddTodosFailureAPI(ConversionAPIDomain):
+    index: int
+    title: str
+    message: str
+
+
+class AddTodosResultAPI(ConversionAPIDomain):
+    created: list[TodoResultAPI]
+    failed: list[AddTodosFailureAPI]
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+class ImportTodosErrorAPI(ConversionAPIDomain):
+    line: int
+    message: str
+
+
+class ImportTodosResultAPI(ConversionAPIDomain):
+    lines: int
+    imported: int
+    failed: int
+    errors: list[ImportTodosErrorAPI]
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+class TodosAffectedResultAPI(ConversionAPIDomain):
+    affected: int
+
+
+class TodoPriorityStatsAPI(ConversionAPIDomain):
+    priority: int
+    completed: int
+    pending: int
+
+
+class TodoStatsResultAPI(ConversionAPIDomain):
+    owner_id: uuid.UUID
+    total: int
+    completed: int
+    pending: int
+    priorities: list[TodoPriorityStatsAPI]
@@ -1,15 +1,34 @@
+import uuid
 from typing import Annotated
 
 import attrs
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import Field, StringConstraints
+from starlette.concurrency import run_in_threadpool
 
 from todoapp.adapters.app.controllers.common.authorization import Authorization
 from todoapp.adapters.app.controllers.common.base_controller import BaseController
 from todoapp.adapters.app.controllers.common.conversion_api_domain import ConversionAPIDomain
+from todoapp.adapters.app.controllers.common.export_api import DATA_MEDIA_TYPES, DataFormat, ExportAPI, export_response
+from todoapp.adapters.app.controllers.common.import_api import blocking_iterator, parse_records
 from todoapp.adapters.app.controllers.common.pagination_api import PaginationFiltersAPI, PaginationResultAPI
-from todoapp.adapters.app.controllers.todos.todo_result_api import TodoResultAPI
+from todoapp.adapters.app.controllers.todos.todo_controller import AddTodoAPI
+from todoapp.adapters.app.controllers.todos.todo_result_api import (
+    AddTodosResultAPI,
+    ImportTodosResultAPI,
+    TodoResultAPI,
+    TodoStatsResultAPI,
+    TodosAffectedResultAPI,
+)
 from todoapp.adapters.app.dependencies import get_todos_service
 from todoapp.domain.models.user import UserInfo, UserRole
+from todoapp.domain.services.todos.commands.add_todos import MAX_BULK_TODOS, AddTodosCommand
+from todoapp.domain.services.todos.commands.delete_todos import DeleteTodosCommand
+from todoapp.domain.services.todos.commands.edit_todos import EditTodosCommand
+from todoapp.domain.services.todos.commands.import_todos import ImportTodosCommand
+from todoapp.domain.services.todos.queries.export_todos import ExportTodosQuery
+from todoapp.domain.services.todos.queries.get_todo_stats import GetTodoStatsQuery
 from todoapp.domain.services.todos.queries.get_todos import GetTodosQuery, GetTodosQueryFilters
 from todoapp.domain.services.todos.todos_service import TodosService
 
@@ -17,6 +36,32 @@ from todoapp.domain.services.todos.todos_service import TodosService
 class GetTodosFiltersAPI(ConversionAPIDomain):
     priority: int | None = None
     owner_id: str | None = None  # Admin user can filter by owner
+    # full-text search over title and description; without an order, results come best match first
+    q: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)] | None = None
+
+
+class GetTodosAPI(PaginationFiltersAPI[GetTodosFiltersAPI]):
+    include_archived: bool = Field(default=False, description="also list the archived (long completed) todos")
+
+
+class ExportTodosAPI(ExportAPI, GetTodosFiltersAPI):
+    pass
+
+
+class AddTodosAPI(ConversionAPIDomain):
+    todos: list[AddTodoAPI] = Field(min_length=1, max_length=MAX_BULK_TODOS)
+
+
+class DeleteTodosAPI(ConversionAPIDomain):
+    # either explicit ids or the same filters used for listing (both are combined when given)
+    ids: list[uuid.UUID] | None = Field(default=None, min_length=1, max_length=MAX_BULK_TODOS)
+    filters: GetTodosFiltersAPI | None = Field(default=None)
+
+
+class EditTodosAPI(DeleteTodosAPI):
+    description: str | None = Field(default=None, min_length=3)
+    priority: int | None = Field(default=None, gt=0, le=10)
+    completed: bool | None = Field(default=None)
 
 
 @attrs.define
@@ -26,8 +71,8 @@ class TodosController(BaseController):
             "/",
             status_code=status.HTTP_200_OK,
         )
-        def get_todos(
-            body: PaginationFiltersAPI[GetTodosFiltersAPI],
+        async def get_todos(
+            body: GetTodosAPI,
             todos_service: Annotated[TodosService, Depends(get_todos_service)],
             current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
         ) -> PaginationResultAPI[TodoResultAPI]:
@@ -39,5 +84,110 @@ class TodosController(BaseController):
             if not current_user.is_admin():
                 get_todos_query.filters.owner_id = current_user.user_id
 
-            todos = todos_service.get_todos(get_todos_query=get_todos_query)
+            todos = await todos_service.get_todos(get_todos_query=get_todos_query)
             return PaginationResultAPI.from_domain(todos)
+
+        @controller.get(
+            "/stats",
+            status_code=status.HTTP_200_OK,
+        )
+        async def get_todo_stats(
+            todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
+            owner_id: Annotated[
+                uuid.UUID | None, Query(description="Admin user can get the stats of any owner")
+            ] = None,
+        ) -> TodoStatsResultAPI:
+            if owner_id is None or not current_user.is_admin():
+                owner_id = current_user.user_id
+
+            todo_stats = await todos_service.get_todo_stats(get_todo_stats_query=GetTodoStatsQuery(owner_id=owner_id))
+            return TodoStatsResultAPI.from_domain(todo_stats)
+
+        @controller.get(
+            "/export",
+            status_code=status.HTTP_200_OK,
+            response_class=StreamingResponse,
+        )
+        async def export_todos(
+            export_todos_data: Annotated[ExportTodosAPI, Query()],
+            todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
+        ) -> StreamingResponse:
+            export_todos_query = ExportTodosQuery(filters=export_todos_data.filters_to_domain(GetTodosQueryFilters))
+
+            if not current_user.is_admin():
+                export_todos_query.filters.owner_id = current_user.user_id
+
+            todos = todos_service.export_todos(export_todos_query=export_todos_query)
+            return export_response(todos, TodoResultAPI, export_todos_data.format, filename="todos")
+
+        @controller.post(
+            "/bulk",
+            status_code=status.HTTP_200_OK,
+        )
+        def add_todos(
+            add_todos_data: AddTodosAPI,
+            todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
+        ) -> AddTodosResultAPI:
+            add_todos_command: AddTodosCommand = add_todos_data.to_domain(AddTodosCommand)
+            add_todos_command.owner_id = current_user.user_id
+            return AddTodosResultAPI.from_domain(todos_service.add_todos(add_todos_command=add_todos_command))
+
+        @controller.post(
+            "/import",
+            status_code=status.HTTP_200_OK,
+            openapi_extra={
+                "requestBody": {
+                    "content": {media_type: {"schema": {"type": "string"}} for media_type in DATA_MEDIA_TYPES.values()}
+                }
+            },
+        )
+        async def import_todos(
+            request: Request,
+            todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
+            data_format: Annotated[DataFormat, Query(alias="format")] = DataFormat.NDJSON,
+        ) -> ImportTodosResultAPI:
+            # the body is parsed while it is received, in the worker thread running the import
+            records = parse_records(blocking_iterator(request.stream()), data_format)
+            import_todos_command = ImportTodosCommand(records=records)
+            import_todos_command.owner_id = current_user.user_id
+
+            import_todos = await run_in_threadpool(
+                todos_service.import_todos, import_todos_command=import_todos_command
+            )
+            return ImportTodosResultAPI.from_domain(import_todos)
+
+        @controller.patch(
+            "/bulk",
+            status_code=status.HTTP_200_OK,
+        )
+        def edit_todos(
+            edit_todos_data: EditTodosAPI,
+            todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
+        ) -> TodosAffectedResultAPI:
+            edit_todos_command: EditTodosCommand = edit_todos_data.to_domain(EditTodosCommand)
+            if not current_user.is_admin():
+                edit_todos_command.owner_id = current_user.user_id
+
+            return TodosAffectedResultAPI.from_domain(todos_service.edit_todos(edit_todos_command=edit_todos_command))
+
+        @controller.delete(
+            "/bulk",
+            status_code=status.HTTP_200_OK,
+        )
+        def delete_todos(
+            delete_todos_data: DeleteTodosAPI,
+            todos_service: Annotated[TodosService, Depends(get_todos_service)],
+            current_user: Annotated[UserInfo, Depends(Authorization([UserRole.ADMIN, UserRole.NORMAL]))],
+        ) -> TodosAffectedResultAPI:
+            delete_todos_command: DeleteTodosCommand = delete_todos_data.to_domain(DeleteTodosCommand)
+            if not current_user.is_admin():
+                delete_todos_command.owner_id = current_user.user_id
+
+            return TodosAffectedResultAPI.from_domain(
+                todos_service.delete_todos(delete_todos_command=delete_todos_command)
+            )
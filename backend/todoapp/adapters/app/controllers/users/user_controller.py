@@ -78,9 +78,9 @@ class UserController(BaseController):
             status_code=status.HTTP_200_OK,
             dependencies=[Depends(Authorization([UserRole.ADMIN]))],
         )
-        def get_user(
+        async def get_user(
             user_id: uuid.UUID,
             users_service: Annotated[UsersService, Depends(get_users_service)],
         ) -> UserResultAPI:
-            user: UserDTO = users_service.get_user(get_user_query=GetUserQuery(id=user_id))
+            user: UserDTO = await users_service.get_user(get_user_query=GetUserQuery(id=user_id))
             return UserResultAPI.from_domain(user)
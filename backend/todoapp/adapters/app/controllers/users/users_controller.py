@@ -1,16 +1,20 @@
 from typing import Annotated
 
 import attrs
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BeforeValidator
 
 from todoapp.adapters.app.controllers.common.authorization import Authorization
 from todoapp.adapters.app.controllers.common.base_controller import BaseController
 from todoapp.adapters.app.controllers.common.conversion_api_domain import ConversionAPIDomain
+from todoapp.adapters.app.controllers.common.export_api import ExportAPI, export_response
 from todoapp.adapters.app.controllers.common.pagination_api import PaginationFiltersAPI, PaginationResultAPI
 from todoapp.adapters.app.controllers.users.user_result_api import UserResultAPI
 from todoapp.adapters.app.dependencies import get_users_service
 from todoapp.domain.models.user import UserRole
-from todoapp.domain.services.users.queries.get_users import GetUsersQuery
+from todoapp.domain.services.users.queries.export_users import ExportUsersQuery
+from todoapp.domain.services.users.queries.get_users import GetUsersQuery, GetUsersQueryFilters
 from todoapp.domain.services.users.users_service import UsersService
 
 
@@ -20,6 +24,11 @@ class GetUsersFiltersAPI(ConversionAPIDomain):
     roles: list[UserRole] | None = None
 
 
+class ExportUsersAPI(ExportAPI, GetUsersFiltersAPI):
+    # query strings carry the role values as text
+    roles: list[Annotated[UserRole, BeforeValidator(int)]] | None = None
+
+
 @attrs.define
 class UsersController(BaseController):
     def _add_url_rules(self, controller: APIRouter) -> None:
@@ -28,10 +37,24 @@ class UsersController(BaseController):
             status_code=status.HTTP_200_OK,
             dependencies=[Depends(Authorization([UserRole.ADMIN]))],
         )
-        def get_users(
+        async def get_users(
             body: PaginationFiltersAPI[GetUsersFiltersAPI],
             users_service: Annotated[UsersService, Depends(get_users_service)],
         ) -> PaginationResultAPI[UserResultAPI]:
             get_users_query = body.to_domain(GetUsersQuery)
-            users = users_service.get_users(get_users_query=get_users_query)
+            users = await users_service.get_users(get_users_query=get_users_query)
             return PaginationResultAPI.from_domain(users)
+
+        @controller.get(
+            "/export",
+            status_code=status.HTTP_200_OK,
+            response_class=StreamingResponse,
+            dependencies=[Depends(Authorization([UserRole.ADMIN]))],
+        )
+        async def export_users(
+            export_users_data: Annotated[ExportUsersAPI, Query()],
+            users_service: Annotated[UsersService, Depends(get_users_service)],
+        ) -> StreamingResponse:
+            export_users_query = ExportUsersQuery(filters=export_users_data.filters_to_domain(GetUsersQueryFilters))
+            users = users_service.export_users(export_users_query=export_users_query)
+            return export_response(users, UserResultAPI, export_users_data.format, filename="users")
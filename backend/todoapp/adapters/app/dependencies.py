@@ -1,10 +1,22 @@
 from typing import Annotated
 
+from fastapi import Request
 from fastapi.params import Depends
-
-from todoapp.adapters.database.database import DatabaseConnector
+from sqlalchemy import make_url
+
+from todoapp.adapters.app.rate_limiter import (
+    InMemoryRateLimitStore,
+    RateLimit,
+    RateLimitStore,
+    RateLimiter,
+    SharedRateLimitStore,
+)
+from todoapp.adapters.app.todos_archiver import ArchiverSettings, TodosArchiver
+from todoapp.adapters.database.database import AsyncDatabaseConnector, DatabaseConnector, PoolSettings
+from todoapp.adapters.database.replicas import ReplicaSettings
+from todoapp.adapters.database.slow_queries import SlowQuerySettings
 from todoapp.config import Config
-from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.repositories.data_context import AsyncDataContext, DataContext
 from todoapp.domain.services.auth.auth import Auth
 from todoapp.domain.services.auth.token import AbstractToken, JWTToken
 from todoapp.domain.services.todos.todos_service import TodosService
@@ -15,33 +27,93 @@ def get_config() -> Config:
     return Config()
 
 
-def get_database_connector(config: Annotated[Config, Depends(get_config)]) -> DatabaseConnector:
+def _get_db_url(config: Config, db_engine: str) -> str:
+    if config.is_sqlite():
+        return f"{db_engine}:///{config.db_name}"
+
     db_host = config.db_host if config.environment.is_testing() else "database"
     db_port = config.db_port if config.environment.is_testing() else "3306"
-    db_url = f"{config.db_engine}://{config.db_user}:{config.db_password}@{db_host}:{db_port}/{config.db_name}"
+    return f"{db_engine}://{config.db_user}:{config.db_password}@{db_host}:{db_port}/{config.db_name}"
+
+
+def _get_pool_settings(config: Config) -> PoolSettings:
+    return PoolSettings(
+        size=config.db_pool_size,
+        max_overflow=config.db_pool_max_overflow,
+        timeout_seconds=config.db_pool_timeout_seconds,
+        recycle_seconds=config.db_pool_recycle_seconds,
+        pre_ping=config.db_pool_pre_ping,
+    )
+
+
+def _get_slow_query_settings(config: Config) -> SlowQuerySettings:
+    return SlowQuerySettings(
+        threshold_seconds=config.db_slow_query_threshold_ms / 1000,
+        explain=config.db_slow_query_explain,
+        max_entries=config.db_slow_query_log_size,
+    )
 
-    database_conector = DatabaseConnector(db_url=db_url)
+
+def _get_replica_settings(config: Config, db_engine: str, *, with_replicas: bool) -> ReplicaSettings:
+    # replica urls are configured with the sync driver, the async connector swaps it for its own
+    replica_urls = [
+        make_url(replica_url).set(drivername=db_engine).render_as_string(hide_password=False)
+        for replica_url in config.db_replica_urls
+    ]
+    return ReplicaSettings(
+        urls=replica_urls if with_replicas else [],
+        read_your_writes_seconds=config.db_read_your_writes_seconds,
+    )
+
+
+def get_database_connector(config: Annotated[Config, Depends(get_config)]) -> DatabaseConnector:
+    # engines are shared by url, so building a connector per request does not open a new pool.
+    # Commands (and their reads) always run on the primary, this connector only records their writes
+    database_conector = DatabaseConnector(
+        db_url=_get_db_url(config, config.db_engine),
+        pool_settings=_get_pool_settings(config),
+        slow_query_settings=_get_slow_query_settings(config),
+        replica_settings=_get_replica_settings(config, config.db_engine, with_replicas=False),
+    )
     return database_conector
 
 
+def get_async_database_connector(config: Annotated[Config, Depends(get_config)]) -> AsyncDatabaseConnector:
+    # queries read from the replicas (if any)
+    return AsyncDatabaseConnector(
+        db_url=_get_db_url(config, config.db_async_engine),
+        pool_settings=_get_pool_settings(config),
+        slow_query_settings=_get_slow_query_settings(config),
+        replica_settings=_get_replica_settings(config, config.db_async_engine, with_replicas=True),
+    )
+
+
 def get_data_context(database_connector: Annotated[DatabaseConnector, Depends(get_database_connector)]) -> DataContext:
     return DataContext(database_connector=database_connector)
 
 
+def get_async_data_context(
+    database_connector: Annotated[AsyncDatabaseConnector, Depends(get_async_database_connector)],
+) -> AsyncDataContext:
+    return AsyncDataContext(database_connector=database_connector)
+
+
 def get_token_handler(config: Annotated[Config, Depends(get_config)]) -> AbstractToken:
     return JWTToken(config.jwt_secret)
 
 
 def get_todos_service(
     data_context: Annotated[DataContext, Depends(get_data_context)],
+    async_data_context: Annotated[AsyncDataContext, Depends(get_async_data_context)],
 ) -> TodosService:
-    return TodosService(data_context=data_context)
+    return TodosService(data_context=data_context, async_data_context=async_data_context)
 
 
 def get_users_service(
     data_context: Annotated[DataContext, Depends(get_data_context)],
+    async_data_context: Annotated[AsyncDataContext, Depends(get_async_data_context)],
 ) -> UsersService:
-    return UsersService(data_context)
+    return UsersService(data_context, async_data_context)
 
 
 def get_auth(
@@ -50,3 +122,48 @@ def get_auth(
     token_handler: Annotated[AbstractToken, Depends(get_token_handler)],
 ) -> Auth:
     return Auth(data_context=data_context, config=config, token_handler=token_handler)
+
+
+def get_todos_archiver(config: Config) -> TodosArchiver:
+    # outside of any request: each batch builds its own service, on the shared engines
+    def todos_service() -> TodosService:
+        return get_todos_service(
+            data_context=get_data_context(get_database_connector(config)),
+            async_data_context=get_async_data_context(get_async_database_connector(config)),
+        )
+
+    return TodosArchiver(
+        todos_service_factory=todos_service,
+        settings=ArchiverSettings(
+            after_days=config.todos_archive_after_days,
+            batch_size=config.todos_archive_batch_size,
+            batch_pause_seconds=config.todos_archive_batch_pause_seconds,
+            interval_seconds=config.todos_archive_interval_seconds,
+        ),
+    )
+
+
+def _get_rate_limit_store(config: Config) -> RateLimitStore:
+    if not config.rate_limit_store_url:
+        return InMemoryRateLimitStore()
+
+    # only needed by the deployments sharing the counters between workers
+    from redis.asyncio import Redis  # noqa: PLC0415
+
+    return SharedRateLimitStore(Redis.from_url(config.rate_limit_store_url))
+
+
+def get_rate_limiter(config: Config) -> RateLimiter | None:
+    if not config.rate_limit_enabled:
+        return None
+
+    return RateLimiter(
+        ip_limit=RateLimit(requests=config.rate_limit_auth_requests, window_seconds=config.rate_limit_window_seconds),
+        user_limit=RateLimit(requests=config.rate_limit_user_requests, window_seconds=config.rate_limit_window_seconds),
+        store=_get_rate_limit_store(config),
+    )
+
+
+def get_app_rate_limiter(request: Request) -> RateLimiter | None:
+    # apps built without create_app (ex: some tests) have no limits
+    return getattr(request.app.state, "rate_limiter", None)
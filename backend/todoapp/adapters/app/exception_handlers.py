@@ -0,0 +1,43 @@
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from todoapp.domain.exceptions import (
+    BadRequestError,
+    ConflictError,
+    MessageError,
+    NotFoundError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
+    UnauthorizedError,
+)
+
+# seconds a client should wait before retrying a shed request
+RETRY_AFTER_SECONDS = 1
+
+STATUS_CODES: dict[type[MessageError], int] = {
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    ConflictError: status.HTTP_409_CONFLICT,
+    UnauthorizedError: status.HTTP_401_UNAUTHORIZED,
+    BadRequestError: status.HTTP_400_BAD_REQUEST,
+    TooManyRequestsError: status.HTTP_429_TOO_MANY_REQUESTS,
+    ServiceUnavailableError: status.HTTP_503_SERVICE_UNAVAILABLE,
+}
+
+
+class ExceptionHandlers:
+    """Maps the domain exceptions to their JSON responses, raised by the routes and by the middlewares alike."""
+
+    def register_on_app(self, app: FastAPI):
+        for exception_type in STATUS_CODES:
+            app.add_exception_handler(exception_type, self.handle_message_error)
+
+    async def handle_message_error(self, request: Request, exc: MessageError) -> JSONResponse:  # noqa: ARG002
+        status_code = next(STATUS_CODES[cls] for cls in type(exc).__mro__ if cls in STATUS_CODES)
+
+        headers = None
+        if isinstance(exc, TooManyRequestsError):
+            headers = {"Retry-After": str(exc.retry_after_seconds)}
+        elif isinstance(exc, ServiceUnavailableError):
+            headers = {"Retry-After": str(RETRY_AFTER_SECONDS)}
+
+        return JSONResponse(status_code=status_code, content={"detail": {"msg": exc.message}}, headers=headers)
@@ -1,13 +1,65 @@
 import abc
+import inspect
 
 from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 class BaseMiddleware(abc.ABC):
+    """Pure ASGI middleware of the http requests.
+
+    Unlike BaseHTTPMiddleware, there is no task group nor wrapped receive per request, and streaming
+    responses go through as they are produced. The exceptions raised by middleware_process itself (ex: a
+    rejected request) get the response of the exception handler registered on the app for them, as the
+    exceptions raised by the routes do.
+    """
+
     def register_on_app(self, app: FastAPI):
-        app.add_middleware(BaseHTTPMiddleware, self.middleware_process)
+        app.add_middleware(_MiddlewareApp, middleware=self)
 
     @abc.abstractmethod
-    async def middleware_process(self, request: Request, call_next):
+    async def middleware_process(self, scope: Scope, receive: Receive, send: Send, call_next: ASGIApp):
         pass
+
+
+class _MiddlewareApp:
+    def __init__(self, app: ASGIApp, middleware: BaseMiddleware):
+        self.app = app
+        self.middleware = middleware
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracked(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.middleware.middleware_process(scope, receive, send_tracked, self.app)
+        except Exception as exc:
+            # the routes' exceptions never get here: ExceptionMiddleware, inside every middleware, handles them
+            handler = _get_exception_handler(scope["app"], exc)
+            # once the headers are out, another response would break the protocol (as in ServerErrorMiddleware)
+            if handler is None or response_started:
+                raise
+
+            request = Request(scope, receive)
+            if inspect.iscoroutinefunction(handler):
+                response = await handler(request, exc)
+            else:
+                response = await run_in_threadpool(handler, request, exc)
+            await response(scope, receive, send)
+
+
+def _get_exception_handler(app: FastAPI, exc: Exception):
+    for cls in type(exc).__mro__:
+        if cls in app.exception_handlers:
+            return app.exception_handlers[cls]
+    return None
@@ -0,0 +1,19 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from todoapp.adapters.app.middlewares.base_middleware import BaseMiddleware
+from todoapp.adapters.app.rate_limiter import RateLimiter
+
+
+class RateLimitMiddleware(BaseMiddleware):
+    """Limits the auth routes per client IP; Authorization limits the other routes per user, once it knows them."""
+
+    def __init__(self, rate_limiter: RateLimiter):
+        self.rate_limiter = rate_limiter
+
+    async def middleware_process(self, scope: Scope, receive: Receive, send: Send, call_next: ASGIApp):
+        path = scope["path"].removeprefix(scope.get("root_path", ""))
+        client = scope.get("client")
+        if client is not None and self.rate_limiter.limits_ip(path):
+            await self.rate_limiter.hit_ip(client[0])
+
+        await call_next(scope, receive, send)
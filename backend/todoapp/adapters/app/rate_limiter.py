@@ -0,0 +1,121 @@
+import abc
+import logging
+import math
+import time
+
+import attrs
+
+from todoapp.domain.exceptions import TooManyRequestsError
+from todoapp.domain.models.user import UserInfo
+
+logger = logging.getLogger(__name__)
+
+
+@attrs.define(frozen=True)
+class RateLimit:
+    requests: int  # 0 disables the limit
+    window_seconds: float = 60.0
+
+
+class RateLimitStore(abc.ABC):
+    """Hits per key in fixed windows, numbered from the epoch so every worker agrees on them."""
+
+    @abc.abstractmethod
+    async def hit(self, key: str, window: int, window_seconds: float) -> tuple[int, int]:
+        """Count a hit of key in window; returns the hits of the previous window and of this one, this hit included."""
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Counters of this worker only, so each worker of a deployment allows the whole limit on its own."""
+
+    # least recently hit keys are dropped past this many keys
+    MAX_KEYS = 100000
+
+    def __init__(self, max_keys: int = MAX_KEYS):
+        self.max_keys = max_keys
+        # key => (window, hits of the previous window, hits of this one), least recently hit first.
+        # Only touched by the event loop, between awaits, so there is no need for a lock
+        self._counters: dict[str, tuple[int, int, int]] = {}
+
+    async def hit(self, key: str, window: int, window_seconds: float) -> tuple[int, int]:  # noqa: ARG002
+        last_window, previous, current = self._counters.pop(key, (window, 0, 0))
+        if last_window != window:
+            previous, current = (current if last_window == window - 1 else 0), 0
+
+        current += 1
+        self._counters[key] = (window, previous, current)
+        if len(self._counters) > self.max_keys:
+            del self._counters[next(iter(self._counters))]
+        return previous, current
+
+
+class SharedRateLimitStore(RateLimitStore):
+    """Counters shared by every worker, kept by an async redis client (a MULTI pipeline of set, incr and get)."""
+
+    def __init__(self, client, prefix: str = "rate_limit:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def hit(self, key: str, window: int, window_seconds: float) -> tuple[int, int]:
+        current_key = f"{self.prefix}{key}:{window}"
+        # a single round trip, and the counter can't be left without expiration in between
+        async with self.client.pipeline(transaction=True) as pipeline:
+            # kept while it is the previous window of the next one
+            pipeline.set(current_key, 0, ex=math.ceil(2 * window_seconds), nx=True)
+            pipeline.incr(current_key)
+            pipeline.get(f"{self.prefix}{key}:{window - 1}")
+            _, current, previous = await pipeline.execute()
+
+        return int(previous or 0), current
+
+
+@attrs.define
+class RateLimiter:
+    """Sliding window limits per client IP (on the auth routes) and per authenticated user.
+
+    A client makes the hits of the current window plus those of the previous one, weighted by how much of it still
+    falls within the last window_seconds. Rejected hits count as well, so a client hammering the API only gets
+    through again once it slows down.
+    """
+
+    ip_limit: RateLimit
+    user_limit: RateLimit
+    store: RateLimitStore = attrs.field(factory=InMemoryRateLimitStore)
+    ip_limited_paths: tuple[str, ...] = ("/auth/",)
+
+    def limits_ip(self, path: str) -> bool:
+        return path.startswith(self.ip_limited_paths)
+
+    async def hit_ip(self, host: str):
+        await self._hit(f"ip:{host}", self.ip_limit)
+
+    async def hit_user(self, user_info: UserInfo):
+        await self._hit(f"user:{user_info.user_id}", self.user_limit)
+
+    async def _hit(self, key: str, limit: RateLimit):
+        if not limit.requests:
+            return
+
+        window, elapsed = divmod(time.time(), limit.window_seconds)
+        try:
+            previous, current = await self.store.hit(key, int(window), limit.window_seconds)
+        except Exception:
+            # an unreachable shared store must not take the whole API down with it
+            logger.exception("Could not count a hit of %s, letting it through", key)
+            return
+
+        if previous * (1 - elapsed / limit.window_seconds) + current > limit.requests:
+            retry_after_seconds = self._retry_after_seconds(limit, elapsed, previous, current)
+            raise TooManyRequestsError(
+                "Too many requests, please retry later.", retry_after_seconds=max(math.ceil(retry_after_seconds), 1)
+            )
+
+    @staticmethod
+    def _retry_after_seconds(limit: RateLimit, elapsed: float, previous: int, current: int) -> float:
+        # seconds until one more hit fits in the limit, if the client stops meanwhile
+        if current < limit.requests:
+            # this window has room left: the previous one has to fade enough
+            return limit.window_seconds * (1 - (limit.requests - current - 1) / previous) - elapsed
+
+        # the next window, where this one is the previous and fades in turn
+        return limit.window_seconds * (2 - (limit.requests - 1) / current) - elapsed
@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+import attrs
+from starlette.concurrency import run_in_threadpool
+
+from todoapp.domain.services.todos.commands.archive_todos import ARCHIVE_BATCH_SIZE, ArchiveTodosCommand
+from todoapp.domain.services.todos.todos_service import TodosService
+
+logger = logging.getLogger(__name__)
+
+
+@attrs.define
+class ArchiverSettings:
+    after_days: int = 30  # todos completed longer ago than this are archived
+    batch_size: int = ARCHIVE_BATCH_SIZE
+    batch_pause_seconds: float = 0.5
+    interval_seconds: float = 300.0  # wait once there is nothing left to archive
+
+
+@attrs.define
+class TodosArchiver:
+    """Moves the todos completed long ago to the archive in the background, one short transaction per batch.
+
+    Between batches it sleeps at least batch_pause_seconds and at least as long as the batch took, so
+    archiving never takes more than half of the primary's time and the replicas keep up with the deletes.
+    Every worker process runs its own archiver: the batches skip the rows locked by another one.
+    """
+
+    todos_service_factory: Callable[[], TodosService]
+    settings: ArchiverSettings = attrs.field(factory=ArchiverSettings)
+    _task: asyncio.Task | None = attrs.field(init=False, default=None)
+
+    def archive_batch(self) -> int:
+        completed_before = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=self.settings.after_days)
+        command = ArchiveTodosCommand(completed_before=completed_before, batch_size=self.settings.batch_size)
+        return self.todos_service_factory().archive_todos(archive_todos_command=command).affected
+
+    async def run(self):
+        while True:
+            started_at = time.monotonic()
+            try:
+                archived = await run_in_threadpool(self.archive_batch)
+            except Exception:
+                logger.exception("Could not archive the completed todos")
+                archived = 0
+            elapsed_seconds = time.monotonic() - started_at
+
+            if archived < self.settings.batch_size:
+                await asyncio.sleep(self.settings.interval_seconds)
+            else:
+                logger.info("Archived %d completed todos in %.2f s", archived, elapsed_seconds)
+                await asyncio.sleep(max(self.settings.batch_pause_seconds, elapsed_seconds))
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
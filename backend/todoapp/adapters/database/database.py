@@ -1,21 +1,191 @@
-from contextlib import contextmanager
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from contextlib import asynccontextmanager, contextmanager
 
 import attrs
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Engine, create_engine, exc
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from alembic import command
 from alembic.config import Config
+from todoapp.adapters.database.replicas import ReplicaSettings, get_read_url, record_write
+from todoapp.adapters.database.slow_queries import SlowQuery, SlowQueryListener, SlowQuerySettings, slow_query_log
+
+
+@attrs.define
+class PoolSettings:
+    size: int = 10
+    max_overflow: int = 20
+    timeout_seconds: int = 30
+    recycle_seconds: int = 1800
+    pre_ping: bool = True
+
+
+@attrs.define
+class PoolStatistics:
+    pool_size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class InstrumentedPoolMixin:
+    """Keeps track of how many checkouts a queue pool served and how long callers waited for them."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._checkout_timeouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self._checkout_timeouts += 1
+            raise
+
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self._checkouts += 1
+            self._total_wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+        return connection
+
+    def statistics(self) -> PoolStatistics:
+        with self._stats_lock:
+            return PoolStatistics(
+                pool_size=self.size(),
+                checked_in=self.checkedin(),
+                checked_out=self.checkedout(),
+                overflow=self.overflow(),
+                checkouts=self._checkouts,
+                checkout_timeouts=self._checkout_timeouts,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+            )
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _get_pool_kwargs(pool_settings: PoolSettings) -> dict:
+    return {
+        "pool_size": pool_settings.size,
+        "max_overflow": pool_settings.max_overflow,
+        "pool_timeout": pool_settings.timeout_seconds,
+        "pool_recycle": pool_settings.recycle_seconds,
+        "pool_pre_ping": pool_settings.pre_ping,
+    }
+
+
+# One engine (and therefore one connection pool) per database url for the whole process.
+# The pool and slow query settings of the first connector created for an url are the ones applied.
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_shared_engine(
+    db_url: str, pool_settings: PoolSettings, slow_query_settings: SlowQuerySettings | None = None
+) -> Engine:
+    engine = _engines.get(db_url)
+    if engine is not None:
+        return engine
+
+    with _engines_lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            engine = create_engine(
+                url=db_url,
+                echo=False,
+                poolclass=InstrumentedQueuePool,
+                **_get_pool_kwargs(pool_settings),
+            )
+            SlowQueryListener(settings=slow_query_settings or SlowQuerySettings()).attach(engine)
+            _engines[db_url] = engine
+
+    return engine
+
+
+# Async connections are bound to the event loop that opened them, so async engines are shared by url per loop.
+# Production runs a single loop; tests (ex: TestClient) may run several ones.
+_async_engines: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncEngine]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_async_engine(
+    db_url: str, pool_settings: PoolSettings, slow_query_settings: SlowQuerySettings | None = None
+) -> AsyncEngine:
+    loop_engines = _async_engines.setdefault(asyncio.get_running_loop(), {})
+
+    engine = loop_engines.get(db_url)
+    if engine is None:
+        engine = create_async_engine(
+            url=db_url,
+            echo=False,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **_get_pool_kwargs(pool_settings),
+        )
+        # cursor events are only emitted by the sync engine the async one wraps
+        SlowQueryListener(settings=slow_query_settings or SlowQuerySettings()).attach(engine.sync_engine)
+        loop_engines[db_url] = engine
+
+    return engine
+
+
+def dispose_shared_engines():
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+async def dispose_shared_async_engines():
+    loop_engines = _async_engines.pop(asyncio.get_running_loop(), {})
+    for engine in loop_engines.values():
+        await engine.dispose()
 
 
 @attrs.define
 class DatabaseConnector:
     db_url: str = attrs.field(init=True)
+    pool_settings: PoolSettings = attrs.field(init=True, factory=PoolSettings)
+    slow_query_settings: SlowQuerySettings = attrs.field(init=True, factory=SlowQuerySettings)
+    replica_settings: ReplicaSettings = attrs.field(init=True, factory=ReplicaSettings)
     engine: Engine = attrs.field(init=False)
     SessionLocal: sessionmaker = attrs.field(init=False)
+    # session of the unit of work in progress, if any (connectors are built per request, never shared by threads)
+    _unit_of_work_session: Session | None = attrs.field(init=False, default=None)
+    _after_commit_callbacks: list[Callable[[], None]] = attrs.field(init=False, factory=list)
 
     def __attrs_post_init__(self):
-        self.engine = create_engine(url=self.db_url, echo=False)
+        self.engine = get_shared_engine(
+            db_url=self.db_url, pool_settings=self.pool_settings, slow_query_settings=self.slow_query_settings
+        )
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=True, bind=self.engine)
 
     def migrate(self):
@@ -25,18 +195,111 @@ class DatabaseConnector:
 
         command.upgrade(alembic_cfg, "head")
 
-    def get_new_connection(self):
-        return self.SessionLocal()
+    def get_new_connection(self, *, read_only: bool = False):
+        db_url = get_read_url(self.db_url, self.replica_settings) if read_only else self.db_url
+        if db_url == self.db_url:
+            return self.SessionLocal()
+
+        engine = get_shared_engine(
+            db_url=db_url, pool_settings=self.pool_settings, slow_query_settings=self.slow_query_settings
+        )
+        return Session(bind=engine, autoflush=True)
+
+    def pool_statistics(self) -> PoolStatistics:
+        return self.engine.pool.statistics()
+
+    def slow_queries(self) -> list[SlowQuery]:
+        return slow_query_log.worst()
+
+    @contextmanager
+    def unit_of_work(self):
+        """Share one session (and transaction) between every session_scope opened inside it, committing once."""
+        if self._unit_of_work_session is not None:
+            yield self._unit_of_work_session
+            return
+
+        try:
+            with self.session_scope() as session:
+                self._unit_of_work_session = session
+                try:
+                    yield session
+                finally:
+                    self._unit_of_work_session = None
+
+            for callback in self._after_commit_callbacks:
+                callback()
+        finally:
+            self._after_commit_callbacks.clear()
+
+    def after_commit(self, callback: Callable[[], None]):
+        """Run the callback when the unit of work in progress commits, never if it rolls back (now outside one)."""
+        if self._unit_of_work_session is None:
+            callback()
+            return
+
+        self._after_commit_callbacks.append(callback)
 
     @contextmanager
-    def session_scope(self):
-        session = self.get_new_connection()
+    def session_scope(self, *, read_only: bool = False):
+        """Session on the primary, or on a replica for read_only ones (unless the caller wrote recently)."""
+        if self._unit_of_work_session is not None:
+            # the unit of work commits (or rolls back) when it ends
+            yield self._unit_of_work_session
+            return
+
+        session = self.get_new_connection(read_only=read_only)
 
         try:
             yield session
             session.commit()
+            if not read_only:
+                record_write(self.replica_settings)
         except:
             session.rollback()
             raise
         finally:
             session.close()
+
+
+@attrs.define
+class AsyncDatabaseConnector:
+    db_url: str = attrs.field(init=True)
+    pool_settings: PoolSettings = attrs.field(init=True, factory=PoolSettings)
+    slow_query_settings: SlowQuerySettings = attrs.field(init=True, factory=SlowQuerySettings)
+    replica_settings: ReplicaSettings = attrs.field(init=True, factory=ReplicaSettings)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        # resolved lazily because the engine belongs to the running event loop
+        return get_shared_async_engine(
+            db_url=self.db_url, pool_settings=self.pool_settings, slow_query_settings=self.slow_query_settings
+        )
+
+    def get_new_connection(self, *, read_only: bool = False) -> AsyncSession:
+        db_url = get_read_url(self.db_url, self.replica_settings) if read_only else self.db_url
+        engine = get_shared_async_engine(
+            db_url=db_url, pool_settings=self.pool_settings, slow_query_settings=self.slow_query_settings
+        )
+        return AsyncSession(bind=engine, autoflush=True, expire_on_commit=False)
+
+    def pool_statistics(self) -> PoolStatistics:
+        return self.engine.pool.statistics()
+
+    def slow_queries(self) -> list[SlowQuery]:
+        return slow_query_log.worst()
+
+    @asynccontextmanager
+    async def session_scope(self, *, read_only: bool = False):
+        """Session on the primary, or on a replica for read_only ones (unless the caller wrote recently)."""
+        session = self.get_new_connection(read_only=read_only)
+
+        try:
+            yield session
+            await session.commit()
+            if not read_only:
+                record_write(self.replica_settings)
+        except:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
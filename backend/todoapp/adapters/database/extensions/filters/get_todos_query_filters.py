@@ -1,5 +1,6 @@
 from sqlalchemy import and_
 
+from todoapp.adapters.database.fulltext import fulltext_match, fulltext_relevance
 from todoapp.adapters.database.models import TodosORM
 from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
 
@@ -13,7 +14,18 @@ def get_predicate(self: GetTodosQueryFilters):
     if self.owner_id is not None:
         filter_conditions.append(TodosORM.owner_id == self.owner_id)
 
+    if self.q is not None:
+        filter_conditions.append(fulltext_match(TodosORM.title, TodosORM.description, search=self.q))
+
     return and_(*filter_conditions) if len(filter_conditions) > 0 else None
 
 
+def get_ranking(self: GetTodosQueryFilters):
+    if self.q is None:
+        return None
+
+    return fulltext_relevance(TodosORM.title, TodosORM.description, search=self.q)
+
+
 GetTodosQueryFilters.get_predicate = get_predicate
+GetTodosQueryFilters.get_ranking = get_ranking
@@ -1,17 +1,35 @@
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select
 
-from todoapp.adapters.database.models import UsersORM
+from todoapp.adapters.database.models import UserSearchGramsORM, UsersORM
+from todoapp.adapters.database.trigrams import trigrams
 from todoapp.domain.services.users.queries.get_users import GetUsersQueryFilters
 
 
+def _substring_condition(column, value: str):
+    condition = func.lower(column).ilike(f"%{value.lower()}%")
+
+    grams = trigrams(value)
+    if not grams:
+        return condition
+
+    # index lookups for the users holding every trigram of the value, then the substring check on those only
+    candidates = (
+        select(UserSearchGramsORM.user_id)
+        .where(UserSearchGramsORM.field == column.key, UserSearchGramsORM.gram.in_(sorted(grams)))
+        .group_by(UserSearchGramsORM.user_id)
+        .having(func.count() == len(grams))
+    )
+    return and_(UsersORM.id.in_(candidates), condition)
+
+
 def get_predicate(self: GetUsersQueryFilters):
     filter_conditions = []
 
     if self.username is not None:
-        filter_conditions.append(func.lower(UsersORM.username).ilike(f"%{self.username.lower()}%"))
+        filter_conditions.append(_substring_condition(UsersORM.username, self.username))
 
     if self.email is not None:
-        filter_conditions.append(func.lower(UsersORM.email).ilike(f"%{self.email.lower()}%"))
+        filter_conditions.append(_substring_condition(UsersORM.email, self.email))
 
     if self.roles is not None:
         filter_conditions.append(UsersORM.role.in_([role.value for role in self.roles]))
@@ -0,0 +1,122 @@
+"""Full-text search expressions compiled per dialect.
+
+MySQL matches and ranks with its FULLTEXT indexes (MATCH ... AGAINST in natural language mode).
+SQLite has no FULLTEXT indexes, so a table is searched through an external content FTS5 table
+named <table>_fts, indexing the same columns and kept in sync by triggers (see fts5_ddl).
+Other dialects are not supported.
+"""
+
+from sqlalchemy import Float, String, bindparam
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import Boolean, TypeDecorator
+
+
+def fts5_query(search: str) -> str:
+    """Search text as an FTS5 query: every word quoted (so its syntax is never interpreted) and OR'ed."""
+    terms = ['"{}"'.format(term.replace('"', '""')) for term in search.split()]
+    return " OR ".join(terms) or '""'
+
+
+def fts5_ddl(table: str, columns: tuple[str, ...]) -> list[str]:
+    """Statements creating the FTS5 table indexing table(columns) and the triggers keeping it up to date.
+
+    The FTS5 rows are keyed by the rowid of the table. A VACUUM may renumber the rowids of tables without
+    an INTEGER PRIMARY KEY, so rebuild the index afterwards: INSERT INTO <table>_fts(<table>_fts) VALUES ('rebuild').
+    """
+    fts_table = f"{table}_fts"
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});"  # noqa: S608
+    )
+    insert_new = f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});"  # noqa: S608
+
+    return [
+        f"CREATE VIRTUAL TABLE {fts_table} USING fts5({column_list}, content='{table}')",
+        f"CREATE TRIGGER {fts_table}_after_insert AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts_table}_after_delete AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts_table}_after_update AFTER UPDATE OF {column_list} ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+class SearchText(TypeDecorator):
+    """The search text as bound: FTS5 queries have their own syntax, MySQL natural language mode takes it as is."""
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and dialect.name == "sqlite":
+            return fts5_query(value)
+        return value
+
+
+class _FullTextFunction(FunctionElement):
+    inherit_cache = True
+
+    def __init__(self, *columns, search: str):
+        super().__init__(*columns, bindparam(None, search, type_=SearchText()))
+
+    @property
+    def columns_and_search(self) -> tuple[list, object]:
+        *columns, search = self.clauses
+        return columns, search
+
+
+class fulltext_match(_FullTextFunction):  # noqa: N801
+    """True for the rows whose columns match any word of the search text."""
+
+    inherit_cache = True
+    name = "fulltext_match"
+    type = Boolean()
+
+
+class fulltext_relevance(_FullTextFunction):  # noqa: N801
+    """How well the columns of a row match the search text, the higher the better."""
+
+    inherit_cache = True
+    name = "fulltext_relevance"
+    type = Float()
+
+
+def _sqlite_fts_table(element: _FullTextFunction, compiler) -> tuple[str, str]:
+    columns, _ = element.columns_and_search
+    table = compiler.preparer.format_table(columns[0].table)
+    return table, compiler.preparer.quote(f"{columns[0].table.name}_fts")
+
+
+@compiles(fulltext_match, "mysql")
+@compiles(fulltext_relevance, "mysql")
+def _compile_mysql(element: _FullTextFunction, compiler, **kw) -> str:
+    # the same expression filters (non zero) and ranks, and MySQL evaluates it once per row
+    columns, search = element.columns_and_search
+    column_list = ", ".join(compiler.process(column, **kw) for column in columns)
+    return f"MATCH ({column_list}) AGAINST ({compiler.process(search, **kw)} IN NATURAL LANGUAGE MODE)"
+
+
+@compiles(fulltext_match, "sqlite")
+def _compile_sqlite_match(element: fulltext_match, compiler, **kw) -> str:
+    _, search = element.columns_and_search
+    table, fts_table = _sqlite_fts_table(element, compiler)
+    return f"{table}.rowid IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH {compiler.process(search, **kw)})"  # noqa: S608
+
+
+@compiles(fulltext_relevance, "sqlite")
+def _compile_sqlite_relevance(element: fulltext_relevance, compiler, **kw) -> str:
+    # bm25 is lower for better matches
+    _, search = element.columns_and_search
+    table, fts_table = _sqlite_fts_table(element, compiler)
+    return (
+        f"(SELECT -bm25({fts_table}) FROM {fts_table} "  # noqa: S608
+        f"WHERE {fts_table} MATCH {compiler.process(search, **kw)} AND {fts_table}.rowid = {table}.rowid)"
+    )
+
+
+@compiles(fulltext_match)
+@compiles(fulltext_relevance)
+def _compile_unsupported(element: _FullTextFunction, compiler, **kw):  # noqa: ARG001
+    raise CompileError(f"Full-text search is not supported on {compiler.dialect.name}")
@@ -1,6 +1,10 @@
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import DDL, Boolean, DateTime, ForeignKey, Index, Integer, String, event
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from todoapp.adapters.database.fulltext import fts5_ddl
 from todoapp.domain.models.user import UserRole
 
 
@@ -11,7 +15,7 @@ class BaseORM(DeclarativeBase):
 class UsersORM(BaseORM):
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
     email: Mapped[str] = mapped_column(String(320), unique=True)
     username: Mapped[str] = mapped_column(String(50), unique=True)
     password: Mapped[str] = mapped_column(String(255))
@@ -19,12 +23,80 @@ class UsersORM(BaseORM):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
 
+class UserSearchGramsORM(BaseORM):
+    """Trigrams of the searchable fields of every user, maintained by the users repository on every write."""
+
+    __tablename__ = "user_search_grams"
+    __table_args__ = (Index("ix_user_search_grams_user_id", "user_id"),)
+
+    field: Mapped[str] = mapped_column(String(16), primary_key=True)
+    # compared byte by byte on MySQL: its default collation would fold different trigrams into the same key
+    gram: Mapped[str] = mapped_column(
+        String(3).with_variant(mysql.VARCHAR(3, collation="utf8mb4_bin"), "mysql"), primary_key=True
+    )
+    user_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+
 class TodosORM(BaseORM):
     __tablename__ = "todos"
+    # listings filter by owner (and priority) and sort by a column plus id; title is looked up on every add
+    __table_args__ = (
+        Index("ix_todos_owner_id_id", "owner_id", "id"),
+        Index("ix_todos_owner_id_priority_id", "owner_id", "priority", "id"),
+        Index("ix_todos_owner_id_title_id", "owner_id", "title", "id"),
+        Index("ix_todos_priority_id", "priority", "id"),
+        Index("ix_todos_title_id", "title", "id"),
+        # the archiver picks the todos completed the longest ago
+        Index("ix_todos_completed_at", "completed_at"),
+        # the search (q) index; SQLite gets an FTS5 table instead, created below
+        Index("ix_todos_title_description_fulltext", "title", "description", mysql_prefix="FULLTEXT").ddl_if(
+            dialect="mysql"
+        ),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
     title: Mapped[str] = mapped_column(String(255))
     description: Mapped[str] = mapped_column(String(1024))
     priority: Mapped[int] = mapped_column(Integer)
     completed: Mapped[bool] = mapped_column(Boolean, default=False)
     owner_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    # naive UTC, set by the todos repository when the todo gets completed (NULL while pending)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class TodosArchiveORM(BaseORM):
+    """Todos completed long ago, moved out of todos by the archiver and only read when listings ask for them."""
+
+    __tablename__ = "todos_archive"
+    __table_args__ = (
+        Index("ix_todos_archive_owner_id_id", "owner_id", "id"),
+        Index("ix_todos_archive_title_description_fulltext", "title", "description", mysql_prefix="FULLTEXT").ddl_if(
+            dialect="mysql"
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    title: Mapped[str] = mapped_column(String(255))
+    description: Mapped[str] = mapped_column(String(1024))
+    priority: Mapped[int] = mapped_column(Integer)
+    completed: Mapped[bool] = mapped_column(Boolean, default=True)
+    owner_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+for table in (TodosORM.__table__, TodosArchiveORM.__table__):
+    for statement in fts5_ddl(table.name, ("title", "description")):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(table, "before_drop", DDL(f"DROP TABLE IF EXISTS {table.name}_fts").execute_if(dialect="sqlite"))
+
+
+class TodoCountersORM(BaseORM):
+    """Number of todos per (owner, priority, completed), maintained by the todos repository on every write."""
+
+    __tablename__ = "todo_counters"
+
+    owner_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    priority: Mapped[int] = mapped_column(Integer, primary_key=True)
+    completed: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    total: Mapped[int] = mapped_column(Integer, default=0)
@@ -0,0 +1,71 @@
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+
+import attrs
+
+# Who is reading or writing in the current request (ex: the user id). Reads of a key that wrote
+# less than read_your_writes_seconds ago go to the primary, so they see their own writes.
+consistency_key: ContextVar[str | None] = ContextVar("consistency_key", default=None)
+
+
+@attrs.define
+class ReplicaSettings:
+    urls: list[str] = attrs.field(factory=list)
+    read_your_writes_seconds: float = 5.0
+
+
+class ReadYourWritesTracker:
+    """Remembers, per consistency key, until when its reads must stay on the primary."""
+
+    # expired keys are purged once the tracker holds more than this many
+    PURGE_THRESHOLD = 1024
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pinned_until: dict[str, float] = {}
+
+    def record_write(self, key: str, window_seconds: float):
+        now = time.monotonic()
+
+        with self._lock:
+            self._pinned_until[key] = max(self._pinned_until.get(key, 0.0), now + window_seconds)
+
+            if len(self._pinned_until) > self.PURGE_THRESHOLD:
+                self._pinned_until = {
+                    pinned_key: until for pinned_key, until in self._pinned_until.items() if until > now
+                }
+
+    def is_pinned(self, key: str) -> bool:
+        with self._lock:
+            return self._pinned_until.get(key, 0.0) > time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._pinned_until.clear()
+
+
+# Shared by every connector of the process: writes go through the command side connector
+# while reads go through the query side one
+read_your_writes_tracker = ReadYourWritesTracker()
+
+# Connectors are built per request, so the round robin position is kept for the whole process
+_replica_counter = itertools.count()
+
+
+def get_read_url(primary_url: str, replica_settings: ReplicaSettings) -> str:
+    if not replica_settings.urls:
+        return primary_url
+
+    key = consistency_key.get()
+    if key is not None and read_your_writes_tracker.is_pinned(key):
+        return primary_url
+
+    return replica_settings.urls[next(_replica_counter) % len(replica_settings.urls)]
+
+
+def record_write(replica_settings: ReplicaSettings):
+    key = consistency_key.get()
+    if key is not None and replica_settings.read_your_writes_seconds > 0:
+        read_your_writes_tracker.record_write(key, replica_settings.read_your_writes_seconds)
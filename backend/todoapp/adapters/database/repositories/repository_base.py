@@ -1,25 +1,45 @@
 import uuid
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Generic, TypeVar, get_args, get_origin
 
 import attrs
-from sqlalchemy import Select, Tuple, asc, desc, func, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Tuple,
+    and_,
+    asc,
+    delete,
+    desc,
+    func,
+    insert,
+    or_,
+    select,
+    true,
+    update,
+)
 
-from todoapp.adapters.database.database import DatabaseConnector
+import todoapp.adapters.database.extensions  # noqa: F401  # attaches orm_cls and the filter predicates
+from todoapp.adapters.database.database import AsyncDatabaseConnector, DatabaseConnector
 from todoapp.adapters.database.models import BaseORM
-from todoapp.domain.models.base_model import BaseModel, FiltersBase, SortDirection
-from todoapp.domain.repositories.repository_base import AbstractRepository
+from todoapp.domain.models.base_model import BaseModel, FiltersBase, KeysetCursor, SortDirection
+from todoapp.domain.repositories.repository_base import AbstractAsyncRepository, AbstractRepository
 
 T = TypeVar("T", bound=BaseModel)
 K = TypeVar("K", bound=BaseORM)
 G = TypeVar("G", int, uuid.UUID)
 
+# rows fetched per round trip when streaming a whole table
+STREAM_BATCH_SIZE = 1000
 
-@attrs.define
-class RepositoryBase[T](AbstractRepository):
-    # IMPORTANT: We need to repeat properties in child classes
-    # in order to constructor class work because it is a limitation of attrs library
-    database_connector: DatabaseConnector
+
+class RepositoryQueriesBase[T]:
+    """Query building shared by the sync and async repositories."""
+
+    # Columns loaded (and locked) before updates and bulk deletes so the _after_* hooks can see the previous values
+    _update_tracked_columns: tuple = ()
 
     @abstractmethod
     def _orm_to_domain_model(self, entity_orm: K) -> T:
@@ -29,20 +49,269 @@ class RepositoryBase[T](AbstractRepository):
     def _domain_model_to_orm(self, entity_model: T) -> K:
         pass
 
-    @property
-    def orm_cls(self):
-        bases = self.__class__.__orig_bases__  # The generic bases
+    # Resolved once, when the repository class is defined, from its RepositoryBase[OrmEntity] base
+    orm_cls: type[BaseORM] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-        for base in bases:
-            if get_origin(base) is RepositoryBase:
+        for base in cls.__dict__.get("__orig_bases__", ()):  # The generic bases
+            origin = get_origin(base)
+            if isinstance(origin, type) and issubclass(origin, RepositoryQueriesBase):
                 args = get_args(base)
-                if args:
-                    return args[0]  # The T in RepositoryBase[T]
+                if args and isinstance(args[0], type):
+                    cls.orm_cls = args[0]  # The T in RepositoryBase[T]
+
+        if cls.orm_cls is None and not cls.__type_params__:
+            raise TypeError("Repository should extend RepositoryBase[OrmEntity] as Generic[T]")
+
+    def _get_query(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+    ) -> Select[Tuple]:
+        query = select(self.orm_cls).select_from(self.orm_cls)
+        query = self._generate_query_joins_filters(query, join_types, filters)
+        return self._sorted_page_query(
+            query, self.orm_cls, order, order_by, offset, limit, after, ranking=self._filters_ranking(filters)
+        )
+
+    def _sorted_page_query(
+        self,
+        query: Select[Tuple],
+        entity,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        ranking: ColumnElement | None = None,
+    ) -> Select[Tuple]:
+        """Sort, seek and slice a query over the entity (the ORM class or an alias of it)."""
+        order_field = getattr(entity, order_by, None) if order_by else None
+        if not order:
+            order_field = None
+
+        # id is always the last sort key so pages are stable and can be resumed from a cursor
+        id_field = entity.id
+        descending = order_field is not None and order == SortDirection.DESC
+        sort_direction = desc if descending else asc
+
+        if after is not None:
+            query = query.where(self._keyset_predicate(order_field, id_field, after, descending=descending))
+
+        if order_field is not None:
+            query = query.order_by(sort_direction(order_field))
+        elif after is None and ranking is not None:
+            # no requested order: best matches first (cursor pages keep seeking by id)
+            query = query.order_by(desc(ranking))
+        query = query.order_by(sort_direction(id_field))
+
+        if offset:
+            query = query.offset(offset)
+
+        if limit:
+            query = query.limit(limit)
+
+        return query
+
+    @staticmethod
+    def _keyset_predicate(order_field, id_field, after: KeysetCursor, *, descending: bool):
+        if order_field is None:
+            return id_field < after.last_id if descending else id_field > after.last_id
+
+        if descending:
+            return or_(
+                order_field < after.last_value,
+                and_(order_field == after.last_value, id_field < after.last_id),
+            )
+
+        return or_(
+            order_field > after.last_value,
+            and_(order_field == after.last_value, id_field > after.last_id),
+        )
+
+    def _get_page_query(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+    ) -> Select[Tuple]:
+        query = self._get_query(join_types, filters, order, order_by, offset, limit, after)
+        if not include_total:
+            return query
+
+        # the total is an uncorrelated subquery over the filters only (no cursor, offset nor limit),
+        # so the page and the total come back in a single statement
+        total_items = self._count_query(join_types, filters).scalar_subquery()
+        return query.add_columns(total_items.label("total_items"))
+
+    @staticmethod
+    def _needs_count_fallback(rows: list, offset: int | None, after: KeysetCursor | None) -> bool:
+        # an empty page carries no total, which is only known to be 0 on the first page
+        return not rows and bool(offset or after)
+
+    def _after_add_statements(self, entity_orm: K) -> list:  # noqa: ARG002
+        """Extra statements run in the same transaction after inserting an entity."""
+        return []
+
+    def _after_add_many_statements(self, entities_orm: list[K]) -> list:
+        """Extra statements run in the same transaction after inserting a batch of entities."""
+        return [statement for entity_orm in entities_orm for statement in self._after_add_statements(entity_orm)]
+
+    def _add_many_statement(self, entities_orm: list[K]):
+        # a single multi-row INSERT ... VALUES (...), (...) for the whole batch
+        columns = [column.key for column in self.orm_cls.__table__.columns]
+        rows = [{column: getattr(entity_orm, column) for column in columns} for entity_orm in entities_orm]
+        return insert(self.orm_cls).values(rows)
 
-        raise TypeError("Repository should extend RepositoryBase[OrmEntity] as Generic[T]")
+    def _after_update_statements(self, previous: Row | None, entity_orm: K) -> list:  # noqa: ARG002
+        """Extra statements run in the same transaction after updating an entity."""
+        return []
+
+    def _after_delete_statements(self, entity_orm: K) -> list:  # noqa: ARG002
+        """Extra statements run in the same transaction after deleting an entity."""
+        return []
+
+    def _previous_state_query(self, id: Generic[G], values: dict | None = None) -> Select[Tuple] | None:  # noqa: A002
+        if not self._tracks_values(values):
+            return None
+
+        return select(*self._update_tracked_columns).where(self.orm_cls.id == id).with_for_update()
+
+    def _changed_values(self, entity: T, entity_orm: K) -> dict:
+        """Column values to SET: the fields changed since the entity was loaded, or every column of an untracked one."""
+        changed_fields = entity.changed_fields()
+        return {
+            column.key: getattr(entity_orm, column.key)
+            for column in self.orm_cls.__mapper__.column_attrs
+            if column.key != "id" and (changed_fields is None or column.key in changed_fields)
+        }
+
+    def _bulk_predicate(self, ids: list | None = None, filters: FiltersBase | None = None) -> ColumnElement[bool]:
+        conditions = []
+        if ids is not None:
+            conditions.append(self.orm_cls.id.in_(ids))
+
+        filters_predicate = self._filters_predicate(filters)
+        if filters_predicate is not None:
+            conditions.append(filters_predicate)
+
+        return and_(true(), *conditions)
+
+    def _previous_groups_query(
+        self, predicate: ColumnElement[bool], values: dict | None = None
+    ) -> Select[Tuple] | None:
+        # tracked values of the affected rows, grouped so hooks get one row per distinct combination and its size
+        tracked_columns = self._update_tracked_columns
+        if not self._tracks_values(values):
+            return None
+
+        return (
+            select(*tracked_columns, func.count().label("total"))
+            .where(predicate)
+            .group_by(*tracked_columns)
+            .with_for_update()
+        )
+
+    def _tracks_values(self, values: dict | None = None) -> bool:
+        """Whether writing these values (None: deleting) needs the previous values of the tracked columns."""
+        tracked_keys = {column.key for column in self._update_tracked_columns}
+        return bool(tracked_keys) and (values is None or bool(tracked_keys & values.keys()))
+
+    def _previous_group(self, entity_orm: K) -> tuple:
+        return (*(getattr(entity_orm, column.key) for column in self._update_tracked_columns), 1)
+
+    def _update_one_returning_statement(self, predicate: ColumnElement[bool], values: dict):
+        # a single UPDATE ... RETURNING, unless the dialect lacks it or the hooks need the previous values
+        if self._tracks_values(values) or not self.database_connector.engine.dialect.update_returning:
+            return None
+
+        return update(self.orm_cls).where(predicate).values(**values).returning(self.orm_cls)
+
+    def _delete_returning_statement(self, predicate: ColumnElement[bool]):
+        # a single DELETE ... RETURNING the tracked columns, when the dialect has it
+        if not self._tracks_values() or not self.database_connector.engine.dialect.delete_returning:
+            return None
+
+        return (
+            delete(self.orm_cls)
+            .where(predicate)
+            .returning(*self._update_tracked_columns)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _locked_entity_query(self, predicate: ColumnElement[bool]) -> Select[Tuple]:
+        return select(self.orm_cls).where(predicate).with_for_update()
+
+    def _after_update_many_statements(self, previous_groups: list[Row], values: dict) -> list:  # noqa: ARG002
+        """Extra statements run in the same transaction after a bulk update."""
+        return []
+
+    def _after_delete_many_statements(self, previous_groups: list[Row]) -> list:  # noqa: ARG002
+        """Extra statements run in the same transaction after a bulk delete."""
+        return []
+
+    def _update_many_statement(self, predicate: ColumnElement[bool], values: dict):
+        return update(self.orm_cls).where(predicate).values(**values).execution_options(synchronize_session=False)
+
+    def _delete_many_statement(self, predicate: ColumnElement[bool]):
+        return delete(self.orm_cls).where(predicate).execution_options(synchronize_session=False)
+
+    def _count_query(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+    ) -> Select[Tuple]:
+        query = select(func.count("*")).select_from(self.orm_cls)
+        return self._generate_query_joins_filters(query, join_types, filters)
+
+    def _generate_query_joins_filters(
+        self,
+        query: Select[Tuple],
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+    ) -> Select[Tuple]:
+        if not join_types:
+            join_types = []
+
+        for join in join_types:
+            query = query.join(join.orm_cls)
+
+        filters_predicate = self._filters_predicate(filters)
+        if filters_predicate is not None:
+            query = query.where(filters_predicate)
+
+        return query
+
+    @staticmethod
+    def _filters_predicate(filters: FiltersBase | None) -> ColumnElement[bool] | None:
+        return filters.get_predicate() if filters else None
+
+    @staticmethod
+    def _filters_ranking(filters: FiltersBase | None) -> ColumnElement | None:
+        return filters.get_ranking() if filters else None
+
+
+@attrs.define
+class RepositoryBase[T](RepositoryQueriesBase[T], AbstractRepository):
+    # IMPORTANT: We need to repeat properties in child classes
+    # in order to constructor class work because it is a limitation of attrs library
+    database_connector: DatabaseConnector
 
     def get_by_id(self, id: Generic[G]) -> T:  # noqa: A002
-        with self.database_connector.session_scope() as session:
+        with self.database_connector.session_scope(read_only=True) as session:
             entity_orm = session.get(self.orm_cls, id)
             return self._orm_to_domain_model(entity_orm) if entity_orm else None
 
@@ -52,19 +321,130 @@ class RepositoryBase[T](AbstractRepository):
             session.add(entity_orm)
             session.flush()
 
+            for statement in self._after_add_statements(entity_orm):
+                session.execute(statement)
+
             return self._orm_to_domain_model(entity_orm)
 
+    def add_many(self, entities: list[T]) -> list[T]:
+        if not entities:
+            return []
+
+        entities_orm = [self._domain_model_to_orm(entity) for entity in entities]
+        with self.database_connector.session_scope() as session:
+            session.execute(self._add_many_statement(entities_orm))
+
+            for statement in self._after_add_many_statements(entities_orm):
+                session.execute(statement)
+
+        return [self._orm_to_domain_model(entity_orm) for entity_orm in entities_orm]
+
     def delete(self, entity: T):
         with self.database_connector.session_scope() as session:
             entity_orm = session.get(self.orm_cls, entity.id)
             session.delete(entity_orm)
 
+            for statement in self._after_delete_statements(entity_orm):
+                session.execute(statement)
+
     def update(self, entity: T) -> T:
+        """Write the fields changed since the entity was loaded (every field of an untracked entity)."""
         entity_orm = self._domain_model_to_orm(entity)
+        values = self._changed_values(entity, entity_orm)
+        with self.database_connector.session_scope() as session:
+            if values:
+                previous_state_query = self._previous_state_query(entity.id, values)
+                previous = (
+                    session.execute(previous_state_query).one_or_none() if previous_state_query is not None else None
+                )
+
+                session.execute(self._update_many_statement(self.orm_cls.id == entity.id, values))
+
+                for statement in self._after_update_statements(previous, entity_orm):
+                    session.execute(statement)
+
+            # the bulk UPDATE bypasses the identity map, so an instance loaded earlier in the session is refreshed
+            updated_entity_orm = session.get(self.orm_cls, entity.id, populate_existing=True)
+            return self._orm_to_domain_model(updated_entity_orm)
+
+    def update_one(self, id: Generic[G], values: dict, filters: FiltersBase | None = None) -> T | None:  # noqa: A002
+        """Update the entity if it also matches the filters, returning None when no row did."""
+        predicate = self._bulk_predicate([id], filters)
+
+        with self.database_connector.session_scope() as session:
+            returning_statement = self._update_one_returning_statement(predicate, values)
+            if returning_statement is not None:
+                entity_orm = session.execute(returning_statement).scalar_one_or_none()
+                return self._orm_to_domain_model(entity_orm) if entity_orm else None
+
+            entity_orm = session.execute(self._locked_entity_query(predicate)).scalar_one_or_none()
+            if entity_orm is None:
+                return None
+
+            entity = self._orm_to_domain_model(entity_orm)
+            previous_groups = [self._previous_group(entity_orm)] if self._tracks_values(values) else []
+
+            session.execute(self._update_many_statement(predicate, values))
+
+            for statement in self._after_update_many_statements(previous_groups, values):
+                session.execute(statement)
+
+            session.expire(entity_orm)
+            return attrs.evolve(entity, **values)
+
+    def delete_one(self, id: Generic[G], filters: FiltersBase | None = None) -> bool:  # noqa: A002
+        """Delete the entity if it also matches the filters, returning whether a row was deleted."""
+        predicate = self._bulk_predicate([id], filters)
+
+        with self.database_connector.session_scope() as session:
+            returning_statement = self._delete_returning_statement(predicate)
+            if returning_statement is not None:
+                previous_groups = [(*row, 1) for row in session.execute(returning_statement).all()]
+                deleted = bool(previous_groups)
+            else:
+                previous_groups_query = self._previous_groups_query(predicate)
+                previous_groups = (
+                    session.execute(previous_groups_query).all() if previous_groups_query is not None else []
+                )
+                deleted = session.execute(self._delete_many_statement(predicate)).rowcount > 0
+
+            for statement in self._after_delete_many_statements(previous_groups):
+                session.execute(statement)
+
+            session.expire_all()
+            return deleted
+
+    def update_many(self, values: dict, ids: list | None = None, filters: FiltersBase | None = None) -> int:
+        predicate = self._bulk_predicate(ids, filters)
+
         with self.database_connector.session_scope() as session:
-            session.execute(update(self.orm_cls), [entity_orm.__dict__])
+            previous_groups_query = self._previous_groups_query(predicate, values)
+            previous_groups = session.execute(previous_groups_query).all() if previous_groups_query is not None else []
+
+            result = session.execute(self._update_many_statement(predicate, values))
+            # instances loaded earlier in the same unit of work are reloaded on their next access
+            session.expire_all()
 
-        return self.get_by_id(entity.id)
+            for statement in self._after_update_many_statements(previous_groups, values):
+                session.execute(statement)
+
+            return result.rowcount
+
+    def delete_many(self, ids: list | None = None, filters: FiltersBase | None = None) -> int:
+        predicate = self._bulk_predicate(ids, filters)
+
+        with self.database_connector.session_scope() as session:
+            previous_groups_query = self._previous_groups_query(predicate)
+            previous_groups = session.execute(previous_groups_query).all() if previous_groups_query is not None else []
+
+            result = session.execute(self._delete_many_statement(predicate))
+            # instances loaded earlier in the same unit of work are reloaded on their next access
+            session.expire_all()
+
+            for statement in self._after_delete_many_statements(previous_groups):
+                session.execute(statement)
+
+            return result.rowcount
 
     def get(
         self,
@@ -74,57 +454,170 @@ class RepositoryBase[T](AbstractRepository):
         order_by: str | None = None,
         offset: int | None = None,
         limit: int | None = None,
+        after: KeysetCursor | None = None,
     ) -> list[T]:
-        query = select(self.orm_cls).select_from(self.orm_cls)
-        query = self._generate_query_joins_filters(query, join_types, filters)
+        query = self._get_query(join_types, filters, order, order_by, offset, limit, after)
 
-        if order_by:
-            order_field = getattr(self.orm_cls, order_by, None)
+        with self.database_connector.session_scope(read_only=True) as session:
+            entities_orm = session.execute(query).scalars()
+            return [self._orm_to_domain_model(entity_orm) for entity_orm in entities_orm]
 
-        if order and order_field:
-            query = query.order_by(asc(order_field) if order == SortDirection.ASC else desc(order_field))
+    def count(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+    ) -> int:
+        query = self._count_query(join_types, filters)
 
-        if offset:
-            query = query.offset(offset)
+        with self.database_connector.session_scope(read_only=True) as session:
+            return session.execute(query).scalar()
 
-        if limit:
-            query = query.limit(limit)
+    def get_page(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+    ) -> tuple[list[T], int | None]:
+        query = self._get_page_query(
+            join_types, filters, order, order_by, offset, limit, after, include_total=include_total
+        )
 
-        with self.database_connector.session_scope() as session:
-            entities_orm = session.execute(query).scalars()
+        with self.database_connector.session_scope(read_only=True) as session:
+            if not include_total:
+                entities_orm = session.execute(query).scalars()
+                return [self._orm_to_domain_model(entity_orm) for entity_orm in entities_orm], None
+
+            rows = session.execute(query).all()
+            if self._needs_count_fallback(rows, offset, after):
+                total_items = session.execute(self._count_query(join_types, filters)).scalar()
+            else:
+                total_items = rows[0].total_items if rows else 0
+
+            return [self._orm_to_domain_model(row[0]) for row in rows], total_items
+
+
+@attrs.define
+class AsyncRepositoryBase[T](RepositoryQueriesBase[T], AbstractAsyncRepository):
+    # IMPORTANT: We need to repeat properties in child classes
+    # in order to constructor class work because it is a limitation of attrs library
+    database_connector: AsyncDatabaseConnector
+
+    async def get_by_id(self, id: Generic[G]) -> T:  # noqa: A002
+        async with self.database_connector.session_scope(read_only=True) as session:
+            entity_orm = await session.get(self.orm_cls, id)
+            return self._orm_to_domain_model(entity_orm) if entity_orm else None
+
+    async def add(self, entity: T) -> T:
+        async with self.database_connector.session_scope() as session:
+            entity_orm = self._domain_model_to_orm(entity)
+            session.add(entity_orm)
+            await session.flush()
+
+            for statement in self._after_add_statements(entity_orm):
+                await session.execute(statement)
+
+            return self._orm_to_domain_model(entity_orm)
+
+    async def delete(self, entity: T):
+        async with self.database_connector.session_scope() as session:
+            entity_orm = await session.get(self.orm_cls, entity.id)
+            await session.delete(entity_orm)
+
+            for statement in self._after_delete_statements(entity_orm):
+                await session.execute(statement)
+
+    async def update(self, entity: T) -> T:
+        """Write the fields changed since the entity was loaded (every field of an untracked entity)."""
+        entity_orm = self._domain_model_to_orm(entity)
+        values = self._changed_values(entity, entity_orm)
+        async with self.database_connector.session_scope() as session:
+            if values:
+                previous_state_query = self._previous_state_query(entity.id, values)
+                previous = (
+                    (await session.execute(previous_state_query)).one_or_none()
+                    if previous_state_query is not None
+                    else None
+                )
+
+                await session.execute(self._update_many_statement(self.orm_cls.id == entity.id, values))
+
+                for statement in self._after_update_statements(previous, entity_orm):
+                    await session.execute(statement)
+
+            # the bulk UPDATE bypasses the identity map, so an instance loaded earlier in the session is refreshed
+            updated_entity_orm = await session.get(self.orm_cls, entity.id, populate_existing=True)
+            return self._orm_to_domain_model(updated_entity_orm)
+
+    async def get(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+    ) -> list[T]:
+        query = self._get_query(join_types, filters, order, order_by, offset, limit, after)
+
+        async with self.database_connector.session_scope(read_only=True) as session:
+            entities_orm = (await session.execute(query)).scalars()
             return [self._orm_to_domain_model(entity_orm) for entity_orm in entities_orm]
 
-    def count(
+    async def count(
         self,
         join_types: list[T] | None = None,
         filters: FiltersBase | None = None,
     ) -> int:
-        query = select(func.count("*")).select_from(self.orm_cls)
-        query = self._generate_query_joins_filters(query, join_types, filters)
+        query = self._count_query(join_types, filters)
 
-        with self.database_connector.session_scope() as session:
-            return session.execute(query).scalar()
+        async with self.database_connector.session_scope(read_only=True) as session:
+            return (await session.execute(query)).scalar()
 
-    def _generate_query_joins_filters(
+    async def get_page(
         self,
-        query: Select[Tuple],
         join_types: list[T] | None = None,
         filters: FiltersBase | None = None,
-    ) -> Select[Tuple]:
-        # TODO: See if we can put in global imports because it produce a problem with circular imports
-        import todoapp.adapters.database.extensions  # noqa: F401, PLC0415
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+    ) -> tuple[list[T], int | None]:
+        query = self._get_page_query(
+            join_types, filters, order, order_by, offset, limit, after, include_total=include_total
+        )
 
-        if not join_types:
-            join_types = []
+        async with self.database_connector.session_scope(read_only=True) as session:
+            if not include_total:
+                entities_orm = (await session.execute(query)).scalars()
+                return [self._orm_to_domain_model(entity_orm) for entity_orm in entities_orm], None
 
-        for join in join_types:
-            query = query.join(join.orm_cls)
+            rows = (await session.execute(query)).all()
+            if self._needs_count_fallback(rows, offset, after):
+                total_items = (await session.execute(self._count_query(join_types, filters))).scalar()
+            else:
+                total_items = rows[0].total_items if rows else 0
 
-        filters_predicate = None
-        if filters:
-            filters_predicate = filters.get_predicate()
+            return [self._orm_to_domain_model(row[0]) for row in rows], total_items
 
-        if filters_predicate is not None:
-            query = query.where(filters_predicate)
+    async def stream(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[T]:
+        query = self._get_query(join_types, filters).execution_options(yield_per=batch_size)
 
-        return query
+        async with self.database_connector.session_scope(read_only=True) as session:
+            # a server side cursor: only batch_size rows are held in memory at a time
+            async for entity_orm in await session.stream_scalars(query):
+                yield self._orm_to_domain_model(entity_orm)
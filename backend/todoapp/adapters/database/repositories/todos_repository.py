@@ -1,17 +1,68 @@
+from collections import Counter
+from datetime import UTC, datetime
+
 import attrs
-from sqlalchemy import select
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    DateTime,
+    Integer,
+    Row,
+    Select,
+    StatementLambdaElement,
+    cast,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.visitors import replacement_traverse
 
-from todoapp.adapters.database.database import DatabaseConnector
-from todoapp.adapters.database.models import TodosORM
-from todoapp.adapters.database.repositories.repository_base import RepositoryBase
+from todoapp.adapters.database.database import AsyncDatabaseConnector, DatabaseConnector
+from todoapp.adapters.database.models import TodoCountersORM, TodosArchiveORM, TodosORM
+from todoapp.adapters.database.repositories.repository_base import AsyncRepositoryBase, RepositoryBase
+from todoapp.domain.models.base_model import FiltersBase, KeysetCursor, SortDirection
 from todoapp.domain.models.todo import Todo
-from todoapp.domain.repositories.todos_repository import AbstractTodosRepository
+from todoapp.domain.repositories.todos_repository import AbstractAsyncTodosRepository, AbstractTodosRepository
 
 
-@attrs.define
-class TodosRepository(RepositoryBase[TodosORM], AbstractTodosRepository):
-    database_connector: DatabaseConnector
+# Hot lookups as lambda statements: the select() is built and its cache key computed once per call site,
+# later calls only bind the new values
+def _todo_by_owner_id_statement(owner_id: str) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(TodosORM).where(TodosORM.owner_id == owner_id))
+
+
+def _todo_by_title_statement(title: str) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(TodosORM).where(TodosORM.title == title))
+
+
+def _todos_by_titles_statement(titles: list[str]) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(TodosORM).where(TodosORM.title.in_(titles)))
+
+
+def _utcnow() -> datetime:
+    # completed_at and archived_at are naive UTC, as stored by their DATETIME columns
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _on_archive(clause: ColumnElement) -> ColumnElement:
+    """The same clause (ex: a filters predicate) over the columns of todos_archive instead of todos."""
+    archive_columns = TodosArchiveORM.__table__.c
 
+    def replace(element):
+        if isinstance(element, Column) and element.table is TodosORM.__table__:
+            return archive_columns[element.key]
+        return None
+
+    return replacement_traverse(clause, {}, replace)
+
+
+class TodosORMMapper:
     def _orm_to_domain_model(self, entity_orm: TodosORM) -> Todo:
         return Todo(
             id=str(entity_orm.id),
@@ -20,7 +71,7 @@ class TodosRepository(RepositoryBase[TodosORM], AbstractTodosRepository):
             priority=entity_orm.priority,
             completed=entity_orm.completed,
             owner_id=str(entity_orm.owner_id),
-        )
+        ).track_changes()
 
     def _domain_model_to_orm(self, entity_model: Todo) -> TodosORM:
         return TodosORM(
@@ -30,16 +81,305 @@ class TodosRepository(RepositoryBase[TodosORM], AbstractTodosRepository):
             priority=entity_model.priority,
             completed=entity_model.completed,
             owner_id=str(entity_model.owner_id),
+            completed_at=_utcnow() if entity_model.completed else None,
+        )
+
+
+class TodoCountersMixin:
+    """Keeps todo_counters in sync with every todo write and answers counts from it when the filters allow it."""
+
+    # filters that can be answered by summing todo_counters rows
+    COUNTER_FILTERS = frozenset({"owner_id", "priority", "completed"})
+
+    _update_tracked_columns = (TodosORM.owner_id, TodosORM.priority, TodosORM.completed)
+
+    def _counter_delta_statement(self, owner_id: str, priority: int, completed: bool, delta: int):  # noqa: FBT001
+        values = {"owner_id": owner_id, "priority": priority, "completed": completed, "total": delta}
+        dialect_name = self.database_connector.engine.dialect.name
+
+        if dialect_name == "mysql":
+            return (
+                mysql_insert(TodoCountersORM)
+                .values(**values)
+                .on_duplicate_key_update(total=TodoCountersORM.total + delta)
+            )
+
+        if dialect_name == "sqlite":
+            return (
+                sqlite_insert(TodoCountersORM)
+                .values(**values)
+                .on_conflict_do_update(
+                    index_elements=[TodoCountersORM.owner_id, TodoCountersORM.priority, TodoCountersORM.completed],
+                    set_={"total": TodoCountersORM.total + delta},
+                )
+            )
+
+        raise NotImplementedError(f"Todo counters are not supported for {dialect_name} databases")
+
+    def _after_add_statements(self, entity_orm: TodosORM) -> list:
+        return [self._counter_delta_statement(entity_orm.owner_id, entity_orm.priority, entity_orm.completed, 1)]
+
+    def _counter_delta_statements(self, deltas: Counter) -> list:
+        # one upsert per counter key instead of one per todo
+        return [self._counter_delta_statement(*key, delta) for key, delta in deltas.items() if delta]
+
+    def _after_add_many_statements(self, entities_orm: list[TodosORM]) -> list:
+        deltas = Counter(
+            (entity_orm.owner_id, entity_orm.priority, entity_orm.completed) for entity_orm in entities_orm
+        )
+        return self._counter_delta_statements(deltas)
+
+    def _after_update_many_statements(self, previous_groups: list[Row], values: dict) -> list:
+        deltas = Counter()
+        for owner_id, priority, completed, total in previous_groups:
+            new_key = (owner_id, values.get("priority", priority), values.get("completed", completed))
+            deltas[(owner_id, priority, completed)] -= total
+            deltas[new_key] += total
+
+        return self._counter_delta_statements(deltas)
+
+    def _after_delete_many_statements(self, previous_groups: list[Row]) -> list:
+        deltas = Counter()
+        for owner_id, priority, completed, total in previous_groups:
+            deltas[(owner_id, priority, completed)] -= total
+
+        return self._counter_delta_statements(deltas)
+
+    def _after_update_statements(self, previous: Row | None, entity_orm: TodosORM) -> list:
+        if previous is None:
+            return []
+
+        new_key = (entity_orm.owner_id, entity_orm.priority, entity_orm.completed)
+        if tuple(previous) == new_key:
+            return []
+
+        return [self._counter_delta_statement(*previous, -1), self._counter_delta_statement(*new_key, 1)]
+
+    def _after_delete_statements(self, entity_orm: TodosORM) -> list:
+        return [self._counter_delta_statement(entity_orm.owner_id, entity_orm.priority, entity_orm.completed, -1)]
+
+    @staticmethod
+    def _count_by_priority_and_completed_query(owner_id: str) -> Select:
+        # a GROUP BY over the owner's counters, at most one row per (priority, completed), instead of its todos
+        return (
+            select(
+                TodoCountersORM.priority,
+                TodoCountersORM.completed,
+                cast(func.sum(TodoCountersORM.total), Integer),
+            )
+            .where(TodoCountersORM.owner_id == owner_id, TodoCountersORM.total > 0)
+            .group_by(TodoCountersORM.priority, TodoCountersORM.completed)
+        )
+
+    @classmethod
+    def _counters_cover(cls, join_types: list | None, filters: FiltersBase | None) -> bool:
+        if join_types:
+            return False
+        if filters is None:
+            return True
+        if not attrs.has(type(filters)):
+            return False
+
+        used_filters = {field.name for field in attrs.fields(type(filters)) if getattr(filters, field.name) is not None}
+        return used_filters <= cls.COUNTER_FILTERS
+
+    def _count_query(self, join_types: list | None = None, filters: FiltersBase | None = None) -> Select:
+        if not self._counters_cover(join_types, filters):
+            return super()._count_query(join_types, filters)
+
+        query = select(cast(func.coalesce(func.sum(TodoCountersORM.total), 0), Integer))
+        for field_name in self.COUNTER_FILTERS:
+            value = getattr(filters, field_name, None)
+            if value is not None:
+                query = query.where(getattr(TodoCountersORM, field_name) == value)
+
+        return query
+
+
+class TodosArchiveMixin:
+    """Stamps todos.completed_at, moves the todos completed long ago to todos_archive and lists across both."""
+
+    # the todos columns, selected in this order from both tables when listing across them
+    ARCHIVED_COLUMNS = tuple(column.key for column in TodosORM.__table__.columns)
+
+    @staticmethod
+    def _with_completed_at(values: dict) -> dict:
+        if "completed" not in values:
+            return values
+
+        # completing an already completed todo keeps the time it was first completed
+        completed_at = func.coalesce(TodosORM.completed_at, _utcnow()) if values["completed"] else None
+        return {**values, "completed_at": completed_at}
+
+    def _update_many_statement(self, predicate: ColumnElement[bool], values: dict):
+        return super()._update_many_statement(predicate, self._with_completed_at(values))
+
+    def _update_one_returning_statement(self, predicate: ColumnElement[bool], values: dict):
+        return super()._update_one_returning_statement(predicate, self._with_completed_at(values))
+
+    @staticmethod
+    def _archive_batch_query(completed_before: datetime, limit: int) -> Select:
+        # oldest first through ix_todos_completed_at; rows locked by other writers are left for a later batch
+        return (
+            select(TodosORM.id)
+            .where(TodosORM.completed_at < completed_before)
+            .order_by(TodosORM.completed_at, TodosORM.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
 
+    def _archive_statement(self, predicate: ColumnElement[bool], archived_at: datetime):
+        todos_columns = [TodosORM.__table__.c[key] for key in self.ARCHIVED_COLUMNS]
+        return insert(TodosArchiveORM).from_select(
+            [*self.ARCHIVED_COLUMNS, "archived_at"],
+            select(*todos_columns, literal(archived_at, DateTime)).where(predicate),
+        )
+
+    def _with_archive_entity(self, filters: FiltersBase | None = None):
+        """TodosORM aliased over the filtered todos UNION ALL the filtered archived todos."""
+        todos = select(*(TodosORM.__table__.c[key] for key in self.ARCHIVED_COLUMNS))
+        archive = select(*(TodosArchiveORM.__table__.c[key] for key in self.ARCHIVED_COLUMNS))
+
+        predicate = self._filters_predicate(filters)
+        if predicate is not None:
+            todos = todos.where(predicate)
+            archive = archive.where(_on_archive(predicate))
+
+        return aliased(TodosORM, union_all(todos, archive).subquery("todos_with_archive"))
+
+    def _with_archive_count_query(self, filters: FiltersBase | None = None) -> Select:
+        # the counters only cover todos, so the archived todos are always counted row by row
+        return select(func.count()).select_from(self._with_archive_entity(filters))
+
+    def _with_archive_page_query(
+        self,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+    ) -> Select:
+        # no relevance ranking across both tables: the requested order (then id) only
+        todos = self._with_archive_entity(filters)
+        query = self._sorted_page_query(select(todos), todos, order, order_by, offset, limit, after)
+        if not include_total:
+            return query
+
+        total_items = self._with_archive_count_query(filters).scalar_subquery()
+        return query.add_columns(total_items.label("total_items"))
+
+
+@attrs.define
+class TodosRepository(
+    TodosORMMapper, TodoCountersMixin, TodosArchiveMixin, RepositoryBase[TodosORM], AbstractTodosRepository
+):
+    database_connector: DatabaseConnector
+
     def get_by_owner_id(self, owner_id: int) -> Todo:
-        with self.database_connector.session_scope() as session:
-            query = select(TodosORM).where(TodosORM.owner_id == owner_id)
+        with self.database_connector.session_scope(read_only=True) as session:
+            query = _todo_by_owner_id_statement(owner_id)
             todo_orm = session.execute(query).scalar_one_or_none()
             return self._orm_to_domain_model(todo_orm) if todo_orm else None
 
     def get_by_title(self, title: str) -> Todo:
-        with self.database_connector.session_scope() as session:
-            query = select(TodosORM).where(TodosORM.title == title)
+        with self.database_connector.session_scope(read_only=True) as session:
+            query = _todo_by_title_statement(title)
             todo_orm = session.execute(query).scalar_one_or_none()
             return self._orm_to_domain_model(todo_orm) if todo_orm else None
+
+    def get_by_titles(self, titles: list[str]) -> list[Todo]:
+        with self.database_connector.session_scope(read_only=True) as session:
+            query = _todos_by_titles_statement(titles)
+            return [self._orm_to_domain_model(todo_orm) for todo_orm in session.execute(query).scalars()]
+
+    def count_by_priority_and_completed(self, owner_id: str) -> dict[tuple[int, bool], int]:
+        with self.database_connector.session_scope(read_only=True) as session:
+            rows = session.execute(self._count_by_priority_and_completed_query(owner_id)).all()
+            return {(priority, completed): total for priority, completed, total in rows}
+
+    def archive_completed(self, completed_before: datetime, limit: int) -> dict[str, int]:
+        with self.database_connector.session_scope() as session:
+            ids = session.execute(self._archive_batch_query(completed_before, limit)).scalars().all()
+            if not ids:
+                return {}
+
+            # moved like a bulk delete, so the counters follow
+            predicate = TodosORM.id.in_(ids)
+            previous_groups = session.execute(self._previous_groups_query(predicate)).all()
+            session.execute(self._archive_statement(predicate, _utcnow()))
+            session.execute(self._delete_many_statement(predicate))
+            session.expire_all()
+
+            for statement in self._after_delete_many_statements(previous_groups):
+                session.execute(statement)
+
+            archived = Counter()
+            for owner_id, _priority, _completed, total in previous_groups:
+                archived[owner_id] += total
+            return dict(archived)
+
+
+@attrs.define
+class AsyncTodosRepository(
+    TodosORMMapper, TodoCountersMixin, TodosArchiveMixin, AsyncRepositoryBase[TodosORM], AbstractAsyncTodosRepository
+):
+    database_connector: AsyncDatabaseConnector
+
+    async def get_by_owner_id(self, owner_id: int) -> Todo:
+        async with self.database_connector.session_scope(read_only=True) as session:
+            query = _todo_by_owner_id_statement(owner_id)
+            todo_orm = (await session.execute(query)).scalar_one_or_none()
+            return self._orm_to_domain_model(todo_orm) if todo_orm else None
+
+    async def get_by_title(self, title: str) -> Todo:
+        async with self.database_connector.session_scope(read_only=True) as session:
+            query = _todo_by_title_statement(title)
+            todo_orm = (await session.execute(query)).scalar_one_or_none()
+            return self._orm_to_domain_model(todo_orm) if todo_orm else None
+
+    async def get_by_titles(self, titles: list[str]) -> list[Todo]:
+        async with self.database_connector.session_scope(read_only=True) as session:
+            query = _todos_by_titles_statement(titles)
+            return [self._orm_to_domain_model(todo_orm) for todo_orm in (await session.execute(query)).scalars()]
+
+    async def count_by_priority_and_completed(self, owner_id: str) -> dict[tuple[int, bool], int]:
+        async with self.database_connector.session_scope(read_only=True) as session:
+            rows = (await session.execute(self._count_by_priority_and_completed_query(owner_id))).all()
+            return {(priority, completed): total for priority, completed, total in rows}
+
+    async def get_page(
+        self,
+        join_types: list | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+        include_archived: bool = False,
+    ) -> tuple[list[Todo], int | None]:
+        if not include_archived:
+            return await super().get_page(
+                join_types, filters, order, order_by, offset, limit, after, include_total=include_total
+            )
+
+        query = self._with_archive_page_query(
+            filters, order, order_by, offset, limit, after, include_total=include_total
+        )
+        async with self.database_connector.session_scope(read_only=True) as session:
+            if not include_total:
+                entities_orm = (await session.execute(query)).scalars()
+                return [self._orm_to_domain_model(entity_orm) for entity_orm in entities_orm], None
+
+            rows = (await session.execute(query)).all()
+            if self._needs_count_fallback(rows, offset, after):
+                total_items = (await session.execute(self._with_archive_count_query(filters))).scalar()
+            else:
+                total_items = rows[0].total_items if rows else 0
+
+            return [self._orm_to_domain_model(row[0]) for row in rows], total_items
@@ -1,17 +1,20 @@
 import attrs
-from sqlalchemy import select
+from sqlalchemy import Row, StatementLambdaElement, delete, insert, lambda_stmt, select
 
-from todoapp.adapters.database.database import DatabaseConnector
-from todoapp.adapters.database.models import UsersORM
-from todoapp.adapters.database.repositories.repository_base import RepositoryBase
+from todoapp.adapters.database.database import AsyncDatabaseConnector, DatabaseConnector
+from todoapp.adapters.database.models import UserSearchGramsORM, UsersORM
+from todoapp.adapters.database.repositories.repository_base import AsyncRepositoryBase, RepositoryBase
+from todoapp.adapters.database.trigrams import trigrams
 from todoapp.domain.models.user import User, UserRole
-from todoapp.domain.repositories.users_repository import AbstractUsersRepository
+from todoapp.domain.repositories.users_repository import AbstractAsyncUsersRepository, AbstractUsersRepository
 
 
-@attrs.define
-class UsersRepository(RepositoryBase[UsersORM], AbstractUsersRepository):
-    database_connector: DatabaseConnector
+# A hot lookup (every login) as a lambda statement: built once per call site, later calls only bind the email
+def _user_by_email_statement(email: str) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(UsersORM).where(UsersORM.email == email))
 
+
+class UsersORMMapper:
     def _orm_to_domain_model(self, entity_orm: UsersORM) -> User:
         return User(
             id=str(entity_orm.id),
@@ -20,7 +23,7 @@ class UsersRepository(RepositoryBase[UsersORM], AbstractUsersRepository):
             password=entity_orm.password,
             role=UserRole(entity_orm.role),
             is_active=entity_orm.is_active,
-        )
+        ).track_changes()
 
     def _domain_model_to_orm(self, entity_model: User) -> UsersORM:
         return UsersORM(
@@ -32,8 +35,98 @@ class UsersRepository(RepositoryBase[UsersORM], AbstractUsersRepository):
             is_active=entity_model.is_active,
         )
 
+
+class UserSearchGramsMixin:
+    """Keeps user_search_grams in sync with every user write, so the username/email searches can use it."""
+
+    SEARCH_FIELDS = ("username", "email")
+    # grams inserted per statement, far below the bound parameters limit of any database
+    GRAMS_BATCH_SIZE = 1000
+
+    _update_tracked_columns = (UsersORM.id, UsersORM.username, UsersORM.email)
+
+    def _search_grams_rows(self, user_id: str, values: dict) -> list[dict]:
+        return [
+            {"field": field, "gram": gram, "user_id": user_id}
+            for field in self.SEARCH_FIELDS
+            for gram in sorted(trigrams(values[field]))
+        ]
+
+    def _add_search_grams_statements(self, users_values: dict[str, dict]) -> list:
+        rows = [row for user_id, values in users_values.items() for row in self._search_grams_rows(user_id, values)]
+        return [
+            insert(UserSearchGramsORM).values(rows[i : i + self.GRAMS_BATCH_SIZE])
+            for i in range(0, len(rows), self.GRAMS_BATCH_SIZE)
+        ]
+
+    @staticmethod
+    def _delete_search_grams_statement(user_ids: list[str]):
+        return delete(UserSearchGramsORM).where(UserSearchGramsORM.user_id.in_(user_ids))
+
+    def _entity_search_values(self, entity_orm: UsersORM) -> dict:
+        return {field: getattr(entity_orm, field) for field in self.SEARCH_FIELDS}
+
+    def _after_add_statements(self, entity_orm: UsersORM) -> list:
+        return self._after_add_many_statements([entity_orm])
+
+    def _after_add_many_statements(self, entities_orm: list[UsersORM]) -> list:
+        return self._add_search_grams_statements(
+            {entity_orm.id: self._entity_search_values(entity_orm) for entity_orm in entities_orm}
+        )
+
+    def _after_update_statements(self, previous: Row | None, entity_orm: UsersORM) -> list:
+        # previous is only loaded when a searchable field was written
+        if previous is None:
+            return []
+
+        return [
+            self._delete_search_grams_statement([entity_orm.id]),
+            *self._add_search_grams_statements({entity_orm.id: self._entity_search_values(entity_orm)}),
+        ]
+
+    def _after_delete_statements(self, entity_orm: UsersORM) -> list:
+        return [self._delete_search_grams_statement([entity_orm.id])]
+
+    def _after_update_many_statements(self, previous_groups: list[Row], values: dict) -> list:
+        if not previous_groups:
+            return []
+
+        # one group per user, as the id is tracked
+        users_values = {
+            user_id: {"username": values.get("username", username), "email": values.get("email", email)}
+            for user_id, username, email, _ in previous_groups
+        }
+        return [
+            self._delete_search_grams_statement(list(users_values)),
+            *self._add_search_grams_statements(users_values),
+        ]
+
+    def _after_delete_many_statements(self, previous_groups: list[Row]) -> list:
+        if not previous_groups:
+            return []
+
+        return [self._delete_search_grams_statement([user_id for user_id, *_ in previous_groups])]
+
+
+@attrs.define
+class UsersRepository(UsersORMMapper, UserSearchGramsMixin, RepositoryBase[UsersORM], AbstractUsersRepository):
+    database_connector: DatabaseConnector
+
     def get_by_email(self, email: str) -> User:
-        with self.database_connector.session_scope() as session:
-            query = select(UsersORM).where(UsersORM.email == email)
+        with self.database_connector.session_scope(read_only=True) as session:
+            query = _user_by_email_statement(email)
             user_orm = session.execute(query).scalar_one_or_none()
             return self._orm_to_domain_model(user_orm) if user_orm else None
+
+
+@attrs.define
+class AsyncUsersRepository(
+    UsersORMMapper, UserSearchGramsMixin, AsyncRepositoryBase[UsersORM], AbstractAsyncUsersRepository
+):
+    database_connector: AsyncDatabaseConnector
+
+    async def get_by_email(self, email: str) -> User:
+        async with self.database_connector.session_scope(read_only=True) as session:
+            query = _user_by_email_statement(email)
+            user_orm = (await session.execute(query)).scalar_one_or_none()
+            return self._orm_to_domain_model(user_orm) if user_orm else None
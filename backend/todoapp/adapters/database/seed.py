@@ -1,13 +1,14 @@
 import uuid
 
 import attrs
-from sqlalchemy import select
 
 from todoapp.adapters.app.dependencies import get_config, get_database_connector
 from todoapp.adapters.database.database import DatabaseConnector
-from todoapp.adapters.database.models import TodosORM, UsersORM
+from todoapp.adapters.database.repositories.todos_repository import TodosRepository
+from todoapp.adapters.database.repositories.users_repository import UsersRepository
 from todoapp.config import Config
-from todoapp.domain.models.user import UserRole
+from todoapp.domain.models.todo import Todo
+from todoapp.domain.models.user import User, UserRole
 from todoapp.domain.services.auth.auth import Auth
 
 UUID_FIRST_USER = "521f2f68-b81c-4c83-b723-245d5b95e9b8"
@@ -28,37 +29,34 @@ class Seed:
         self.create_first_todo(user_id=user_id)
 
     def create_first_user(self) -> str:
-        with self.database_connector.session_scope() as session:
-            query = select(UsersORM).where(UsersORM.id == UUID_FIRST_USER)
-            user_data = session.execute(query).scalar_one_or_none()
-
-            if user_data is not None:
-                return user_data
+        # goes through the repository so the user search grams are kept up to date
+        users_repository = UsersRepository(database_connector=self.database_connector)
+        user = users_repository.get_by_id(UUID_FIRST_USER)
+        if user is not None:
+            return user.id
 
-            password = Auth.create_hashed_password(self.config.admin_user_password)
+        password = Auth.create_hashed_password(self.config.admin_user_password)
 
-            user = UsersORM(
+        user = users_repository.add(
+            User(
                 id=str(uuid.UUID(UUID_FIRST_USER)),
                 email=self.config.admin_user_email,
                 username="root",
                 password=password,
-                role=UserRole.ADMIN.value,
+                role=UserRole.ADMIN,
                 is_active=True,
             )
-
-            session.add(user)
-            session.flush()
-            return user.id
+        )
+        return user.id
 
     def create_first_todo(self, user_id: str):
-        with self.database_connector.session_scope() as session:
-            query = select(TodosORM).where(TodosORM.id == UUID_FIRST_TODO)
-            todo_data = session.execute(query).scalar_one_or_none()
-
-            if todo_data is not None:
-                return
+        # goes through the repository so the todo counters are kept up to date
+        todos_repository = TodosRepository(database_connector=self.database_connector)
+        if todos_repository.get_by_id(UUID_FIRST_TODO) is not None:
+            return
 
-            todo = TodosORM(
+        todos_repository.add(
+            Todo(
                 id=str(uuid.UUID(UUID_FIRST_TODO)),
                 title="Getting Used",
                 description="This is a todo to get used to the system",
@@ -66,6 +64,4 @@ class Seed:
                 completed=False,
                 owner_id=user_id,
             )
-
-            session.add(todo)
-            session.commit()
+        )
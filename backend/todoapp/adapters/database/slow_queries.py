@@ -0,0 +1,154 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import attrs
+from sqlalchemy import Connection, Engine, event
+
+logger = logging.getLogger(__name__)
+
+REDACTED_PARAMETER = "?"
+
+# statement prefix asking each dialect for the plan of a query
+EXPLAIN_PREFIXES = {
+    "mysql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+
+@attrs.define
+class SlowQuerySettings:
+    threshold_seconds: float = 0.5
+    explain: bool = False
+    max_entries: int = 50
+
+
+@attrs.define
+class SlowQuery:
+    statement: str
+    parameters: Any
+    duration_seconds: float
+    recorded_at: datetime
+    explain: list[str] | None = None
+
+
+class SlowQueryLog:
+    """Keeps the slowest statements seen, dropping the fastest of them once max_entries is reached."""
+
+    def __init__(self, max_entries: int = 50):
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        # min-heap of (duration, sequence, slow query); the sequence keeps entries with equal durations comparable
+        self._heap: list[tuple[float, int, SlowQuery]] = []
+        self._sequence = itertools.count()
+
+    def resize(self, max_entries: int):
+        with self._lock:
+            self._max_entries = max_entries
+            while len(self._heap) > max_entries:
+                heapq.heappop(self._heap)
+
+    def record(self, slow_query: SlowQuery):
+        entry = (slow_query.duration_seconds, next(self._sequence), slow_query)
+
+        with self._lock:
+            if len(self._heap) < self._max_entries:
+                heapq.heappush(self._heap, entry)
+            elif self._heap and entry[0] > self._heap[0][0]:
+                heapq.heapreplace(self._heap, entry)
+
+    def worst(self) -> list[SlowQuery]:
+        with self._lock:
+            return [slow_query for _, _, slow_query in sorted(self._heap, reverse=True)]
+
+    def clear(self):
+        with self._lock:
+            self._heap.clear()
+
+
+# Shared by every engine of the process (sync and async), so the worst queries are ranked together
+slow_query_log = SlowQueryLog()
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Keep the shape of the bound parameters (names, positions, batch size) but none of the values."""
+    if isinstance(parameters, dict):
+        return dict.fromkeys(parameters, REDACTED_PARAMETER)
+
+    if isinstance(parameters, list | tuple):
+        if parameters and isinstance(parameters[0], dict | list | tuple):
+            # executemany: only the number of rows is kept
+            return f"{len(parameters)} parameter sets"
+        return [REDACTED_PARAMETER] * len(parameters)
+
+    return None if parameters is None else REDACTED_PARAMETER
+
+
+@attrs.define
+class SlowQueryListener:
+    """Times every statement of an engine through its cursor events and records the ones over the threshold."""
+
+    settings: SlowQuerySettings
+    log: SlowQueryLog = attrs.field(factory=lambda: slow_query_log)
+
+    def attach(self, engine: Engine):
+        self.log.resize(self.settings.max_entries)
+
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    @staticmethod
+    def _before_cursor_execute(conn: Connection, cursor, statement, parameters, context, executemany):  # noqa: ARG004
+        conn.info.setdefault("slow_query_start_times", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn: Connection, cursor, statement, parameters, context, executemany):  # noqa: ARG002
+        duration_seconds = time.perf_counter() - conn.info["slow_query_start_times"].pop()
+        if duration_seconds < self.settings.threshold_seconds:
+            return
+
+        redacted_parameters = redact_parameters(parameters)
+        logger.warning("Slow query (%.1f ms): %s %s", duration_seconds * 1000, statement, redacted_parameters)
+
+        explain = None
+        if self.settings.explain and not executemany:
+            explain = self._explain(conn, statement, parameters)
+
+        self.log.record(
+            SlowQuery(
+                statement=statement,
+                parameters=redacted_parameters,
+                duration_seconds=duration_seconds,
+                recorded_at=datetime.now(UTC),
+                explain=explain,
+            )
+        )
+
+    @staticmethod
+    def _handle_error(exception_context):
+        # a failed statement never reaches after_cursor_execute
+        if exception_context.connection is not None:
+            start_times = exception_context.connection.info.get("slow_query_start_times")
+            if start_times:
+                start_times.pop()
+
+    @staticmethod
+    def _explain(conn: Connection, statement: str, parameters: Any) -> list[str] | None:
+        explain_prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if explain_prefix is None or not statement.lstrip().upper().startswith("SELECT"):
+            return None
+
+        # a raw DBAPI cursor, so the EXPLAIN neither goes through these events nor touches the statement result
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(explain_prefix + statement, parameters)
+            return [" | ".join(str(value) for value in row) for row in cursor.fetchall()]
+        except Exception:  # the plan is a diagnostic, it must never break the query being diagnosed
+            logger.exception("Could not explain slow query: %s", statement)
+            return None
+        finally:
+            cursor.close()
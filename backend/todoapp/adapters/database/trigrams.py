@@ -0,0 +1,14 @@
+"""Trigrams of searchable text, the keys of the substring search side indexes (ex: user_search_grams).
+
+Every substring of at least TRIGRAM_LENGTH characters has all its trigrams in the text containing it, so
+the rows holding every trigram of a search are the only candidates to contain it (and are checked with
+the substring predicate afterwards). Shorter searches have no trigram and cannot use the index.
+"""
+
+TRIGRAM_LENGTH = 3
+
+
+def trigrams(text: str) -> set[str]:
+    """Distinct lowercase trigrams of the text (none when it is shorter than TRIGRAM_LENGTH)."""
+    text = text.lower()
+    return {text[i : i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
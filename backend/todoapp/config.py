@@ -15,6 +15,25 @@ def _get_value_from_env_key(key: str):
     return value
 
 
+def _get_optional_value_from_env_key(key: str, default: str) -> str:
+    return os.getenv(key, default)
+
+
+def _str_to_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Async driver used for each sync engine when DB_ASYNC_ENGINE is not defined
+ASYNC_DB_ENGINES = {
+    "mysql+mysqlconnector": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+# the todo counters upserts and the full-text search are only written for these
+SUPPORTED_DB_DIALECTS = ("mysql", "sqlite")
+
+
 class Environments(StrEnum):
     DEVELOPMENT = "development"
     PRODUCTION = "production"
@@ -40,15 +59,49 @@ class Config:
     environment: Environment | None = None
 
     db_engine: str | None = None
+    db_async_engine: str | None = None
     db_host: str | None = None
     db_port: int | None = None
     db_user: str | None = None
     db_password: str | None = None
     db_name: str | None = None
 
+    db_pool_size: int | None = None
+    db_pool_max_overflow: int | None = None
+    db_pool_timeout_seconds: int | None = None
+    db_pool_recycle_seconds: int | None = None
+    db_pool_pre_ping: bool | None = None
+
+    db_slow_query_threshold_ms: int | None = None
+    db_slow_query_explain: bool | None = None
+    db_slow_query_log_size: int | None = None
+
+    db_replica_urls: list[str] | None = None
+    db_read_your_writes_seconds: float | None = None
+
+    todos_archive_enabled: bool | None = None
+    todos_archive_after_days: int | None = None
+    todos_archive_batch_size: int | None = None
+    todos_archive_batch_pause_seconds: float | None = None
+    todos_archive_interval_seconds: float | None = None
+
     admin_user_email: str | None = None
     admin_user_password: str | None = None
 
+    password_hashing_workers: int | None = None
+    password_hashing_max_pending: int | None = None
+    password_hash_scheme: str | None = None
+    password_bcrypt_rounds: int | None = None
+    password_argon2_time_cost: int | None = None
+    password_argon2_memory_cost: int | None = None
+    password_argon2_parallelism: int | None = None
+
+    rate_limit_enabled: bool | None = None
+    rate_limit_window_seconds: float | None = None
+    rate_limit_auth_requests: int | None = None
+    rate_limit_user_requests: int | None = None
+    rate_limit_store_url: str | None = None
+
     jwt_secret: str | None = None
     jwt_token_expiration_seconds: int | None = None
     jwt_refresh_token_expiration_seconds: int | None = None
@@ -58,15 +111,124 @@ class Config:
             self.environment = Environment(Environments(_get_value_from_env_key("ENVIRONMENT")))
 
         self.db_engine = self.db_engine or _get_value_from_env_key("DB_ENGINE")
+        if self.db_engine.split("+")[0] not in SUPPORTED_DB_DIALECTS:
+            raise ValueError(
+                f"DB_ENGINE {self.db_engine} is not supported, use one of: {', '.join(SUPPORTED_DB_DIALECTS)}"
+            )
+        self.db_async_engine = self.db_async_engine or _get_optional_value_from_env_key(
+            "DB_ASYNC_ENGINE", ASYNC_DB_ENGINES.get(self.db_engine, self.db_engine)
+        )
         self.db_host = self.db_host or _get_value_from_env_key("DB_HOST")
         self.db_port = self.db_port or int(_get_value_from_env_key("DB_PORT"))
         self.db_user = self.db_user or _get_value_from_env_key("DB_USER")
         self.db_password = self.db_password or _get_value_from_env_key("DB_PASSWORD")
         self.db_name = self.db_name or _get_value_from_env_key("DB_NAME")
 
+        self.db_pool_size = self.db_pool_size or int(_get_optional_value_from_env_key("DB_POOL_SIZE", "10"))
+        self.db_pool_max_overflow = (
+            self.db_pool_max_overflow
+            if self.db_pool_max_overflow is not None
+            else int(_get_optional_value_from_env_key("DB_POOL_MAX_OVERFLOW", "20"))
+        )
+        self.db_pool_timeout_seconds = self.db_pool_timeout_seconds or int(
+            _get_optional_value_from_env_key("DB_POOL_TIMEOUT_SECONDS", "30")
+        )
+        self.db_pool_recycle_seconds = self.db_pool_recycle_seconds or int(
+            _get_optional_value_from_env_key("DB_POOL_RECYCLE_SECONDS", "1800")
+        )
+        if self.db_pool_pre_ping is None:
+            self.db_pool_pre_ping = _str_to_bool(_get_optional_value_from_env_key("DB_POOL_PRE_PING", "true"))
+
+        self.db_slow_query_threshold_ms = (
+            self.db_slow_query_threshold_ms
+            if self.db_slow_query_threshold_ms is not None
+            else int(_get_optional_value_from_env_key("DB_SLOW_QUERY_THRESHOLD_MS", "500"))
+        )
+        if self.db_slow_query_explain is None:
+            self.db_slow_query_explain = _str_to_bool(
+                _get_optional_value_from_env_key("DB_SLOW_QUERY_EXPLAIN", "false")
+            )
+        self.db_slow_query_log_size = self.db_slow_query_log_size or int(
+            _get_optional_value_from_env_key("DB_SLOW_QUERY_LOG_SIZE", "50")
+        )
+
+        if self.db_replica_urls is None:
+            replica_urls = _get_optional_value_from_env_key("DB_REPLICA_URLS", "")
+            self.db_replica_urls = [url.strip() for url in replica_urls.split(",") if url.strip()]
+        self.db_read_your_writes_seconds = (
+            self.db_read_your_writes_seconds
+            if self.db_read_your_writes_seconds is not None
+            else float(_get_optional_value_from_env_key("DB_READ_YOUR_WRITES_SECONDS", "5"))
+        )
+
+        if self.todos_archive_enabled is None:
+            # off by default: only the listings (include_archived) read the archived todos, the rest of the API
+            # (by id, edits, deletes, export and stats) no longer sees them
+            self.todos_archive_enabled = _str_to_bool(
+                _get_optional_value_from_env_key("TODOS_ARCHIVE_ENABLED", "false")
+            )
+        self.todos_archive_after_days = self.todos_archive_after_days or int(
+            _get_optional_value_from_env_key("TODOS_ARCHIVE_AFTER_DAYS", "30")
+        )
+        self.todos_archive_batch_size = self.todos_archive_batch_size or int(
+            _get_optional_value_from_env_key("TODOS_ARCHIVE_BATCH_SIZE", "500")
+        )
+        self.todos_archive_batch_pause_seconds = (
+            self.todos_archive_batch_pause_seconds
+            if self.todos_archive_batch_pause_seconds is not None
+            else float(_get_optional_value_from_env_key("TODOS_ARCHIVE_BATCH_PAUSE_SECONDS", "0.5"))
+        )
+        self.todos_archive_interval_seconds = self.todos_archive_interval_seconds or float(
+            _get_optional_value_from_env_key("TODOS_ARCHIVE_INTERVAL_SECONDS", "300")
+        )
+
         self.admin_user_email = self.admin_user_email or _get_value_from_env_key("ADMIN_USER_EMAIL")
         self.admin_user_password = self.admin_user_password or _get_value_from_env_key("ADMIN_USER_PASSWORD")
 
+        self.password_hashing_workers = (
+            self.password_hashing_workers
+            if self.password_hashing_workers is not None
+            else int(_get_optional_value_from_env_key("PASSWORD_HASHING_WORKERS", "2"))
+        )
+        self.password_hashing_max_pending = (
+            self.password_hashing_max_pending
+            if self.password_hashing_max_pending is not None
+            else int(_get_optional_value_from_env_key("PASSWORD_HASHING_MAX_PENDING", "16"))
+        )
+        self.password_hash_scheme = self.password_hash_scheme or _get_optional_value_from_env_key(
+            "PASSWORD_HASH_SCHEME", "bcrypt"
+        )
+        self.password_bcrypt_rounds = self.password_bcrypt_rounds or int(
+            _get_optional_value_from_env_key("PASSWORD_BCRYPT_ROUNDS", "12")
+        )
+        self.password_argon2_time_cost = self.password_argon2_time_cost or int(
+            _get_optional_value_from_env_key("PASSWORD_ARGON2_TIME_COST", "2")
+        )
+        self.password_argon2_memory_cost = self.password_argon2_memory_cost or int(
+            _get_optional_value_from_env_key("PASSWORD_ARGON2_MEMORY_COST", "19456")
+        )
+        self.password_argon2_parallelism = self.password_argon2_parallelism or int(
+            _get_optional_value_from_env_key("PASSWORD_ARGON2_PARALLELISM", "1")
+        )
+
+        if self.rate_limit_enabled is None:
+            self.rate_limit_enabled = _str_to_bool(_get_optional_value_from_env_key("RATE_LIMIT_ENABLED", "true"))
+        self.rate_limit_window_seconds = self.rate_limit_window_seconds or float(
+            _get_optional_value_from_env_key("RATE_LIMIT_WINDOW_SECONDS", "60")
+        )
+        self.rate_limit_auth_requests = (
+            self.rate_limit_auth_requests
+            if self.rate_limit_auth_requests is not None
+            else int(_get_optional_value_from_env_key("RATE_LIMIT_AUTH_REQUESTS", "10"))
+        )
+        self.rate_limit_user_requests = (
+            self.rate_limit_user_requests
+            if self.rate_limit_user_requests is not None
+            else int(_get_optional_value_from_env_key("RATE_LIMIT_USER_REQUESTS", "300"))
+        )
+        if self.rate_limit_store_url is None:
+            self.rate_limit_store_url = _get_optional_value_from_env_key("RATE_LIMIT_STORE_URL", "")
+
         self.jwt_secret = self.jwt_secret or _get_value_from_env_key("JWT_SECRET")
         self.jwt_token_expiration_seconds = self.jwt_token_expiration_seconds or int(
             _get_value_from_env_key("JWT_TOKEN_EXPIRATION_SECONDS")
@@ -74,3 +236,6 @@ class Config:
         self.jwt_refresh_token_expiration_seconds = self.jwt_refresh_token_expiration_seconds or int(
             _get_value_from_env_key("JWT_REFRESH_TOKEN_EXPIRATION_SECONDS")
         )
+
+    def is_sqlite(self) -> bool:
+        return self.db_engine.startswith("sqlite")
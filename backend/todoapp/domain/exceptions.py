@@ -16,3 +16,18 @@ class ConflictError(MessageError):
 
 class UnauthorizedError(MessageError):
     pass
+
+
+class BadRequestError(MessageError):
+    pass
+
+
+class ServiceUnavailableError(MessageError):
+    """The request was shed because the server is overloaded; it can be retried later."""
+
+
+@attrs.define
+class TooManyRequestsError(MessageError):
+    """The client went over its rate limit; it can retry after retry_after_seconds."""
+
+    retry_after_seconds: int = 1
@@ -1,6 +1,8 @@
 from abc import ABC
 from enum import IntEnum
-from typing import TypeVar
+from typing import Any, TypeVar
+
+import attrs
 
 T = TypeVar("T")
 
@@ -8,13 +10,50 @@ T = TypeVar("T")
 class BaseModel(ABC):
     id: T
 
+    def track_changes(self) -> "BaseModel":
+        """Start (or restart) recording which fields change, ex: right after loading the model from a repository."""
+        self._changed_fields = set()
+        return self
+
+    def changed_fields(self) -> set[str] | None:
+        """Fields changed since track_changes, or None when the model is not tracked (every field counts as changed)."""
+        changed_fields = getattr(self, "_changed_fields", None)
+        return set(changed_fields) if changed_fields is not None else None
+
+
+def record_change(instance: BaseModel, attribute: attrs.Attribute, value: Any) -> Any:
+    """on_setattr hook of the domain models: remembers the fields assigned a different value while tracked."""
+    changed_fields = getattr(instance, "_changed_fields", None)
+    if changed_fields is not None and getattr(instance, attribute.name) != value:
+        changed_fields.add(attribute.name)
+    return value
+
+
+TRACK_CHANGES = attrs.setters.pipe(attrs.setters.convert, attrs.setters.validate, record_change)
+
 
 class FiltersBase:
     def get_predicate(self):
         raise NotImplementedError("Extension predicate should be added in adapters/extensions/filters")
 
+    def get_ranking(self):
+        """Expression ranking the matching rows (the higher the better) when no order is requested, if any."""
+        return None
+
+    def is_empty(self) -> bool:
+        """Whether no filter is set, so the filters match every row."""
+        return all(getattr(self, field.name) is None for field in attrs.fields(type(self)))
+
 
 class SortDirection(IntEnum):
     NONE = 0
     ASC = 1
     DESC = 2
+
+
+@attrs.define
+class KeysetCursor:
+    """Position right after the last row of a page: its sort value plus its id as tiebreaker."""
+
+    last_id: str
+    last_value: Any = None
@@ -2,10 +2,10 @@ import uuid
 
 import attrs
 
-from todoapp.domain.models.base_model import BaseModel
+from todoapp.domain.models.base_model import TRACK_CHANGES, BaseModel
 
 
-@attrs.define
+@attrs.define(on_setattr=TRACK_CHANGES)
 class Todo(BaseModel):
     title: str
     description: str
@@ -3,7 +3,7 @@ from enum import Enum
 
 import attrs
 
-from todoapp.domain.models.base_model import BaseModel
+from todoapp.domain.models.base_model import TRACK_CHANGES, BaseModel
 
 
 class UserRole(Enum):
@@ -11,7 +11,7 @@ class UserRole(Enum):
     ADMIN = 1
 
 
-@attrs.define
+@attrs.define(on_setattr=TRACK_CHANGES)
 class User(BaseModel):
     id: str
     username: str
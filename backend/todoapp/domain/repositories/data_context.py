@@ -1,14 +1,19 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
 import attrs
 
-from todoapp.adapters.database.database import DatabaseConnector
-from todoapp.adapters.database.repositories.todos_repository import TodosRepository
-from todoapp.adapters.database.repositories.users_repository import UsersRepository
-from todoapp.domain.repositories.todos_repository import AbstractTodosRepository
-from todoapp.domain.repositories.users_repository import AbstractUsersRepository
+from todoapp.adapters.database.database import AsyncDatabaseConnector, DatabaseConnector
+from todoapp.adapters.database.repositories.todos_repository import AsyncTodosRepository, TodosRepository
+from todoapp.adapters.database.repositories.users_repository import AsyncUsersRepository, UsersRepository
+from todoapp.domain.repositories.todos_repository import AbstractAsyncTodosRepository, AbstractTodosRepository
+from todoapp.domain.repositories.users_repository import AbstractAsyncUsersRepository, AbstractUsersRepository
 
 
 @attrs.define
 class DataContext:
+    """Repositories the service commands write through, each command in its own unit of work."""
+
     database_connector: DatabaseConnector = attrs.field(init=True)
     todos_repo: AbstractTodosRepository = attrs.field(init=False)
     users_repo: AbstractUsersRepository = attrs.field(init=False)
@@ -16,3 +21,30 @@ class DataContext:
     def __attrs_post_init__(self):
         self.todos_repo = TodosRepository(database_connector=self.database_connector)
         self.users_repo = UsersRepository(database_connector=self.database_connector)
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["DataContext"]:
+        """Every repository call inside runs on the same session and is committed once, at the end."""
+        with self.database_connector.unit_of_work():
+            yield self
+
+    def after_commit(self, callback: Callable[[], None]):
+        """Run the callback once the writes so far are committed (ex: to invalidate what caches them)."""
+        self.database_connector.after_commit(callback)
+
+
+@attrs.define
+class AsyncDataContext:
+    """Repositories the service queries read through.
+
+    The query modules import it only when type checking: the database extensions import their filters, and this
+    module imports the database extensions (through the repositories).
+    """
+
+    database_connector: AsyncDatabaseConnector = attrs.field(init=True)
+    todos_repo: AbstractAsyncTodosRepository = attrs.field(init=False)
+    users_repo: AbstractAsyncUsersRepository = attrs.field(init=False)
+
+    def __attrs_post_init__(self):
+        self.todos_repo = AsyncTodosRepository(database_connector=self.database_connector)
+        self.users_repo = AsyncUsersRepository(database_connector=self.database_connector)
@@ -1,8 +1,9 @@
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import TypeVar
 
-from todoapp.domain.models.base_model import FiltersBase, SortDirection
+from todoapp.domain.models.base_model import FiltersBase, KeysetCursor, SortDirection
 
 T = TypeVar("T")
 K = TypeVar("K", int, str, uuid.UUID)
@@ -22,6 +23,7 @@ class AbstractRepository(ABC):
         order_by: str | None = None,
         offset: int | None = None,
         limit: int | None = None,
+        after: KeysetCursor | None = None,
     ) -> list[T]:
         pass
 
@@ -32,3 +34,68 @@ class AbstractRepository(ABC):
         filters: FiltersBase | None = None,
     ) -> int:
         pass
+
+    @abstractmethod
+    def get_page(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+    ) -> tuple[list[T], int | None]:
+        """Retrieve a page and, unless include_total is False, the total of items matching the filters."""
+
+
+class AbstractAsyncRepository(ABC):
+    @abstractmethod
+    async def get_by_id(self, id: K) -> T:  # noqa: A002
+        pass
+
+    @abstractmethod
+    async def get(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+    ) -> list[T]:
+        pass
+
+    @abstractmethod
+    async def count(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+    ) -> tuple[list[T], int | None]:
+        """Retrieve a page and, unless include_total is False, the total of items matching the filters."""
+
+    @abstractmethod
+    def stream(
+        self,
+        join_types: list[T] | None = None,
+        filters: FiltersBase | None = None,
+    ) -> AsyncIterator[T]:
+        """Iterate over every item matching the filters without loading them all in memory."""
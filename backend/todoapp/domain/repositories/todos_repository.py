@@ -1,7 +1,9 @@
 from abc import abstractmethod
+from datetime import datetime
 
+from todoapp.domain.models.base_model import FiltersBase, KeysetCursor, SortDirection
 from todoapp.domain.models.todo import Todo
-from todoapp.domain.repositories.repository_base import AbstractRepository
+from todoapp.domain.repositories.repository_base import AbstractAsyncRepository, AbstractRepository
 
 
 class AbstractTodosRepository(AbstractRepository):
@@ -14,3 +16,57 @@ class AbstractTodosRepository(AbstractRepository):
     def get_by_title(self, title: str) -> Todo:
         """Retrieve todo by title."""
         raise NotImplementedError
+
+    @abstractmethod
+    def get_by_titles(self, titles: list[str]) -> list[Todo]:
+        """Retrieve the todos matching any of the titles in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_by_priority_and_completed(self, owner_id: str) -> dict[tuple[int, bool], int]:
+        """Number of todos of the owner per (priority, completed), in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def archive_completed(self, completed_before: datetime, limit: int) -> dict[str, int]:
+        """Move up to limit todos completed before the (naive UTC) time to the archive, returning how many per owner."""
+        raise NotImplementedError
+
+
+class AbstractAsyncTodosRepository(AbstractAsyncRepository):
+    @abstractmethod
+    async def get_by_owner_id(self, owner_id: int) -> Todo:
+        """Retrieve todo by owner ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_title(self, title: str) -> Todo:
+        """Retrieve todo by title."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_titles(self, titles: list[str]) -> list[Todo]:
+        """Retrieve the todos matching any of the titles in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_by_priority_and_completed(self, owner_id: str) -> dict[tuple[int, bool], int]:
+        """Number of todos of the owner per (priority, completed), in a single query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(
+        self,
+        join_types: list | None = None,
+        filters: FiltersBase | None = None,
+        order: SortDirection = SortDirection.NONE,
+        order_by: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        after: KeysetCursor | None = None,
+        *,
+        include_total: bool = True,
+        include_archived: bool = False,
+    ) -> tuple[list[Todo], int | None]:
+        """A page of todos, also reading the archived ones when include_archived (without joins)."""
+        raise NotImplementedError
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 
 from todoapp.domain.models.user import User
-from todoapp.domain.repositories.repository_base import AbstractRepository
+from todoapp.domain.repositories.repository_base import AbstractAsyncRepository, AbstractRepository
 
 
 class AbstractUsersRepository(AbstractRepository):
@@ -9,3 +9,10 @@ class AbstractUsersRepository(AbstractRepository):
     def get_by_email(self, email: str) -> User:
         """Retrieve user by email."""
         raise NotImplementedError
+
+
+class AbstractAsyncUsersRepository(AbstractAsyncRepository):
+    @abstractmethod
+    async def get_by_email(self, email: str) -> User:
+        """Retrieve user by email."""
+        raise NotImplementedError
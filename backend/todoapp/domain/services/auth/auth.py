@@ -1,7 +1,6 @@
 from datetime import timedelta
 
 import attrs
-from passlib.context import CryptContext
 
 from todoapp.config import Config
 from todoapp.domain.commons.date_utils import get_utc_now
@@ -9,14 +8,9 @@ from todoapp.domain.exceptions import UnauthorizedError
 from todoapp.domain.models.user import User, UserInfo
 from todoapp.domain.repositories.data_context import DataContext
 from todoapp.domain.services.auth.auth_dtos import AuthTokenResultDTO, LoginDTO
+from todoapp.domain.services.auth.password_hasher import password_hasher
 from todoapp.domain.services.auth.token import AbstractToken
 
-# Configuración de Passlib
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-)
-
 
 @attrs.define
 class Auth:
@@ -29,9 +23,15 @@ class Auth:
         if user is None:
             raise UnauthorizedError("Invalid credentials. Please check your username and password.")
 
-        if not Auth.check_password(plain_password=login_data.password, hashed_password=user.password):
+        valid, updated_hash = password_hasher.verify_and_update(login_data.password, user.password)
+        if not valid:
             raise UnauthorizedError("Invalid credentials. Please check your username and password.")
 
+        if updated_hash is not None:
+            # hashed with a former scheme or cost: stored again with the current policy while the password is known
+            user.password = updated_hash
+            self.data_context.users_repo.update(user)
+
         user_info = UserInfo(user_id=user.id, email=user.email, roles=[user.role])
         return self._get_login_result(user_info)
 
@@ -59,9 +59,9 @@ class Auth:
 
     @classmethod
     def create_hashed_password(cls, password: str) -> tuple[str, str]:
-        hashed_password = pwd_context.hash(password)
+        hashed_password = password_hasher.hash(password)
         return hashed_password
 
     @classmethod
     def check_password(cls, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        return password_hasher.verify(plain_password, hashed_password)
@@ -0,0 +1,142 @@
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import attrs
+from passlib.context import CryptContext
+
+from todoapp.domain.exceptions import ServiceUnavailableError
+
+PASSWORD_HASH_SCHEMES = ("bcrypt", "argon2")
+
+
+@attrs.define(frozen=True)
+class PasswordHashPolicy:
+    """Scheme and cost of the new password hashes; hashes made with any other are outdated."""
+
+    scheme: str = attrs.field(default="bcrypt", validator=attrs.validators.in_(PASSWORD_HASH_SCHEMES))
+    bcrypt_rounds: int = 12  # log2 of the iterations
+    argon2_time_cost: int = 2
+    argon2_memory_cost: int = 19456  # KiB
+    argon2_parallelism: int = 1
+
+    def crypt_context(self) -> CryptContext:
+        # Configuración de Passlib
+        # every known scheme verifies, only the chosen one hashes; each cost is pinned (min = max) so
+        # hashes made with a higher or a lower one both need an update
+        return CryptContext(
+            schemes=[self.scheme, *(scheme for scheme in PASSWORD_HASH_SCHEMES if scheme != self.scheme)],
+            default=self.scheme,
+            deprecated="auto",
+            bcrypt__default_rounds=self.bcrypt_rounds,
+            bcrypt__min_rounds=self.bcrypt_rounds,
+            bcrypt__max_rounds=self.bcrypt_rounds,
+            argon2__default_rounds=self.argon2_time_cost,
+            argon2__min_rounds=self.argon2_time_cost,
+            argon2__max_rounds=self.argon2_time_cost,
+            argon2__memory_cost=self.argon2_memory_cost,
+            argon2__parallelism=self.argon2_parallelism,
+        )
+
+
+@functools.cache
+def _crypt_context(policy: PasswordHashPolicy) -> CryptContext:
+    # built once per process (the app and each pool worker) and policy
+    return policy.crypt_context()
+
+
+def _hash(policy: PasswordHashPolicy, password: str) -> str:
+    return _crypt_context(policy).hash(password)
+
+
+def _verify(policy: PasswordHashPolicy, plain_password: str, hashed_password: str) -> bool:
+    return _crypt_context(policy).verify(plain_password, hashed_password)
+
+
+def _verify_and_update(
+    policy: PasswordHashPolicy, plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return _crypt_context(policy).verify_and_update(plain_password, hashed_password)
+
+
+@attrs.define
+class PasswordHasherSettings:
+    workers: int = 2  # 0 hashes in the calling thread
+    max_pending: int = 16  # hashes waiting for a worker; any further one is shed
+    policy: PasswordHashPolicy = attrs.field(factory=PasswordHashPolicy)
+
+
+class PasswordHasher:
+    """Runs the (deliberately slow) password hashing on a bounded process pool instead of the request threads.
+
+    At most workers + max_pending hashes are in flight, the rest fail right away with ServiceUnavailableError,
+    so a login burst holds a bounded number of request threads and leaves the other requests their own.
+    """
+
+    def __init__(self, settings: PasswordHasherSettings | None = None):
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self.settings: PasswordHasherSettings | None = None
+        self.configure(settings or PasswordHasherSettings())
+
+    def configure(self, settings: PasswordHasherSettings):
+        # the running workers are kept when nothing changes (ex: every app built by the tests)
+        if settings == self.settings:
+            return
+
+        self.shutdown()
+        self.settings = settings
+        self._slots = threading.BoundedSemaphore(max(settings.workers + settings.max_pending, 1))
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(_verify, plain_password, hashed_password)
+
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Whether the password matches and, when the hash is outdated (see needs_update), its new hash."""
+        return self._run(_verify_and_update, plain_password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        # parses the hash settings only, no hashing: cheap enough for the calling thread
+        return _crypt_context(self.settings.policy).needs_update(hashed_password)
+
+    def _run(self, function, *args):
+        if not self._slots.acquire(blocking=False):
+            raise ServiceUnavailableError("Too many password checks in progress, please retry later.")
+
+        try:
+            if not self.settings.workers:
+                return function(self.settings.policy, *args)
+
+            try:
+                return self._get_pool().submit(function, self.settings.policy, *args).result()
+            except BrokenProcessPool:
+                # a worker died (ex: killed by the OOM killer): the next call starts a new pool
+                self.shutdown()
+                raise
+        finally:
+            self._slots.release()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawned, not forked: forking a process running threads may copy locks held by other threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.settings.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def shutdown(self, *, wait: bool = False):
+        """Stop the workers (the next hash starts new ones); wait joins them, once their current hash is done."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+password_hasher = PasswordHasher()
@@ -1,8 +1,12 @@
 import abc
+import hashlib
+import hmac
 from datetime import datetime
 
 import attrs
-from jose import jwt
+from jose import JWTError, jwt
+
+from todoapp.domain.services.auth.verified_tokens_cache import VerifiedTokensCache, verified_tokens_cache
 
 
 class AbstractToken(abc.ABC):
@@ -18,11 +22,16 @@ class AbstractToken(abc.ABC):
     def get_token_data(self, token: str) -> dict:
         pass
 
+    def verify_token(self, token: str) -> dict | None:
+        """The data of the token if it is valid, else None."""
+        return self.get_token_data(token) if self.is_valid_token(token) else None
+
 
 @attrs.define
 class JWTToken(AbstractToken):
     secret: str
     ending_algorithm: str = "HS256"
+    cache: VerifiedTokensCache = attrs.field(default=verified_tokens_cache, eq=False, repr=False)
 
     def create_token(self, expiration_date: datetime, data: dict) -> str:
         jwt_data = {"exp": expiration_date, **data}
@@ -42,3 +51,20 @@ class JWTToken(AbstractToken):
 
     def get_token_data(self, token: str) -> dict:
         return jwt.decode(token, self.secret, algorithms=[self.ending_algorithm])
+
+    def verify_token(self, token: str) -> dict | None:
+        # keyed by the secret too, so tokens signed with a former secret are never served from the cache
+        digest = hmac.new(self.secret.encode(), token.encode(), hashlib.sha256).digest()
+        claims = self.cache.get(digest)
+        if claims is not None:
+            return dict(claims)
+
+        try:
+            claims = jwt.decode(token, self.secret, algorithms=[self.ending_algorithm])
+        except JWTError:
+            return None
+
+        # tokens without exp never expire, so they are decoded every time
+        if isinstance(claims.get("exp"), int | float):
+            self.cache.set(digest, claims, expires_at=claims["exp"])
+        return dict(claims)
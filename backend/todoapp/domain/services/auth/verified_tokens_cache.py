@@ -0,0 +1,45 @@
+import threading
+import time
+
+
+class VerifiedTokensCache:
+    """Claims of the tokens already verified, keyed by a digest of the token and dropped when the token expires.
+
+    Only valid tokens are stored, so garbage tokens can not evict the entries of the active users.
+    """
+
+    # least recently used entries are dropped past this many tokens
+    MAX_ENTRIES = 10000
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: dict[bytes, tuple[float, dict]] = {}
+
+    def get(self, digest: bytes) -> dict | None:
+        with self._lock:
+            entry = self._entries.pop(digest, None)
+            if entry is None:
+                return None
+
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                return None
+
+            self._entries[digest] = entry
+            return claims
+
+    def set(self, digest: bytes, claims: dict, expires_at: float):
+        """Store the claims until expires_at (epoch seconds, the exp claim)."""
+        with self._lock:
+            self._entries.pop(digest, None)
+            self._entries[digest] = (expires_at, claims)
+            if len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+verified_tokens_cache = VerifiedTokensCache()
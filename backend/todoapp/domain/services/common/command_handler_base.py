@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import ClassVar, TypeVar
 
 import attrs
 
-from todoapp.domain.models.base_model import SortDirection
+from todoapp.domain.exceptions import BadRequestError
+from todoapp.domain.models.base_model import BaseModel, KeysetCursor, SortDirection
+from todoapp.domain.services.common.pagination_cursor import decode_cursor, encode_cursor
 
 T = TypeVar("T")
 
@@ -15,14 +17,36 @@ class CommandBase:
 
 @attrs.define
 class PaginationQueryBase(CommandBase):
+    # the fields a listing can be sorted by (the cursors carry the sort value, ex: a password hash otherwise)
+    SORTABLE_FIELDS: ClassVar[frozenset[str]] = frozenset()
+
     order: SortDirection = SortDirection.NONE
     order_by: str | None = None
     page: int = attrs.field(default=1, validator=[attrs.validators.ge(1)])
     items: int = attrs.field(default=100, validator=[attrs.validators.ge(1), attrs.validators.le(100)])
+    cursor: str | None = None
+    include_total: bool = True
+
+    def __attrs_post_init__(self):
+        if self.order_by is not None and self.order_by not in self.SORTABLE_FIELDS:
+            raise BadRequestError(
+                f"Cannot sort by '{self.order_by}', only by: {', '.join(sorted(self.SORTABLE_FIELDS))}"
+            )
 
     @property
     def offset(self):
-        return (self.page - 1) * self.items
+        # cursor (keyset) pagination seeks to the position instead of skipping rows
+        return 0 if self.cursor else (self.page - 1) * self.items
+
+    @property
+    def after(self) -> KeysetCursor | None:
+        return decode_cursor(self.cursor, self.order, self.order_by) if self.cursor else None
+
+    def next_cursor(self, page_models: list[BaseModel]) -> str | None:
+        if len(page_models) < self.items:
+            return None
+
+        return encode_cursor(page_models[-1], self.order, self.order_by)
 
 
 @attrs.define
@@ -30,3 +54,10 @@ class CommandHandlerBase(ABC):
     @abstractmethod
     def handle(self, command: CommandBase) -> T:
         pass
+
+
+@attrs.define
+class AsyncCommandHandlerBase(ABC):
+    @abstractmethod
+    async def handle(self, command: CommandBase) -> T:
+        pass
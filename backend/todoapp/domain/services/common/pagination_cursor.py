@@ -0,0 +1,73 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import secrets
+from enum import Enum
+
+from todoapp.domain.exceptions import BadRequestError
+from todoapp.domain.models.base_model import BaseModel, KeysetCursor, SortDirection
+
+
+class CursorSigner:
+    """HMAC of the cursors, so a client can only resume from a position a previous page gave it."""
+
+    def __init__(self):
+        # a key of this process only, until configure gives the one shared by every worker
+        self._key = secrets.token_bytes(32)
+
+    def configure(self, secret: str):
+        # derived, so a cursor signature never doubles as a signature of anything else made with the secret
+        self._key = hashlib.sha256(b"pagination-cursor:" + secret.encode()).digest()
+
+    def sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._key, payload, hashlib.sha256).digest()
+
+    def verify(self, payload: bytes, signature: bytes) -> bool:
+        return hmac.compare_digest(self.sign(payload), signature)
+
+
+cursor_signer = CursorSigner()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode()
+
+
+def encode_cursor(model: BaseModel, order: SortDirection, order_by: str | None) -> str:
+    last_value = getattr(model, order_by, None) if order_by else None
+    if isinstance(last_value, Enum):
+        last_value = last_value.value
+
+    payload = json.dumps(
+        {"id": str(model.id), "value": last_value, "order": int(order), "order_by": order_by}, separators=(",", ":")
+    ).encode()
+    return f"{_b64encode(payload)}.{_b64encode(cursor_signer.sign(payload))}"
+
+
+def decode_cursor(cursor: str, order: SortDirection, order_by: str | None) -> KeysetCursor:
+    try:
+        encoded_payload, encoded_signature = cursor.split(".")
+        raw_payload = base64.urlsafe_b64decode(encoded_payload.encode())
+        signature = base64.urlsafe_b64decode(encoded_signature.encode())
+    except (binascii.Error, ValueError) as e:
+        raise BadRequestError("Invalid pagination cursor") from e
+
+    if not cursor_signer.verify(raw_payload, signature):
+        raise BadRequestError("Invalid pagination cursor")
+
+    try:
+        payload = json.loads(raw_payload)
+        last_id = str(payload["id"])
+        last_value = payload["value"]
+        cursor_order = SortDirection(payload["order"])
+        cursor_order_by = payload["order_by"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise BadRequestError("Invalid pagination cursor") from e
+
+    # a cursor is only meaningful for the sorting that produced it
+    if cursor_order != order or cursor_order_by != order_by:
+        raise BadRequestError("Pagination cursor does not match the requested order")
+
+    return KeysetCursor(last_id=last_id, last_value=last_value)
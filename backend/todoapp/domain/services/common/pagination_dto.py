@@ -8,6 +8,7 @@ T = TypeVar("T")
 @attrs.define
 class PaginationDTO:
     page: int
-    total_items: int
+    total_items: int | None
     page_items: int
     items: list[T]
+    next_cursor: str | None = None
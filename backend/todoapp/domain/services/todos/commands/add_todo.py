@@ -6,6 +6,7 @@ from todoapp.domain.exceptions import ConflictError
 from todoapp.domain.models.todo import Todo
 from todoapp.domain.repositories.data_context import DataContext
 from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.services.todos.todo_stats_cache import invalidate_todo_stats
 from todoapp.domain.services.todos.todos_dtos import TodoDTO
 
 
@@ -36,5 +37,6 @@ class AddTodoCommandHandler(CommandHandlerBase):
         )
 
         todo = self.data_context.todos_repo.add(entity=todo)
+        invalidate_todo_stats(self.data_context, todo.owner_id)
 
         return TodoDTO.from_model(todo)
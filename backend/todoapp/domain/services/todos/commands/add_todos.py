@@ -0,0 +1,71 @@
+import time
+import uuid
+
+import attrs
+
+from todoapp.domain.models.todo import Todo
+from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.services.todos.commands.add_todo import AddTodoCommand
+from todoapp.domain.services.todos.todo_stats_cache import invalidate_todo_stats
+from todoapp.domain.services.todos.todos_dtos import AddTodosDTO, AddTodosFailureDTO, TodoDTO
+
+MAX_BULK_TODOS = 1000
+
+
+@attrs.define
+class AddTodosCommand(CommandBase):
+    todos: list[AddTodoCommand] = attrs.field(
+        validator=[attrs.validators.min_len(1), attrs.validators.max_len(MAX_BULK_TODOS)]
+    )
+    owner_id: uuid.UUID = attrs.field(init=False)
+
+
+@attrs.define
+class AddTodosCommandHandler(CommandHandlerBase):
+    data_context: DataContext
+
+    def handle(self, command: AddTodosCommand) -> AddTodosDTO:
+        start = time.perf_counter()
+
+        # title conflicts of the whole batch are checked with a single query
+        titles = {add_todo_command.title for add_todo_command in command.todos}
+        taken_titles = {todo.title for todo in self.data_context.todos_repo.get_by_titles(titles=list(titles))}
+
+        todos: list[Todo] = []
+        failed: list[AddTodosFailureDTO] = []
+        for index, add_todo_command in enumerate(command.todos):
+            if add_todo_command.title in taken_titles:
+                failed.append(
+                    AddTodosFailureDTO(
+                        index=index,
+                        title=add_todo_command.title,
+                        message=f"Todo with title '{add_todo_command.title}' already exists",
+                    )
+                )
+                continue
+
+            # repeated titles inside the batch: the first one wins
+            taken_titles.add(add_todo_command.title)
+            todos.append(
+                Todo(
+                    id=str(uuid.uuid4()),
+                    title=add_todo_command.title,
+                    description=add_todo_command.description,
+                    priority=add_todo_command.priority,
+                    completed=False,
+                    owner_id=str(command.owner_id),
+                )
+            )
+
+        todos = self.data_context.todos_repo.add_many(entities=todos)
+        if todos:
+            invalidate_todo_stats(self.data_context, str(command.owner_id))
+
+        elapsed_seconds = time.perf_counter() - start
+        return AddTodosDTO(
+            created=[TodoDTO.from_model(todo) for todo in todos],
+            failed=failed,
+            elapsed_seconds=elapsed_seconds,
+            rows_per_second=len(todos) / elapsed_seconds if elapsed_seconds else 0.0,
+        )
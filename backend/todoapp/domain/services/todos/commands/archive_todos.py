@@ -0,0 +1,30 @@
+from datetime import datetime
+
+import attrs
+
+from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.services.todos.todo_stats_cache import invalidate_todo_stats
+from todoapp.domain.services.todos.todos_dtos import TodosAffectedDTO
+
+# small batches keep each transaction (and the replication of its writes) short
+ARCHIVE_BATCH_SIZE = 500
+
+
+@attrs.define
+class ArchiveTodosCommand(CommandBase):
+    completed_before: datetime  # naive UTC
+    batch_size: int = attrs.field(default=ARCHIVE_BATCH_SIZE, validator=attrs.validators.gt(0))
+
+
+@attrs.define
+class ArchiveTodosCommandHandler(CommandHandlerBase):
+    """Moves one batch of the todos completed before the given time to the archive."""
+
+    data_context: DataContext
+
+    def handle(self, command: ArchiveTodosCommand) -> TodosAffectedDTO:
+        archived = self.data_context.todos_repo.archive_completed(command.completed_before, command.batch_size)
+        for owner_id in archived:
+            invalidate_todo_stats(self.data_context, owner_id)
+        return TodosAffectedDTO(affected=sum(archived.values()))
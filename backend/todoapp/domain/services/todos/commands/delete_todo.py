@@ -2,14 +2,17 @@ import uuid
 
 import attrs
 
-from todoapp.domain.models.todo import Todo
+from todoapp.domain.exceptions import NotFoundError
 from todoapp.domain.repositories.data_context import DataContext
 from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+from todoapp.domain.services.todos.todo_stats_cache import invalidate_todo_stats
 
 
 @attrs.define
 class DeleteTodoCommand(CommandBase):
     id: uuid.UUID
+    owner_id: uuid.UUID | None = attrs.field(init=False, default=None)  # None deletes the todo of any owner
 
 
 @attrs.define
@@ -17,8 +20,13 @@ class DeleteTodoCommandHandler(CommandHandlerBase):
     data_context: DataContext
 
     def handle(self, command: DeleteTodoCommand):
-        todo: Todo = self.data_context.todos_repo.get_by_id(id=str(command.id))
-        if not todo:
-            return
-
-        self.data_context.todos_repo.delete(todo)
+        # the owner check is part of the DELETE itself: another owner's todo is reported as missing
+        deleted = self.data_context.todos_repo.delete_one(
+            id=str(command.id),
+            filters=GetTodosQueryFilters(owner_id=str(command.owner_id)) if command.owner_id is not None else None,
+        )
+        if not deleted:
+            raise NotFoundError(f"Todo with id '{command.id}' does not exists")
+
+        # the owner of a todo deleted by an admin is not known
+        invalidate_todo_stats(self.data_context, str(command.owner_id) if command.owner_id is not None else None)
@@ -0,0 +1,44 @@
+import uuid
+
+import attrs
+
+from todoapp.domain.exceptions import BadRequestError
+from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.services.todos.commands.add_todos import MAX_BULK_TODOS
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+from todoapp.domain.services.todos.todo_stats_cache import invalidate_todo_stats
+from todoapp.domain.services.todos.todos_dtos import TodosAffectedDTO
+
+
+@attrs.define
+class DeleteTodosCommand(CommandBase):
+    ids: list[uuid.UUID] | None = attrs.field(
+        default=None, validator=attrs.validators.optional(attrs.validators.max_len(MAX_BULK_TODOS))
+    )
+    filters: GetTodosQueryFilters | None = attrs.field(default=None)
+    owner_id: uuid.UUID | None = attrs.field(init=False, default=None)  # None deletes the todos of every owner
+
+
+@attrs.define
+class DeleteTodosCommandHandler(CommandHandlerBase):
+    data_context: DataContext
+
+    def handle(self, command: DeleteTodosCommand) -> TodosAffectedDTO:
+        if command.ids is None and (command.filters is None or command.filters.is_empty()):
+            # empty filters would match (and delete) every todo, of every owner for the admins
+            raise BadRequestError("Either ids or filters must be provided")
+        if command.ids is not None and not command.ids:
+            raise BadRequestError("ids must not be empty")
+
+        filters = command.filters or GetTodosQueryFilters()
+        if command.owner_id is not None:
+            filters = attrs.evolve(filters, owner_id=str(command.owner_id))
+
+        affected = self.data_context.todos_repo.delete_many(
+            ids=[str(todo_id) for todo_id in command.ids] if command.ids is not None else None,
+            filters=filters,
+        )
+        if affected:
+            invalidate_todo_stats(self.data_context, filters.owner_id)
+        return TodosAffectedDTO(affected=affected)
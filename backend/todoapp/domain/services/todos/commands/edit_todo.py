@@ -2,19 +2,27 @@ import uuid
 
 import attrs
 
-from todoapp.domain.exceptions import NotFoundError
+from todoapp.domain.exceptions import BadRequestError, NotFoundError
 from todoapp.domain.models.todo import Todo
 from todoapp.domain.repositories.data_context import DataContext
 from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+from todoapp.domain.services.todos.todo_stats_cache import invalidate_todo_stats
 from todoapp.domain.services.todos.todos_dtos import TodoDTO
 
 
 @attrs.define
 class EditTodoCommand(CommandBase):
     id: uuid.UUID = attrs.field(init=False)
-    description: str = attrs.field(validator=[attrs.validators.min_len(3)])
-    priority: int = attrs.field(validator=[attrs.validators.gt(0), attrs.validators.le(10)])
-    completed: bool = attrs.field()
+    # None leaves the field as it is, so the same command serves full (PUT) and partial (PATCH) edits
+    description: str | None = attrs.field(
+        default=None, validator=attrs.validators.optional([attrs.validators.min_len(3)])
+    )
+    priority: int | None = attrs.field(
+        default=None, validator=attrs.validators.optional([attrs.validators.gt(0), attrs.validators.le(10)])
+    )
+    completed: bool | None = attrs.field(default=None)
+    owner_id: uuid.UUID | None = attrs.field(init=False, default=None)  # None edits the todo of any owner
 
 
 @attrs.define
@@ -22,16 +30,26 @@ class EditTodoCommandHandler(CommandHandlerBase):
     data_context: DataContext
 
     def handle(self, command: EditTodoCommand) -> TodoDTO:
-        todo: Todo = self.data_context.todos_repo.get_by_id(id=str(command.id))
+        values = {
+            field: value
+            for field, value in (
+                ("description", command.description),
+                ("priority", command.priority),
+                ("completed", command.completed),
+            )
+            if value is not None
+        }
+        if not values:
+            raise BadRequestError("At least one of description, priority or completed must be provided")
+
+        # the owner check is part of the UPDATE itself: another owner's todo is reported as missing
+        todo: Todo | None = self.data_context.todos_repo.update_one(
+            id=str(command.id),
+            values=values,
+            filters=GetTodosQueryFilters(owner_id=str(command.owner_id)) if command.owner_id is not None else None,
+        )
         if not todo:
             raise NotFoundError(f"Todo with id '{command.id}' does not exists")
 
-        if command.description is not None:
-            todo.description = command.description
-        if command.priority is not None:
-            todo.priority = command.priority
-        if command.completed is not None:
-            todo.completed = command.completed
-
-        todo = self.data_context.todos_repo.update(entity=todo)
+        invalidate_todo_stats(self.data_context, todo.owner_id)
         return TodoDTO.from_model(todo)
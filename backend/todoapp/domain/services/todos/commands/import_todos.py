@@ -0,0 +1,139 @@
+import logging
+import time
+import uuid
+from collections.abc import Iterable
+
+import attrs
+
+from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.services.todos.commands.add_todo import AddTodoCommand
+from todoapp.domain.services.todos.commands.add_todos import MAX_BULK_TODOS, AddTodosCommand, AddTodosCommandHandler
+from todoapp.domain.services.todos.todos_dtos import ImportTodosDTO, ImportTodosErrorDTO
+
+logger = logging.getLogger(__name__)
+
+# todos inserted per transaction
+IMPORT_CHUNK_SIZE = 500
+# fields read from each record, as in AddTodoCommand
+IMPORT_FIELDS = ("title", "description", "priority")
+# longest text accepted per field, as the todos columns
+IMPORT_MAX_LENGTHS = {"title": 255, "description": 1024}
+# errors kept for the response (the rest are only counted), so it does not grow with the file
+MAX_IMPORT_ERRORS = 1000
+
+
+@attrs.define
+class ImportTodoRecord:
+    """A parsed line of the upload: its fields, or the reason it could not be parsed."""
+
+    line: int
+    fields: dict | None = None
+    error: str | None = None
+    stops_import: bool = False  # the upload is unreadable from this line on (ex: invalid UTF-8)
+
+
+@attrs.define
+class ImportTodosCommand(CommandBase):
+    records: Iterable[ImportTodoRecord]
+    owner_id: uuid.UUID = attrs.field(init=False)
+    chunk_size: int = attrs.field(
+        default=IMPORT_CHUNK_SIZE, validator=[attrs.validators.ge(1), attrs.validators.le(MAX_BULK_TODOS)]
+    )
+
+
+@attrs.define
+class ImportTodosCommandHandler(CommandHandlerBase):
+    """Validates each record as an AddTodoCommand and inserts them chunk by chunk, one transaction per chunk."""
+
+    data_context: DataContext
+    _imported: int = attrs.field(init=False, default=0)
+    _failed: int = attrs.field(init=False, default=0)
+    _errors: list[ImportTodosErrorDTO] = attrs.field(init=False, factory=list)
+
+    def handle(self, command: ImportTodosCommand) -> ImportTodosDTO:
+        start = time.perf_counter()
+        lines = 0
+        chunk: list[tuple[int, AddTodoCommand]] = []
+
+        for record in command.records:
+            lines += 1
+            add_todo_command = self._validate(record, command.owner_id)
+            if record.stops_import:
+                # the todos before it are still imported, and the response tells how many
+                break
+            if add_todo_command is None:
+                continue
+
+            chunk.append((record.line, add_todo_command))
+            if len(chunk) == command.chunk_size:
+                self._add_chunk(chunk, command.owner_id)
+                chunk = []
+
+        if chunk:
+            self._add_chunk(chunk, command.owner_id)
+
+        elapsed_seconds = time.perf_counter() - start
+        return ImportTodosDTO(
+            lines=lines,
+            imported=self._imported,
+            failed=self._failed,
+            errors=self._errors,
+            elapsed_seconds=elapsed_seconds,
+            rows_per_second=self._imported / elapsed_seconds if elapsed_seconds else 0.0,
+        )
+
+    def _validate(self, record: ImportTodoRecord, owner_id: uuid.UUID) -> AddTodoCommand | None:
+        if record.error is not None:
+            self._fail(record.line, record.error)
+            return None
+
+        missing_fields = [field for field in IMPORT_FIELDS if record.fields.get(field) in (None, "")]
+        if missing_fields:
+            self._fail(record.line, f"Missing fields: {', '.join(missing_fields)}")
+            return None
+
+        # NDJSON values keep their JSON type (CSV ones are all strings): anything but text would only fail on insert
+        invalid_fields = [
+            field
+            for field, max_length in IMPORT_MAX_LENGTHS.items()
+            if not isinstance(record.fields[field], str) or len(record.fields[field]) > max_length
+        ]
+        priority = record.fields["priority"]
+        # bool is an int, and int() would truncate a float
+        if isinstance(priority, bool) or not isinstance(priority, int | str):
+            invalid_fields.append("priority")
+        if invalid_fields:
+            self._fail(record.line, f"Invalid fields: {', '.join(invalid_fields)}")
+            return None
+
+        try:
+            add_todo_command = AddTodoCommand(
+                title=record.fields["title"],
+                description=record.fields["description"],
+                priority=int(priority),
+            )
+        except (TypeError, ValueError) as e:
+            self._fail(record.line, f"Invalid todo: {e}")
+            return None
+
+        add_todo_command.owner_id = owner_id
+        return add_todo_command
+
+    def _add_chunk(self, chunk: list[tuple[int, AddTodoCommand]], owner_id: uuid.UUID):
+        add_todos_command = AddTodosCommand(todos=[add_todo_command for _, add_todo_command in chunk])
+        add_todos_command.owner_id = owner_id
+
+        with self.data_context.unit_of_work():
+            add_todos = AddTodosCommandHandler(data_context=self.data_context).handle(command=add_todos_command)
+
+        self._imported += len(add_todos.created)
+        for failure in add_todos.failed:
+            self._fail(chunk[failure.index][0], failure.message)
+
+        logger.info("Imported %d todos (%d failed) up to line %d", self._imported, self._failed, chunk[-1][0])
+
+    def _fail(self, line: int, message: str):
+        self._failed += 1
+        if len(self._errors) < MAX_IMPORT_ERRORS:
+            self._errors.append(ImportTodosErrorDTO(line=line, message=message))
@@ -0,0 +1,22 @@
+from collections.abc import AsyncIterator
+
+import attrs
+
+from todoapp.domain.repositories.data_context import AsyncDataContext
+from todoapp.domain.services.common.command_handler_base import AsyncCommandHandlerBase, CommandBase
+from todoapp.domain.services.todos.queries.get_todos import GetTodosQueryFilters
+from todoapp.domain.services.todos.todos_dtos import TodoDTO
+
+
+@attrs.define
+class ExportTodosQuery(CommandBase):
+    filters: GetTodosQueryFilters | None = attrs.field(default=None)
+
+
+@attrs.define
+class ExportTodosQueryHandler(AsyncCommandHandlerBase):
+    data_context: AsyncDataContext
+
+    async def handle(self, command: ExportTodosQuery) -> AsyncIterator[TodoDTO]:
+        async for todo in self.data_context.todos_repo.stream(filters=command.filters):
+            yield TodoDTO.from_model(todo)
@@ -3,8 +3,8 @@ import uuid
 import attrs
 
 from todoapp.domain.exceptions import NotFoundError
-from todoapp.domain.repositories.data_context import DataContext
-from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.repositories.data_context import AsyncDataContext
+from todoapp.domain.services.common.command_handler_base import AsyncCommandHandlerBase, CommandBase
 from todoapp.domain.services.todos.todos_dtos import TodoDTO
 
 
@@ -14,11 +14,11 @@ class GetTodoQuery(CommandBase):
 
 
 @attrs.define
-class GetTodoQueryHandler(CommandHandlerBase):
-    data_context: DataContext
+class GetTodoQueryHandler(AsyncCommandHandlerBase):
+    data_context: AsyncDataContext
 
-    def handle(self, command: GetTodoQuery) -> TodoDTO:
-        todo = self.data_context.todos_repo.get_by_id(id=str(command.id))
+    async def handle(self, command: GetTodoQuery) -> TodoDTO:
+        todo = await self.data_context.todos_repo.get_by_id(id=str(command.id))
 
         if not todo:
             raise NotFoundError(f"Todo with id '{command.id}' does not exists")
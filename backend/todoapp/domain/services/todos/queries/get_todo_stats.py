@@ -0,0 +1,45 @@
+import uuid
+
+import attrs
+
+from todoapp.domain.repositories.data_context import AsyncDataContext
+from todoapp.domain.services.common.command_handler_base import AsyncCommandHandlerBase, CommandBase
+from todoapp.domain.services.todos.todo_stats_cache import TodoStatsCache, todo_stats_cache
+from todoapp.domain.services.todos.todos_dtos import TodoPriorityStatsDTO, TodoStatsDTO
+
+
+@attrs.define
+class GetTodoStatsQuery(CommandBase):
+    owner_id: uuid.UUID
+
+
+@attrs.define
+class GetTodoStatsQueryHandler(AsyncCommandHandlerBase):
+    data_context: AsyncDataContext
+    cache: TodoStatsCache = attrs.field(default=todo_stats_cache)
+
+    async def handle(self, command: GetTodoStatsQuery) -> TodoStatsDTO:
+        owner_id = str(command.owner_id)
+        stats = self.cache.get(owner_id)
+        if stats is not None:
+            return stats
+
+        generation = self.cache.generation
+        totals = await self.data_context.todos_repo.count_by_priority_and_completed(owner_id=owner_id)
+
+        priorities = [
+            TodoPriorityStatsDTO(
+                priority=priority,
+                completed=totals.get((priority, True), 0),
+                pending=totals.get((priority, False), 0),
+            )
+            for priority in sorted({priority for priority, _ in totals})
+        ]
+        completed = sum(priority_stats.completed for priority_stats in priorities)
+        pending = sum(priority_stats.pending for priority_stats in priorities)
+        stats = TodoStatsDTO(
+            owner_id=owner_id, total=completed + pending, completed=completed, pending=pending, priorities=priorities
+        )
+
+        self.cache.set(owner_id, stats, generation)
+        return stats
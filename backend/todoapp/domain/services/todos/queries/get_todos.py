@@ -1,41 +1,59 @@
+from typing import TYPE_CHECKING
+
 import attrs
 
-from todoapp.domain.models.base_model import FiltersBase
-from todoapp.domain.repositories.data_context import DataContext
-from todoapp.domain.services.common.command_handler_base import CommandHandlerBase, PaginationQueryBase
+from todoapp.domain.models.base_model import BaseModel, FiltersBase
+from todoapp.domain.services.common.command_handler_base import AsyncCommandHandlerBase, PaginationQueryBase
 from todoapp.domain.services.common.pagination_dto import PaginationDTO
 from todoapp.domain.services.todos.todos_dtos import TodoDTO
 
+if TYPE_CHECKING:
+    from todoapp.domain.repositories.data_context import AsyncDataContext
+
 
 @attrs.define
 class GetTodosQueryFilters(FiltersBase):
     priority: int | None = None
     owner_id: str | None = None
+    q: str | None = None  # full-text search over title and description
 
 
 @attrs.define
 class GetTodosQuery(PaginationQueryBase):
+    SORTABLE_FIELDS = frozenset({"title", "priority", "completed"})
+
     filters: GetTodosQueryFilters | None = attrs.field(default=None)
+    include_archived: bool = False  # also list the todos moved to the archive (slower: reads both tables)
+
+    def next_cursor(self, page_models: list[BaseModel]) -> str | None:
+        # pages ranked by relevance have no sort value to seek from
+        if self.filters is not None and self.filters.q is not None and not (self.order and self.order_by):
+            return None
+
+        return super().next_cursor(page_models)
 
 
 @attrs.define
-class GetTodosQueryHandler(CommandHandlerBase):
-    data_context: DataContext
+class GetTodosQueryHandler(AsyncCommandHandlerBase):
+    data_context: "AsyncDataContext"
 
-    def handle(self, command: GetTodosQuery) -> PaginationDTO:
-        todos = self.data_context.todos_repo.get(
+    async def handle(self, command: GetTodosQuery) -> PaginationDTO:
+        todos, total_items = await self.data_context.todos_repo.get_page(
             filters=command.filters,
             order=command.order,
             order_by=command.order_by,
             offset=command.offset,
             limit=command.items,
+            after=command.after,
+            include_total=command.include_total,
+            include_archived=command.include_archived,
         )
 
-        total_items = self.data_context.todos_repo.count(filters=command.filters)
         todos_dto = [TodoDTO.from_model(todo) for todo in todos]
         return PaginationDTO(
             page=command.page,
             page_items=len(todos_dto),
             total_items=total_items,
             items=todos_dto,
+            next_cursor=command.next_cursor(todos),
         )
@@ -0,0 +1,71 @@
+import threading
+import time
+
+from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.services.todos.todos_dtos import TodoStatsDTO
+
+# Each process has its own cache and only sees its own writes, so the entries also expire
+TODO_STATS_CACHE_SECONDS = 30.0
+
+
+class TodoStatsCache:
+    """Todo stats per owner, invalidated by the todo command handlers once their writes are committed."""
+
+    # least recently stored entries are dropped past this many owners
+    MAX_ENTRIES = 10000
+
+    def __init__(self, ttl_seconds: float = TODO_STATS_CACHE_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, TodoStatsDTO]] = {}
+        # bumped on every invalidation, so stats computed before it are never stored after it
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, owner_id: str) -> TodoStatsDTO | None:
+        with self._lock:
+            entry = self._entries.get(owner_id)
+            if entry is None:
+                return None
+
+            expires_at, stats = entry
+            if expires_at <= time.monotonic():
+                del self._entries[owner_id]
+                return None
+
+            return stats
+
+    def set(self, owner_id: str, stats: TodoStatsDTO, generation: int):
+        """Store stats computed when the cache was at this generation, unless it was invalidated since."""
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._entries.pop(owner_id, None)
+            self._entries[owner_id] = (time.monotonic() + self.ttl_seconds, stats)
+            if len(self._entries) > self.MAX_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, owner_id: str | None = None):
+        """Drop the stats of the owner, or of every owner when it is not known (ex: bulk writes by filters)."""
+        with self._lock:
+            self._generation += 1
+            if owner_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(owner_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+todo_stats_cache = TodoStatsCache()
+
+
+def invalidate_todo_stats(data_context: DataContext, owner_id: str | None = None):
+    """Drop the cached stats of the owner (every owner when None) once the handler writes are committed."""
+    data_context.after_commit(lambda: todo_stats_cache.invalidate(owner_id))
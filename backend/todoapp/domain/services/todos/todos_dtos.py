@@ -13,3 +13,55 @@ class TodoDTO(BaseDTO):
     priority: int
     owner_id: int
     completed: bool = attrs.field(default=False)
+
+
+@attrs.define
+class AddTodosFailureDTO(BaseDTO):
+    index: int
+    title: str
+    message: str
+
+
+@attrs.define
+class AddTodosDTO(BaseDTO):
+    created: list[TodoDTO]
+    failed: list[AddTodosFailureDTO]
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+@attrs.define
+class ImportTodosErrorDTO(BaseDTO):
+    line: int
+    message: str
+
+
+@attrs.define
+class ImportTodosDTO(BaseDTO):
+    lines: int
+    imported: int
+    failed: int
+    errors: list[ImportTodosErrorDTO]
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+@attrs.define
+class TodosAffectedDTO(BaseDTO):
+    affected: int
+
+
+@attrs.define
+class TodoPriorityStatsDTO(BaseDTO):
+    priority: int
+    completed: int
+    pending: int
+
+
+@attrs.define
+class TodoStatsDTO(BaseDTO):
+    owner_id: str
+    total: int
+    completed: int
+    pending: int
+    priorities: list[TodoPriorityStatsDTO]
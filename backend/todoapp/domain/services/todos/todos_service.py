@@ -1,30 +1,75 @@
+from collections.abc import AsyncIterator
+
 import attrs
 
-from todoapp.domain.repositories.data_context import DataContext
+from todoapp.domain.repositories.data_context import AsyncDataContext, DataContext
 from todoapp.domain.services.common.pagination_dto import PaginationDTO
 from todoapp.domain.services.todos.commands.add_todo import AddTodoCommand, AddTodoCommandHandler
+from todoapp.domain.services.todos.commands.add_todos import AddTodosCommand, AddTodosCommandHandler
+from todoapp.domain.services.todos.commands.archive_todos import ArchiveTodosCommand, ArchiveTodosCommandHandler
 from todoapp.domain.services.todos.commands.delete_todo import DeleteTodoCommand, DeleteTodoCommandHandler
+from todoapp.domain.services.todos.commands.delete_todos import DeleteTodosCommand, DeleteTodosCommandHandler
 from todoapp.domain.services.todos.commands.edit_todo import EditTodoCommand, EditTodoCommandHandler
+from todoapp.domain.services.todos.commands.edit_todos import EditTodosCommand, EditTodosCommandHandler
+from todoapp.domain.services.todos.commands.import_todos import ImportTodosCommand, ImportTodosCommandHandler
+from todoapp.domain.services.todos.queries.export_todos import ExportTodosQuery, ExportTodosQueryHandler
 from todoapp.domain.services.todos.queries.get_todo import GetTodoQuery, GetTodoQueryHandler
+from todoapp.domain.services.todos.queries.get_todo_stats import GetTodoStatsQuery, GetTodoStatsQueryHandler
 from todoapp.domain.services.todos.queries.get_todos import GetTodosQuery, GetTodosQueryHandler
-from todoapp.domain.services.todos.todos_dtos import TodoDTO
+from todoapp.domain.services.todos.todos_dtos import (
+    AddTodosDTO,
+    ImportTodosDTO,
+    TodoDTO,
+    TodoStatsDTO,
+    TodosAffectedDTO,
+)
 
 
 @attrs.define
 class TodosService:
     data_context: DataContext
+    async_data_context: AsyncDataContext
 
     def add_todo(self, add_todo_command: AddTodoCommand) -> TodoDTO:
-        return AddTodoCommandHandler(data_context=self.data_context).handle(command=add_todo_command)
+        with self.data_context.unit_of_work():
+            return AddTodoCommandHandler(data_context=self.data_context).handle(command=add_todo_command)
+
+    def add_todos(self, add_todos_command: AddTodosCommand) -> AddTodosDTO:
+        with self.data_context.unit_of_work():
+            return AddTodosCommandHandler(data_context=self.data_context).handle(command=add_todos_command)
+
+    def import_todos(self, import_todos_command: ImportTodosCommand) -> ImportTodosDTO:
+        # no unit of work around the whole import: each chunk commits on its own
+        return ImportTodosCommandHandler(data_context=self.data_context).handle(command=import_todos_command)
 
     def edit_todo(self, edit_todo_command: EditTodoCommand) -> TodoDTO:
-        return EditTodoCommandHandler(data_context=self.data_context).handle(command=edit_todo_command)
+        with self.data_context.unit_of_work():
+            return EditTodoCommandHandler(data_context=self.data_context).handle(command=edit_todo_command)
+
+    def edit_todos(self, edit_todos_command: EditTodosCommand) -> TodosAffectedDTO:
+        with self.data_context.unit_of_work():
+            return EditTodosCommandHandler(data_context=self.data_context).handle(command=edit_todos_command)
 
     def delete_todo(self, delete_todo_command: DeleteTodoCommand):
-        DeleteTodoCommandHandler(data_context=self.data_context).handle(command=delete_todo_command)
+        with self.data_context.unit_of_work():
+            DeleteTodoCommandHandler(data_context=self.data_context).handle(command=delete_todo_command)
+
+    def delete_todos(self, delete_todos_command: DeleteTodosCommand) -> TodosAffectedDTO:
+        with self.data_context.unit_of_work():
+            return DeleteTodosCommandHandler(data_context=self.data_context).handle(command=delete_todos_command)
+
+    def archive_todos(self, archive_todos_command: ArchiveTodosCommand) -> TodosAffectedDTO:
+        with self.data_context.unit_of_work():
+            return ArchiveTodosCommandHandler(data_context=self.data_context).handle(command=archive_todos_command)
+
+    async def get_todo(self, get_todo_query: GetTodoQuery) -> TodoDTO:
+        return await GetTodoQueryHandler(data_context=self.async_data_context).handle(command=get_todo_query)
+
+    async def get_todos(self, get_todos_query: GetTodosQuery) -> PaginationDTO:
+        return await GetTodosQueryHandler(data_context=self.async_data_context).handle(command=get_todos_query)
 
-    def get_todo(self, get_todo_query: GetTodoQuery) -> TodoDTO:
-        return GetTodoQueryHandler(data_context=self.data_context).handle(command=get_todo_query)
+    async def get_todo_stats(self, get_todo_stats_query: GetTodoStatsQuery) -> TodoStatsDTO:
+        return await GetTodoStatsQueryHandler(data_context=self.async_data_context).handle(command=get_todo_stats_query)
 
-    def get_todos(self, get_todos_query: GetTodosQuery) -> PaginationDTO:
-        return GetTodosQueryHandler(data_context=self.data_context).handle(command=get_todos_query)
+    def export_todos(self, export_todos_query: ExportTodosQuery) -> AsyncIterator[TodoDTO]:
+        return ExportTodosQueryHandler(data_context=self.async_data_context).handle(command=export_todos_query)
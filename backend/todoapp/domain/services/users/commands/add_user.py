@@ -24,12 +24,13 @@ class AddUserCommandHandler(CommandHandlerBase):
     data_context: DataContext
 
     def handle(self, command: AddUserCommand) -> UserDTO:
+        # hashed before any repository call, so the unit of work holds no connection while hashing
+        password = Auth.create_hashed_password(command.password)
+
         user = self.data_context.users_repo.get_by_email(command.email)
         if user:
             raise ConflictError(f"User with email '{command.email}' already exists")
 
-        password = Auth.create_hashed_password(command.password)
-
         user = User(
             id=str(uuid.uuid4()),
             username=command.username,
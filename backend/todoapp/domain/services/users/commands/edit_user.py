@@ -33,12 +33,15 @@ class EditUserCommandHandler(CommandHandlerBase):
     data_context: DataContext
 
     def handle(self, command: EditUserCommand) -> UserDTO:
+        # hashed before any repository call, so the unit of work holds no connection while hashing
+        password = Auth.create_hashed_password(command.password) if command.password else None
+
         user: User = self.data_context.users_repo.get_by_id(str(command.id))
         if not user:
             raise NotFoundError(f"User with email '{command.email}' does not exists")
 
-        if command.password:
-            user.password = Auth.create_hashed_password(command.password)
+        if password:
+            user.password = password
 
         if command.email:
             user.email = command.email
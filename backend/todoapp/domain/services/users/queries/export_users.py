@@ -0,0 +1,22 @@
+from collections.abc import AsyncIterator
+
+import attrs
+
+from todoapp.domain.repositories.data_context import AsyncDataContext
+from todoapp.domain.services.common.command_handler_base import AsyncCommandHandlerBase, CommandBase
+from todoapp.domain.services.users.queries.get_users import GetUsersQueryFilters
+from todoapp.domain.services.users.users_dtos import UserDTO
+
+
+@attrs.define
+class ExportUsersQuery(CommandBase):
+    filters: GetUsersQueryFilters | None = attrs.field(default=None)
+
+
+@attrs.define
+class ExportUsersQueryHandler(AsyncCommandHandlerBase):
+    data_context: AsyncDataContext
+
+    async def handle(self, command: ExportUsersQuery) -> AsyncIterator[UserDTO]:
+        async for user in self.data_context.users_repo.stream(filters=command.filters):
+            yield UserDTO.from_model(user)
@@ -3,8 +3,8 @@ import uuid
 import attrs
 
 from todoapp.domain.exceptions import NotFoundError
-from todoapp.domain.repositories.data_context import DataContext
-from todoapp.domain.services.common.command_handler_base import CommandBase, CommandHandlerBase
+from todoapp.domain.repositories.data_context import AsyncDataContext
+from todoapp.domain.services.common.command_handler_base import AsyncCommandHandlerBase, CommandBase
 from todoapp.domain.services.users.users_dtos import UserDTO
 
 
@@ -14,11 +14,11 @@ class GetUserQuery(CommandBase):
 
 
 @attrs.define
-class GetUserQueryHandler(CommandHandlerBase):
-    data_context: DataContext
+class GetUserQueryHandler(AsyncCommandHandlerBase):
+    data_context: AsyncDataContext
 
-    def handle(self, command: GetUserQuery) -> UserDTO:
-        user = self.data_context.users_repo.get_by_id(str(command.id))
+    async def handle(self, command: GetUserQuery) -> UserDTO:
+        user = await self.data_context.users_repo.get_by_id(str(command.id))
         if not user:
             raise NotFoundError(f"User with id '{command.id}' does not exists")
 
@@ -1,12 +1,16 @@
+from typing import TYPE_CHECKING
+
 import attrs
 
 from todoapp.domain.models.base_model import FiltersBase
 from todoapp.domain.models.user import UserRole
-from todoapp.domain.repositories.data_context import DataContext
-from todoapp.domain.services.common.command_handler_base import CommandHandlerBase, PaginationQueryBase
+from todoapp.domain.services.common.command_handler_base import AsyncCommandHandlerBase, PaginationQueryBase
 from todoapp.domain.services.common.pagination_dto import PaginationDTO
 from todoapp.domain.services.users.users_dtos import UserDTO
 
+if TYPE_CHECKING:
+    from todoapp.domain.repositories.data_context import AsyncDataContext
+
 
 @attrs.define
 class GetUsersQueryFilters(FiltersBase):
@@ -17,22 +21,31 @@ class GetUsersQueryFilters(FiltersBase):
 
 @attrs.define
 class GetUsersQuery(PaginationQueryBase):
+    SORTABLE_FIELDS = frozenset({"username", "email", "role"})
+
     filters: GetUsersQueryFilters | None = attrs.field(default=None)
 
 
 @attrs.define
-class GetUsersQueryHandler(CommandHandlerBase):
-    data_context: DataContext
+class GetUsersQueryHandler(AsyncCommandHandlerBase):
+    data_context: "AsyncDataContext"
 
-    def handle(self, command: GetUsersQuery) -> PaginationDTO:
-        users = self.data_context.users_repo.get(
+    async def handle(self, command: GetUsersQuery) -> PaginationDTO:
+        users, total_items = await self.data_context.users_repo.get_page(
             filters=command.filters,
             order=command.order,
             order_by=command.order_by,
             offset=command.offset,
             limit=command.items,
+            after=command.after,
+            include_total=command.include_total,
         )
-        total_items = self.data_context.users_repo.count(filters=command.filters)
 
         users_dto = [UserDTO.from_model(user) for user in users]
-        return PaginationDTO(page=command.page, page_items=len(users_dto), total_items=total_items, items=users_dto)
+        return PaginationDTO(
+            page=command.page,
+            page_items=len(users_dto),
+            total_items=total_items,
+            items=users_dto,
+            next_cursor=command.next_cursor(users),
+        )